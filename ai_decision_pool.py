@@ -0,0 +1,323 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import asyncio
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError
+
+from property import Property
+from player import Player
+from ai_player import AIPlayer
+from market_index import MarketIndex
+from board_version import BoardVersion
+from game_snapshot import GameSnapshot
+from game_state import BoardTracker
+from output_sink import NullSink
+
+
+# The boards a worker has built, kept per thread so that a decision that ran out of time can never touch the board of the next one
+WORKER_STATE = threading.local()
+
+# The number of boards a worker keeps, a server with many tables sends decisions of many boards to the same workers
+WORKER_BOARD_CACHE_SIZE = 64
+
+
+def board_layout(property_locations: dict, players: list) -> tuple:
+    """
+    Returns what a worker needs to build its own copy of a board: the tiles, where they are, which seats are AI players and the colour groups in the order of their colour ids.
+    Chance tiles share one Property between many locations, so tiles are listed once and every location names its tile.
+    The colour groups are taken from the market index the AI players share, so the AI players of the worker rank colour groups the same way as the game.
+
+    Arguments:
+    - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+    - players: A list of the players in seat order
+
+    Returns:
+    - A tuple of (tiles, cells, ai_seats, colours), tiles is a list of (name, cost, hotel cost, rent, colour, location), cells is a list of (location, tile index) in board order, ai_seats is a tuple of booleans and colours is a list of the colour groups, None if no AI player has a market index
+    """
+    tile_ids = dict()
+    tiles = []
+    cells = []
+    for location, property in property_locations.items():
+        if property not in tile_ids:
+            tile_ids[property] = len(tiles)
+            tiles.append((property.get_property_name(), property.get_property_cost(), property.get_hotel_cost(), property.get_rent_price(), property.get_colour_group(), property.get_location()))
+        cells.append((location, tile_ids[property]))
+
+    colours = None
+    for player in players:
+        if isinstance(player, AIPlayer) and player.get_market_index() is not None:
+            colours = list(player.get_market_index().get_colours())
+            break
+    return (tiles, cells, tuple(isinstance(player, AIPlayer) for player in players), colours)
+
+
+def build_worker_board(layout: tuple) -> tuple:
+    """
+    Builds a worker's own copy of a board from its layout, with a player for every seat, a market index and board version for its AI players and a BoardTracker to write GameStates into it.
+
+    Arguments:
+    - layout: A tuple made by board_layout
+
+    Returns:
+    - A tuple of (property_locations, players, tracker)
+    """
+    tiles, cells, ai_seats, colours = layout
+    properties = []
+    for name, cost, hotel_cost, rent, colour, location in tiles:
+        property = Property(name, cost, hotel_cost, rent, colour)
+        property.set_location(location)
+        properties.append(property)
+    property_locations = {location: properties[tile_id] for location, tile_id in cells}
+
+    market_index = MarketIndex(property_locations, colours)
+    board_version = BoardVersion(property_locations)
+    players = []
+    for is_ai in ai_seats:
+        player = AIPlayer() if is_ai else Player()
+        player.set_output(NullSink())
+        if is_ai:
+            player.set_market_index(market_index)
+            player.set_board_version(board_version)
+        players.append(player)
+    return (property_locations, players, BoardTracker(property_locations))
+
+
+def worker_board(layout_key: str, layout_data: bytes) -> tuple:
+    """
+    Returns the worker's own copy of a board, building it the first time the worker sees its layout and forgetting the board used longest ago when there are too many.
+
+    Arguments:
+    - layout_key: A string that names the layout
+    - layout_data: The pickled layout, only unpickled the first time the worker sees the layout
+
+    Returns:
+    - A tuple of (property_locations, players, tracker)
+    """
+    boards = getattr(WORKER_STATE, "boards", None)
+    if boards is None:
+        boards = WORKER_STATE.boards = OrderedDict()
+
+    if layout_key in boards:
+        boards.move_to_end(layout_key)
+    else:
+        boards[layout_key] = build_worker_board(pickle.loads(layout_data))
+        if len(boards) > WORKER_BOARD_CACHE_SIZE:
+            boards.popitem(last=False)
+    return boards[layout_key]
+
+
+def decide_in_worker(layout_key: str, layout_data: bytes, snapshot: bytes, seat: int, possible_moves: list, winning_condition: int) -> tuple:
+    """
+    Works out the move of an AIPlayer on the worker's own copy of the board, this is the function every worker runs.
+    The board is built once per layout and brought up to date with the snapshot of the game for every decision.
+
+    Arguments:
+    - layout_key: A string that names the layout
+    - layout_data: The pickled layout, only unpickled the first time the worker sees the layout
+    - snapshot: A GameSnapshot of the game, without the random number generator
+    - seat: An integer of the seat of the AIPlayer
+    - possible_moves: A list of the valid moves of the AIPlayer
+    - winning_condition: An integer of the number of properties needed to win
+
+    Returns:
+    - A tuple of (move, target, previous_moves, first_run), move is None if the target cannot be reached
+    """
+    property_locations, players, _ = worker_board(layout_key, layout_data)
+
+    GameSnapshot.restore(snapshot, property_locations, players)
+
+    # The worker board is shared by every table with the same layout, so the winning condition is handed to the AIPlayer and never set on the class
+    ai_player = players[seat]
+    ai_player.set_winning_condition(winning_condition)
+    move = ai_player.plan_move(possible_moves, property_locations)
+    return (move, ai_player.target, list(ai_player.previous_moves), ai_player.first_run)
+
+
+class AIDecisionPool:
+    """
+    A class that works out the moves of AIPlayers in a pool of threads or processes, with a time budget for every decision.
+    When a decision is not back in time, the AIPlayer takes a quick_move instead, so a turn never waits on the AI longer than the budget, however big the board is.
+
+    A worker never touches the game itself: it is sent a GameSnapshot of the game and plays the decision out on its own copy of the board, and only the move, target, previous moves and whether the first move is done it comes back with are given to the AIPlayer.
+    A decision that runs out of time is simply thrown away when it finishes, so it cannot get in the way of the game carrying on.
+    Threads share the interpreter lock with the game, so a decision that is still running late slows the game down until it finishes, processes keep the turn close to the budget however slow the decisions get.
+
+    Attributes:
+    - deadline: A float of the number of seconds a decision may take, None to always wait for it
+    - use_processes: A boolean of whether the workers are processes instead of threads
+    - executor: The ThreadPoolExecutor or ProcessPoolExecutor of the workers
+    - layouts: An OrderedDict whose key is the id of a board and whose value is (property_locations, players, layout key, pickled layout) of the boards seen lately
+    - layouts_made: An integer of the number of layouts made, used to name them
+    - decisions: An integer of the number of decisions asked for
+    - timeouts: An integer of the number of decisions that ran out of time
+
+    Behaviours:
+    - layout_for: Returns the name and pickled layout of a board.
+    - submit: Sends a decision to the workers.
+    - take_plan: Gives the AIPlayer the plan a worker came back with.
+    - decide: Works out the move of an AIPlayer within the time budget.
+    - decide_async: Works out the move of an AIPlayer within the time budget without blocking the event loop.
+    - close: Shuts the workers down.
+    """
+
+    def __init__(self, deadline: float = 0.1, max_workers: int = None, use_processes: bool = False) -> None:
+        """
+        Constructor method for AIDecisionPool class.
+
+        Arguments:
+        - deadline: A float of the number of seconds a decision may take, None to always wait for it
+        - max_workers: An integer of the number of workers, picked by the executor when None
+        - use_processes: A boolean, if true the decisions run in processes and can use every core, else in threads which start faster
+
+        Returns:
+        - none
+        """
+        self.deadline = deadline
+        self.use_processes = use_processes
+        if use_processes:
+            self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.layouts = OrderedDict()
+        self.layouts_made = 0
+        self.decisions = 0
+        self.timeouts = 0
+
+    def layout_for(self, property_locations: dict, players: list) -> tuple:
+        """
+        Returns the name and pickled layout of a board, it is only worked out once per board and roster.
+
+        Arguments:
+        - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+        - players: A list of the players in seat order
+
+        Returns:
+        - A tuple of (layout key, pickled layout)
+        """
+        board_id = id(property_locations)
+        entry = self.layouts.get(board_id)
+
+        # The board and the roster must be the very same ones, the entry keeps them alive so their ids cannot be reused
+        if entry is None or entry[0] is not property_locations or len(entry[1]) != len(players):
+            self.layouts_made += 1
+            layout_key = "{}-{}".format(id(self), self.layouts_made)
+            entry = (property_locations, list(players), layout_key, pickle.dumps(board_layout(property_locations, players)))
+            self.layouts[board_id] = entry
+            if len(self.layouts) > WORKER_BOARD_CACHE_SIZE:
+                self.layouts.popitem(last=False)
+        else:
+            self.layouts.move_to_end(board_id)
+        return (entry[2], entry[3])
+
+    def submit(self, ai_player: AIPlayer, possible_moves: list, property_locations: dict, players: list) -> tuple:
+        """
+        Sends a decision to the workers, with a GameSnapshot of the game as it is now.
+
+        Arguments:
+        - ai_player: The AIPlayer whose turn it is, it must be one of players
+        - possible_moves: A list of the valid moves of the AIPlayer
+        - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+        - players: A list of the players in seat order
+
+        Returns:
+        - A tuple of (future, timeout), timeout is the number of seconds left of the budget after the snapshot was taken, None to always wait
+        """
+        started = time.perf_counter()
+        self.decisions += 1
+
+        layout_key, layout_data = self.layout_for(property_locations, players)
+        snapshot = GameSnapshot.save(property_locations, players)
+        future = self.executor.submit(decide_in_worker, layout_key, layout_data, snapshot, players.index(ai_player), list(possible_moves), ai_player.get_winning_condition())
+
+        timeout = None if self.deadline is None else max(0.0, self.deadline - (time.perf_counter() - started))
+        return (future, timeout)
+
+    def take_plan(self, ai_player: AIPlayer, plan: tuple, possible_moves: list, property_locations: dict) -> tuple:
+        """
+        Gives the AIPlayer the plan a worker came back with, as if ai_move had been called here.
+
+        Arguments:
+        - ai_player: The AIPlayer whose turn it is
+        - plan: The tuple of (move, target, previous_moves, first_run) returned by decide_in_worker
+        - possible_moves: A list of the valid moves of the AIPlayer
+        - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+
+        Returns:
+        - move: The move of the AIPlayer
+        """
+        move, target, previous_moves, first_run = plan
+
+        # Take on the plan the worker came back with, as if ai_move had been called here
+        ai_player.target = target
+        ai_player.previous_moves = previous_moves
+
+        # The first move sets up the market index and board version of the AIPlayer, do it here too so a later quick_move or ai_move does not do it halfway through the game
+        if ai_player.first_run and not first_run:
+            ai_player.setup_first_run(property_locations)
+
+        if move is None:
+            return ai_player.rng.choice(possible_moves)
+        return move
+
+    def decide(self, ai_player: AIPlayer, possible_moves: list, property_locations: dict, players: list) -> tuple:
+        """
+        Works out the move of an AIPlayer within the time budget, it is used in place of ai_player.ai_move and leaves the AIPlayer in the same state.
+        The calling thread waits for the decision, use decide_async from an event loop.
+
+        Arguments:
+        - ai_player: The AIPlayer whose turn it is, it must be one of players
+        - possible_moves: A list of the valid moves of the AIPlayer
+        - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+        - players: A list of the players in seat order
+
+        Returns:
+        - move: The move of the AIPlayer
+        """
+        future, timeout = self.submit(ai_player, possible_moves, property_locations, players)
+        try:
+            plan = future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            self.timeouts += 1
+            return ai_player.quick_move(possible_moves, property_locations)
+        return self.take_plan(ai_player, plan, possible_moves, property_locations)
+
+    async def decide_async(self, ai_player: AIPlayer, possible_moves: list, property_locations: dict, players: list) -> tuple:
+        """
+        Works out the move of an AIPlayer within the time budget like decide, but gives the event loop back while the worker runs so the other tasks of the loop, like the other tables of a server, carry on.
+        The game of the AIPlayer must not change until the move comes back.
+
+        Arguments:
+        - ai_player: The AIPlayer whose turn it is, it must be one of players
+        - possible_moves: A list of the valid moves of the AIPlayer
+        - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+        - players: A list of the players in seat order
+
+        Returns:
+        - move: The move of the AIPlayer
+        """
+        future, timeout = self.submit(ai_player, possible_moves, property_locations, players)
+        try:
+            # wait_for cancels the wrapped future, and with it the decision, when the budget runs out
+            plan = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            return ai_player.quick_move(possible_moves, property_locations)
+        return self.take_plan(ai_player, plan, possible_moves, property_locations)
+
+    def close(self) -> None:
+        """
+        Shuts the workers down, without waiting for decisions that ran out of time.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,6 +1,9 @@
 #V. final
 from player_move import LPlayer
-import random
+from move_graph import MoveGraph
+from market_index import MarketIndex
+from board_version import BoardVersion
+from collections import OrderedDict
 import math
  
 class AIPlayer(LPlayer):
@@ -8,22 +11,47 @@ class AIPlayer(LPlayer):
     A class representing AI player, like normal player, but it make decision by itself.
 
     Attributes:
-        - WINNING_CONDITION: An integer of how many property needed to win the game.
+        - WINNING_CONDITION: An integer of how many property needed to win the game, used by every AIPlayer that was not given a winning condition of its own.
+        - UNREACHABLE: A number of steps larger than any real route, given to locations that cannot be reached.
+        - EVALUATION_CACHE_SIZE: An integer of how many evaluations are remembered before the least recently used one is forgotten.
         - previous_moves: A list of locations stores the places ai has visited.
-        - sorted_properties: A tuple that has all properties sorted in order of property cost.
+        - market_index: A MarketIndex of the properties the bank still owns, shared with every AIPlayer on the board.
         - first_run: A boolean representing is the ai first move or not.
         - target: A tuple of packed command that ai will always follow.
+        - board_version: A BoardVersion that counts the changes to the board, evaluations are reused until it moves on.
+        - evaluation_cache: An OrderedDict whose key is a tuple of (evaluation name, arguments, board version) and whose value is the result of the evaluation.
+        - winning_condition: An integer of how many property needed to win the game this AIPlayer plays, None to use WINNING_CONDITION.
     
     Behaviours:
         - Constructor: A method that is called when an object is created.
+        - get_market_index: Getter method for variable market_index.
+        - set_market_index: Setter method for variable market_index.
+        - get_board_version: Getter method for variable board_version.
+        - set_board_version: Setter method for variable board_version.
+        - get_winning_condition: Returns the winning condition of the game this AIPlayer plays.
+        - set_winning_condition: Setter method for variable winning_condition.
+        - cached_evaluation: Returns an evaluation from the cache, working it out only if the board has changed since it was last worked out.
+        - closest_route: Method that return the next step on the shortest path towards the targets of a distance table.
+        - setup_first_run: Method that set up the market index and board version on the first move.
+        - plan_move: Method that return the next step towards the target, without falling back to a random move.
         - ai_move: Method that return the position of next move.
+        - quick_move: Method that return a move worked out from the neighbouring tiles only, used when a decision runs out of time.
         - buy_or_build: Method that do buy properties or build hotel when needed.
     """
 
+    # The attributes AIPlayer adds on top of Player, kept in slots like the rest of the player
+    __slots__ = ("previous_moves", "market_index", "first_run", "target", "board_version", "evaluation_cache", "winning_condition")
+
     # AIPlayer should also know the winning condition as player knows too!
     # No discrimination!
     WINNING_CONDITION = 0
 
+    # The number of steps reported for a location that cannot be reached, so that it sorts after every real route
+    UNREACHABLE = math.inf
+
+    # Every board version only needs a couple of evaluations, so a handful of entries is plenty
+    EVALUATION_CACHE_SIZE = 8
+
     def __init__(self) -> None:
         """
         Constructor method of AIPlayer class.
@@ -40,9 +68,12 @@ class AIPlayer(LPlayer):
 
         # Initialize empty variable that help AI does its decision
         self.previous_moves = list()
-        self.sorted_properties = None
+        self.market_index = None
         self.first_run = True
         self.target = (-1,-1)
+        self.board_version = None
+        self.evaluation_cache = OrderedDict()
+        self.winning_condition = None
 
 #==================================================================ASSISTANT FUNCTION============================================================================================
 
@@ -57,176 +88,171 @@ class AIPlayer(LPlayer):
             - recurring: A list of color of properties that player owned
         """
 
-        # Get the property that player owned
-        my_properties = self.get_properties_owned()
-
-        # Initialize a list with all colour string and empty count
-        colours = ["Blue", "Green", "Red", "Yellow"]
-        amount = [0,0,0,0]
+        # Take the colour groups of the board from the market index and look up the count of each colour the player owns, indexed by colour id
+        colours = self.market_index.get_colours()
+        amount = [self.get_colour_count(colour) for colour in colours]
 
         # If player does not own any property, return all colours
-        if len(my_properties) == 0:
-            return colours
-
-        # Else, count the properties each colour have
-        for p in my_properties:
-            amount[colours.index(p.get_colour_group())]+=1;
+        if sum(amount) == 0:
+            return list(colours)
         
-        # Get maximum count by sorting it and get the last item
-        maximum = sorted(amount)[3]
+        # Get maximum count
+        maximum = max(amount)
 
-        # Loop through the colours and check if its count is same as maximum, if yes, add to a list
-        recurring = [colours[i] for i in range(4) if amount[i] == maximum]
+        # Loop through the colour ids and check if its count is same as maximum, if yes, add to a list
+        recurring = [colours[colour_id] for colour_id in range(len(colours)) if amount[colour_id] == maximum]
 
         # Return it
         return recurring
 
-    def get_sorted_properties(self,property_locations: dict):
+    def get_market_index(self) -> MarketIndex:
         """
-        A method that return all properties sorted in property_cost and hotel_cost, to assist AIplayer winning ASAP
+        Getter method for variable market_index.
 
         Arguments:
-            -property_locations: A dicionary of all property_locations
+            - None
 
         Returns:
-            -properties: All sorted properties packed in tuple
-        """
-
-        # Initialize four empty list to store the properties
-        properties_RED = list()
-        properties_GREEN = list()
-        properties_BLUE = list()
-        properties_YELLOW = list()
-
-        # Iterate through all properties
-        for cord in property_locations.keys():
-
-            # Get the attribute of the property and store them in variable
-            p = property_locations[cord]
-            p_cost = p.get_property_cost()
-            h_cost = p.get_hotel_cost()
-            p_colour = p.get_colour_group()
-
-            # Seperate the properties to different list by colour
-            if p_colour == 'Red':
-                properties_RED.append((p_cost,h_cost,p,p.get_location()))
-            if p_colour == 'Green':
-                properties_GREEN.append((p_cost,h_cost,p,p.get_location()))
-            if p_colour == 'Blue':
-                properties_BLUE.append((p_cost,h_cost,p,p.get_location()))
-            if p_colour == 'Yellow':
-                properties_YELLOW.append((p_cost,h_cost,p,p.get_location()))
-
-        # Sort all list by the price of property
-        # key= lambda a:a[0] here represent sorting according to a[0], as the tuple contained multiple datatype, this prevent the program from crashing
-        properties_RED.sort(key=lambda a: a[0])
-        properties_GREEN.sort(key=lambda a: a[0])
-        properties_BLUE.sort(key=lambda a: a[0])
-        properties_YELLOW.sort(key=lambda a: a[0])
-
-        # Return them packed in tuple
-        properties = (properties_RED,properties_GREEN,properties_BLUE,properties_YELLOW)
-        return properties
+            - market_index: The MarketIndex of the board, None before the first move if it was never set
+        """
+        return self.market_index
 
-    def get_low_cost_buyable(self,winning_condition: int):
+    def set_market_index(self, market_index: MarketIndex) -> None:
         """
-        This method will find the most 'winable' colour, it will find the lowest cost of properties to win by colour
+        Setter method for variable market_index, the game hands every AIPlayer the same index so the board is only indexed once.
 
         Arguments:
-            -winning_condition: The properties needed to win the game in integer
+            - market_index: The MarketIndex of the board
 
         Returns:
-            -lowest_cost: Packed cost and colour in tuple
+            - None
         """
+        self.market_index = market_index
 
-        # Initialize an empty list and add the packed tuple into it
-        winning_cost = list()
+    def get_board_version(self) -> BoardVersion:
+        """
+        Getter method for variable board_version.
 
-        # The lowest cost of properties to win by colour is calculated in calculate method
-        winning_cost.append( (self.calculate(self.sorted_properties[0],winning_condition),'Red'))
-        winning_cost.append( (self.calculate(self.sorted_properties[1],winning_condition),'Green'))
-        winning_cost.append( (self.calculate(self.sorted_properties[2],winning_condition),'Blue'))
-        winning_cost.append( (self.calculate(self.sorted_properties[3],winning_condition),'Yellow'))
+        Arguments:
+            - None
 
-        # Sort the list from lowest cost to highest cost and get the lowest cost
-        lowest_cost = sorted(winning_cost)[0]
+        Returns:
+            - board_version: The BoardVersion of the board, None before the first move if it was never set
+        """
+        return self.board_version
 
-        # Return the packed lowest cost and colour
-        return lowest_cost
+    def set_board_version(self, board_version: BoardVersion) -> None:
+        """
+        Setter method for variable board_version, the game hands every AIPlayer the same counter so the board is only observed once.
+
+        Arguments:
+            - board_version: The BoardVersion of the board
 
-    def calculate(self,properties: list,winning_condition: int):
+        Returns:
+            - None
+        """
+        self.board_version = board_version
+
+    def get_winning_condition(self) -> int:
         """
-        A method that calculate the sum of cost of property and hotel needed to win
+        Returns the winning condition of the game this AIPlayer plays, the one it was given or else WINNING_CONDITION.
 
         Arguments:
-            -properties: A list of property in the same colour
-            -winning_condition: The properties needed to win the game in integer
+            - None
 
         Returns:
-            -winning_cost: The sum of cost of property and hotel needed to win
+            - winning_condition: An integer of how many property needed to win the game
         """
+        if self.winning_condition is None:
+            return AIPlayer.WINNING_CONDITION
+        return self.winning_condition
 
-        # Initialize empty variable
-        buyable_count = 0
-        winning_cost = 0
+    def set_winning_condition(self, winning_condition: int) -> None:
+        """
+        Setter method for variable winning_condition, games that run side by side, like the tables of a server or the workers of a decision pool, each hand their AIPlayers their own.
 
-        # Iterate through properties in the list 
-        for p in properties:
+        Arguments:
+            - winning_condition: An integer of how many property needed to win the game, None to use WINNING_CONDITION
 
-            # If it is buyable, add cost to sum and 1 to count
-            if p[2].get_owner() == 'Bank':
-                buyable_count+=1
-                winning_cost += p[0]
-                winning_cost += p[1]
-            
-            # If there is any property in this colour belong to the player, add 1 to count
-            elif p[2].get_owner() == self:
-                buyable_count += 1
-            
-            # If the amount of properties is enough to win, break loop
-            if buyable_count >= winning_condition:
-                break
-        
-        # If buyable_count is less than winning_condition, then this colour is not winable anymore
-        if buyable_count < winning_condition:
-            return 999999
+        Returns:
+            - None
+        """
+        self.winning_condition = winning_condition
+        self.evaluation_cache.clear()
 
-        # Return the cost
-        return winning_cost
+    def cached_evaluation(self, key: tuple, evaluate, versioned: bool = True):
+        """
+        Returns an evaluation from the cache, working it out only if the board has changed since it was last worked out.
+        The least recently used evaluation is forgotten once there are more than EVALUATION_CACHE_SIZE of them.
+
+        Arguments:
+            - key: A tuple of the name of the evaluation and its arguments, including anything it depends on that the board version does not count, like the fund
+            - evaluate: A function with no arguments that works the evaluation out
+            - versioned: A boolean, if false the evaluation never changes during the game, like the layout of the board
 
-    def determine_next_moves(self, x: int, y: int, row_size: int) -> list[tuple]:
+        Returns:
+            - The result of the evaluation
         """
-        This is a method for the AIPlayer to determine next valid moves
+        # Without a board version there is no way to tell when the board changes, so always work it out
+        if self.board_version is None:
+            return evaluate()
+
+        # The board version is part of the key, so results from before a change are simply never asked for again
+        if versioned:
+            key = key + (self.board_version.get_version(),)
+
+        cache = self.evaluation_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        value = evaluate()
+        cache[key] = value
+        if len(cache) > AIPlayer.EVALUATION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
+
+    def get_low_cost_buyable(self,winning_condition: int):
+        """
+        This method will find the most 'winable' colour, it will find the lowest cost of properties to win by colour
 
         Arguments:
-            -x: AIPlayer current X coordinate
-            -y: AIPlayer current Y coordinate
-            -row_size: The row size of the game board
+            -winning_condition: The properties needed to win the game in integer
 
         Returns:
-            -possible_moves: A list of valid moves
+            -lowest_cost: Packed cost and colour in tuple
         """
 
-        # Initialize all possible moves in a list
-        possible_moves = [(x+2,y+1),(x+2,y-1),(x+1,y+2),(x+1,y-2),(x-1,y+2),(x-1,y-2),(x-2,y+1),(x-2,y-1)]
+        # Initialize an empty list and add the packed tuple into it
+        winning_cost = list()
 
-        # Initialize an empty lsit to store invalid moves
-        to_be_pop = list()
+        # The lowest cost of properties to win by colour is looked up in the market index for every colour group of the board, counting the properties AIPlayer already owns
+        for colour in self.market_index.get_colours():
+            winning_cost.append( (self.market_index.cost_to_complete(colour, self.get_colour_count(colour), winning_condition), colour))
 
-        # Iterate through all possible moves
-        for move in possible_moves:
+        # Sort the list from lowest cost to highest cost and get the lowest cost
+        lowest_cost = sorted(winning_cost)[0]
 
-            # Check if the move is out of the board
-            if move[0]<0 or move[0]>=row_size or move[1]<0 or move[1]>=row_size:
+        # Return the packed lowest cost and colour
+        return lowest_cost
 
-                # If yes, append it into the list
-                to_be_pop.append(move)
+    def determine_next_moves(self, x: int, y: int, row_size: int) -> tuple[tuple]:
+        """
+        This is a method for the AIPlayer to determine next valid moves
 
-        # Iterate through the list of invalid moves and remove them from possible_moves 
-        for index in to_be_pop:
-            possible_moves.remove(index)
+        Arguments:
+            -x: AIPlayer current X coordinate
+            -y: AIPlayer current Y coordinate
+            -row_size: The row size of the game board
 
-        # Return the list of possible_moves, the leftover are valid moves!
+        Returns:
+            -possible_moves: A tuple of valid moves
+        """
+
+        # Look the moves up in the table shared with every L-shaped player
+        possible_moves = MoveGraph.get_move_table(LPlayer.BASE_MOVE_TRAIT, row_size)[(x,y)]
+
+        # Return the tuple of possible_moves, the table only holds valid moves!
         return possible_moves
 
     def reward_locations(self, property_locations: dict) -> list[tuple]:
@@ -265,20 +291,18 @@ class AIPlayer(LPlayer):
 
         # Get prefered colours from the assistant method above
         prefered_colour1 = self.recurring_colour()
-        prefered_colour2 = self.get_low_cost_buyable(AIPlayer.WINNING_CONDITION)[1]
-
-        # Check whether AIPlayer has bought enough property in same colour
-        for color in ["Blue", "Green", "Red", "Yellow"]:
-            properties = list()
-            for owned in self.get_properties_owned():
-                if owned.get_colour_group() == color:
-                    properties.append(owned)
-            
-            # If AIPlayer has enough property in same colour
-            if len(properties) >= AIPlayer.WINNING_CONDITION:
+        # The winning cost of every colour only changes when the board does
+        winning_condition = self.get_winning_condition()
+        prefered_colour2 = self.cached_evaluation(("low_cost_buyable", winning_condition), lambda: self.get_low_cost_buyable(winning_condition))[1]
 
-                # Check which property have not build hotel yet
-                for p in properties:
+        # Check whether AIPlayer has bought enough property in same colour, for every colour group of the board in colour id order
+        for color in self.market_index.get_colours():
+
+            # If AIPlayer has enough property in same colour, which is looked up instead of counted
+            if self.get_colour_count(color) >= winning_condition:
+
+                # Check which property of the colour have not build hotel yet, looking only at the properties of that colour
+                for p in self.get_colour_properties(color):
 
                     # If there are any property that does not have hotel build and have enough money
                     if p.get_hotel_cost() <= self.get_fund() and p.get_hotels_built() == 0:
@@ -289,28 +313,11 @@ class AIPlayer(LPlayer):
         # If AIplayer has no enough property to win, try to buy the property in prefered colour 
         if prefered_colour2 in prefered_colour1:
 
-            # For each colour, find the cheapest property and check whether AIPlayer can afford the property,
+            # Find the cheapest property the bank still owns in that colour and check whether AIPlayer can afford the property,
             # If yes, tell AIPlayer to buy the property
-            if prefered_colour2 == 'Red':
-                for p in self.sorted_properties[0]:
-                    if p[2].get_owner() == 'Bank':
-                        if p[0] <= self.get_fund():
-                            return ('BUY',p[2].get_location())
-            if prefered_colour2 == 'Green':
-                for p in self.sorted_properties[1]:
-                    if p[2].get_owner() == 'Bank':
-                        if p[0] <= self.get_fund():
-                            return ('BUY',p[2].get_location())
-            if prefered_colour2 == 'Blue':
-                for p in self.sorted_properties[2]:
-                    if p[2].get_owner() == 'Bank':
-                        if p[0] <= self.get_fund():
-                            return ('BUY',p[2].get_location())
-            if prefered_colour2 == 'Yellow':
-                for p in self.sorted_properties[3]:
-                    if p[2].get_owner() == 'Bank':
-                        if p[0] <= self.get_fund():
-                            return ('BUY',p[2].get_location())
+            cheapest = self.market_index.cheapest_buyable(prefered_colour2)
+            if cheapest is not None and cheapest.get_property_cost() <= self.get_fund():
+                return ('BUY',cheapest.get_location())
 
         # If the colour of lowest cost is not in the properties that we owned, then the colour might be not winable anymore
         # Thus we tell AIPlayer to sell properties in that colour
@@ -342,78 +349,89 @@ class AIPlayer(LPlayer):
         # If the current location is the target location, return the number of step taken and current location
         if x == x1 and y == y1:
             return (depth,(x,y))
-        
-        # Determine next valid moves
-        next_moves = self.determine_next_moves(x,y,row_size)
 
-        # Initialize an empty list to store the packed tuple of step and location
-        temp = list()
+        # Get the number of moves needed to reach the target from every location, it is only worked out once per target
+        distances = MoveGraph.get_distance_table(LPlayer.BASE_MOVE_TRAIT, row_size, (x1,y1))
+        return self.closest_route(x,y,depth,row_size,distances)
+
+    def closest_route(self,x: int,y: int,depth: int,row_size: int,distances: dict):
+        """
+        This method will tell the AIPlayer which next move is on the shortest path towards the targets of a distance table
+
+        Arguments:
+            -x: AIPlayer current X coordinate
+            -y: AIPlayer current Y coordinate
+            -depth: the number of step taken
+            -row_size: The row size of the game board
+            -distances: A distance table from MoveGraph of the number of moves from every location to the closest target
+
+        Returns:
+            -closest_route: Step needed towards the closest target and next move packed in tuple
+        """
 
-        # Append current location into previous_moves to prevent it coming back
-        self.previous_moves.append((x,y))
+        # If the current location is a target, return the number of step taken and current location
+        if distances.get((x,y)) == 0:
+            return (depth,(x,y))
 
-        # If this way cannot reach target location in 5 move, just give up
-        if depth > 6:
-            # Remove this location from previous_moves as AIPlayer does not really went there
-            self.previous_moves.pop()
-            return (100,(-1,-1))
+        # Pack the step needed through every next move that can still reach the target
+        # Note that (x,y) is not in distances if the target cannot be reached from here, then there is nowhere to go
+        routes = [(distances[moves],moves) for moves in self.determine_next_moves(x,y,row_size) if moves in distances]
 
-        # Iterate through all possible vaild next move
-        for moves in next_moves:
+        # Prefer the routes that do not come back to where AIPlayer has just been, unless there is no other way
+        fresh_routes = [route for route in routes if route[1] not in self.previous_moves]
+        if len(fresh_routes) != 0:
+            routes = fresh_routes
 
-            # If AIPlayer has not visited there before,
-            if moves not in self.previous_moves:
+        # If there are no valid move for next move, tell AIPlayer this is unreachable
+        if len(routes) == 0:
+            return (AIPlayer.UNREACHABLE,(-1,-1))
 
-                # Append current location into previous_moves to prevent it coming back
-                self.previous_moves.append(moves)
-                
-                # Try calling this method again to see if next move can reach the target location or not
-                # Note that the current x and current y has changed to the move we are considering and depth increased by one as this is considered as one step!
-                move = self.ai_move_util(moves[0],moves[1],depth+1,row_size,x1,y1)
+        # Get the closest route, ties go to the smallest location just like sorting did
+        closest_route = min(routes)
+        return (depth+1+closest_route[0],closest_route[1])
 
-                # After we know the step needed to reach target location, prepare to go to next iteration before that, pop the location from previous_moves
-                self.previous_moves.pop()
+    def setup_first_run(self, property_locations: dict) -> None:
+        """
+        This method will set up what AIPlayer needs to decide on the board, it is done on the first move
 
-                # Append the step needed to take and the current move into the list
-                # Note that current move is appended but not the next move as next move is unreachable for now!
-                temp.append((move[0],moves))
+        Arguments:
+            -property_locations: A dicionary of all property locations
 
-        # Pop the current move from previous_moves as AIPlayer does not actually went there
-        self.previous_moves.pop()
+        Returns:
+            -None
+        """
 
-        # If there are no valid move for next move, tell AIPlayer this is unreachable
-        if len(temp) == 0:
-            return (100,(-1,-1))
-        
-        # Get the closest route by sorting it
-        closest_route = sorted(temp)[0]
-        return closest_route
+        # Index the board ourselves if the game did not hand us the shared market index
+        # Note that the reason this block of code does not appear in constructor is because it will change the argument taken from constructor!
+        if self.market_index is None:
+            self.market_index = MarketIndex(property_locations)
 
-    def ai_move(self, possible_moves: list[tuple], property_locations: dict) -> tuple:
+        # Count the changes to the board ourselves if the game did not hand us the shared board version
+        if self.board_version is None:
+            self.set_board_version(BoardVersion(property_locations))
+        self.first_run = False
+
+    def plan_move(self, possible_moves: list[tuple], property_locations: dict) -> tuple:
         """
-        This method will determine which location should AIPlayer go
+        This method will work out the next step towards the target of AIPlayer, it does everything ai_move does except picking a random move when the target cannot be reached, so that it never draws from the random number generator
 
         Arguments:
             -possible_moves: A list of possible valid moves
             -property_locations: A dicionary of all property locations
 
         Returns:
-            -move: The best move AIPlayer should go
+            -move: The best move AIPlayer should go, None if the target cannot be reached
         """
 
         # If this method is firstly called,
         if self.first_run:
-
-            # Store all the sorted properties into sorted_properties
-            # Note that the reason this block of code does not appear in constructor is because it will change the argument taken from constructor!
-            self.sorted_properties = self.get_sorted_properties(property_locations)
-            self.first_run = False
+            self.setup_first_run(property_locations)
 
         # Calculate the row size of the current game board
         row_size = int(math.sqrt(len(property_locations)))
 
-        # Get the command given by prefered_move() function
-        move = self.prefered_move()
+        # Get the command given by prefered_move() function, which is reused if neither the board nor our fund has changed since it was worked out
+        move = self.cached_evaluation(("prefered_move", self.get_fund()), self.prefered_move)
 
         # Get AIPlayer's current location
         x,y = self.get_position()
@@ -421,41 +439,31 @@ class AIPlayer(LPlayer):
         # If the command is 'GOTO' somewhere, we have to find the exact location
         if move[0] == 'GOTO':
             
-            # Initialize an empty list to store the step to reward and the location of reward
-            reward_step = list()
+            # Get the number of moves from every location to the closest reward, one search of the board from every reward at once
+            # The reward tiles never move, so they are only looked for, and searched from, once
+            distances = self.cached_evaluation(("reward_distances", row_size), lambda: MoveGraph.get_nearest_distance_table(LPlayer.BASE_MOVE_TRAIT, row_size, tuple(self.reward_locations(property_locations))), versioned=False)
 
-            # Iterate through every reward property
-            for location in self.reward_locations(property_locations):
-
-                # Unpack the location
-                x1,y1 = location
-
-                # Call ai_move_util() method to see the how to go to (x1,y1) from (x,y)
-                reward_step.append(self.ai_move_util(x,y,0,row_size,x1,y1))
-            
-            # Set the current objective as goto the closest reward location after sorting the list
-            # sorted(reward_step) is a list,
-            # sorted(reward_step)[0] get the least tuple from the list
-            # sorted(reward_step)[0][1] get the location from the tuple
+            # Set the current objective as the next step on the shortest path to the closest reward, which is also the move to make
             # the tuple has form: (step needed,(x,y))
-            closest_reward_location = sorted(reward_step)[0][1]
+            closest_reward_location = self.closest_route(x,y,0,row_size,distances)[1]
             self.target = ('GOTO',closest_reward_location)
+            move = closest_reward_location
 
         # Or else, just update the objective to the command given
         else:
             self.target = move
         
-        # Unpack the location AIPlayer trying to go
-        x1,y1 = self.target[1]
+            # Unpack the location AIPlayer trying to go
+            x1,y1 = self.target[1]
 
-        # Calculate what is the next step
-        move = self.ai_move_util(x,y,0,row_size,x1,y1)[1]
+            # Calculate what is the next step
+            move = self.ai_move_util(x,y,0,row_size,x1,y1)[1]
 
-        # If the move given is invalid, random choose a location to jump
-        # Usually it should be valid unless the board is too big that the step needed to go is more than 5!
+        # If the move given is invalid, there is no step to take
+        # This only happens when the target cannot be reached at all, like the middle of a 3x3 board!
         if move not in possible_moves:
             # ERROR! - Impossible route
-            return random.choice(possible_moves)
+            return None
 
         # Remember the last step taken to prevent coming back within three rounds
         self.previous_moves.append(move)
@@ -465,15 +473,68 @@ class AIPlayer(LPlayer):
             self.previous_moves.pop(0)
 
         # Debugging message
-        #print('AI decided to:',self.target)
-        #print('Now going to:',move)
-        #print('AI has went: ',self.previous_moves)
-        #print('AI now owned: ')
+        #self.output.emit("debug", "AI decided to: {target}", target = self.target)
+        #self.output.emit("debug", "Now going to: {move}", move = move)
+        #self.output.emit("debug", "AI has went: {previous_moves}", previous_moves = self.previous_moves)
+        #self.output.emit("debug", "AI now owned: ")
         #self.display_player_properties()
 
         # Return the final decision
         return move
 
+    def ai_move(self, possible_moves: list[tuple], property_locations: dict) -> tuple:
+        """
+        This method will determine which location should AIPlayer go
+
+        Arguments:
+            -possible_moves: A list of possible valid moves
+            -property_locations: A dicionary of all property locations
+
+        Returns:
+            -move: The best move AIPlayer should go
+        """
+        move = self.plan_move(possible_moves, property_locations)
+
+        # If the target cannot be reached, random choose a location to jump
+        if move is None:
+            return self.rng.choice(possible_moves)
+        return move
+
+    def quick_move(self, possible_moves: list[tuple], property_locations: dict) -> tuple:
+        """
+        This method will pick a move by only looking at the tiles AIPlayer can move to, it is used when there is no time left to plan a route towards the target
+
+        Arguments:
+            -possible_moves: A list of possible valid moves
+            -property_locations: A dicionary of all property locations
+
+        Returns:
+            -move: A move that lands on a reward, a property AIPlayer can buy or build on, or else the cheapest rent
+        """
+
+        def score(location):
+            property = property_locations[location]
+            owner = property.get_owner()
+
+            # Rewards are best, then properties we can buy or build on, then penalties, and somebody else's property last by how much rent it costs
+            if property.get_property_name() == "Reward":
+                return (0, 0, location)
+            if owner == "Bank" and property.get_property_cost() is not None:
+                return (1, 0, location) if self.get_fund() >= property.get_property_cost() else (2, 0, location)
+            if owner == self:
+                return (1, 0, location) if property.get_hotels_built() != 2 and self.get_fund() >= property.get_hotel_cost() else (2, 0, location)
+            if property.get_property_name() == "Penalty":
+                return (3, 0, location)
+            return (4, property.get_rent_price() * (1 + (0.2 * property.get_hotels_built())), location)
+
+        move = min(possible_moves, key=score)
+
+        # Remember the step like any other, so we still do not come back within three rounds
+        self.previous_moves.append(move)
+        if len(self.previous_moves) > 3:
+            self.previous_moves.pop(0)
+        return move
+
     def buy_or_build(self, best_move, property_locations: dict) -> None:
         """
         This method will tell the AIPlayer when to buy, sell or build
@@ -0,0 +1,76 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import os
+import sys
+import tracemalloc
+
+# The game modules live in the folder above this one
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from property import Property
+from player import Player
+
+
+def without_slots(slotted_class: type) -> type:
+    """
+    Builds a copy of a slotted class that keeps its attributes in a per-instance dictionary instead, so both layouts can be measured with the same constructor.
+
+    Arguments:
+    - slotted_class: A class that declares __slots__
+
+    Returns:
+    - A class with the same methods and base classes but no slots of its own
+    """
+    namespace = {name: value for name, value in vars(slotted_class).items() if name not in slotted_class.__slots__ and name != "__slots__"}
+    return type(slotted_class.__name__ + "WithDict", slotted_class.__bases__, namespace)
+
+
+def measure(factory, count: int) -> int:
+    """
+    Measures the memory taken by count objects made by factory.
+
+    Arguments:
+    - factory: A function with no arguments that returns a new object
+    - count: An integer of the number of objects to make
+
+    Returns:
+    - An integer of the number of bytes allocated while the objects were alive
+    """
+    tracemalloc.start()
+    objects = [factory() for _ in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def run_memory_benchmark(count: int = 50000) -> list[tuple]:
+    """
+    Compares the memory taken by slotted and dictionary-based properties and players.
+
+    Arguments:
+    - count: An integer of the number of objects of each kind to make
+
+    Returns:
+    - A list of tuples of (name, bytes with slots, bytes with a dictionary)
+    """
+    # Build dictionary-based twins of Property and Player
+    DictProperty = without_slots(Property)
+    DictPlayer = without_slots(Player)
+
+    property_args = ("Atlantic Avenue", 100, 110, 45, "Blue")
+
+    rows = []
+    rows.append(("Property", measure(lambda: Property(*property_args), count), measure(lambda: DictProperty(*property_args), count)))
+    rows.append(("Player", measure(Player, count), measure(DictPlayer, count)))
+    return rows
+
+
+####################################################################################
+if __name__ == "__main__":
+    count = 50000
+    print("{:<10}{:>18}{:>18}{:>10}".format("Object", "slots B/object", "dict B/object", "saving"))
+    for name, slotted_bytes, dict_bytes in run_memory_benchmark(count):
+        print("{:<10}{:>18.1f}{:>18.1f}{:>9.0f}%".format(name, slotted_bytes / count, dict_bytes / count, 100 * (1 - slotted_bytes / dict_bytes)))
@@ -0,0 +1,354 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import argparse
+import json
+import os
+import pickle
+import random
+import statistics
+import sys
+import time
+
+# The game modules live in the folder above this one
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from property_generator import PropertyGenerator
+from property_catalog import PropertyCatalog
+from catalog_generator import CatalogGenerator
+from player import Player
+from player_move import PerpendicularPlayer, DiagonalPlayer, LPlayer
+from ai_player import AIPlayer
+from market_index import MarketIndex
+from board_version import BoardVersion
+from pypoly_simulator import PyPolySimulator, SimulationConfig
+from game_snapshot import GameSnapshot
+from output_sink import NullSink
+
+
+# Every benchmark draws from generators seeded with this, so two runs measure exactly the same work
+BENCH_SEED = 1234
+
+def synthetic_catalog(number_of_properties: int, delimiter: str = ",") -> list[str]:
+    """
+    Builds a seeded CSV catalog in the same layout as property_csv_data_a with a CatalogGenerator, so PropertyGenerator can be measured at any size.
+
+    Arguments:
+    - number_of_properties: An integer of the number of rows after the header
+    - delimiter: A string of the delimiter between columns
+
+    Returns:
+    - A list of strings, the first one contains the column names
+    """
+    # The generator counts the four chance tiles as part of the board
+    return list(CatalogGenerator(number_of_properties + 4, seed=BENCH_SEED, chance_ratio=0).iter_csv_lines(delimiter))
+
+
+def synthetic_board(row_size: int) -> dict:
+    """
+    Builds a seeded board with row_size x row_size tiles out of a synthetic catalog.
+
+    Arguments:
+    - row_size: An integer of the number of horizontal and vertical grids
+
+    Returns:
+    - A dictionary whose key is a location and whose value is the Property there
+    """
+    catalog_generator = CatalogGenerator(row_size * row_size, seed=BENCH_SEED)
+    property_gen = PropertyGenerator()
+    property_gen.set_rng(random.Random(BENCH_SEED))
+    property_gen.catalog_to_properties(catalog_generator.catalog())
+    property_gen.property_location_generator(shuffle_layout=True, chance_tiles=catalog_generator.number_of_chance_tiles())
+    return property_gen.property_locations
+
+
+def time_call(function, number: int, repeat: int) -> tuple:
+    """
+    Times a function with no arguments, running it number times in each of repeat rounds.
+
+    Arguments:
+    - function: A function with no arguments
+    - number: An integer of the calls in every round
+    - repeat: An integer of the number of rounds
+
+    Returns:
+    - A tuple of (best, median) microseconds per call over the rounds
+    """
+    rounds = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            function()
+        rounds.append((time.perf_counter_ns() - started) / number / 1e3)
+    return (min(rounds), statistics.median(rounds))
+
+
+def bench_csv_to_properties(sizes: list[int]):
+    """
+    Yields one benchmark per catalog size for parsing a CSV catalog, and for PropertyGenerator.csv_to_properties which only parses it the first time.
+
+    Arguments:
+    - sizes: A list of integers of catalog sizes
+
+    Returns:
+    - A generator of tuples of (name, function, number)
+    """
+    for size in sizes:
+        catalog = synthetic_catalog(size)
+
+        def run_parse(catalog=catalog):
+            PropertyCatalog(PropertyCatalog.iter_entries(catalog, ","))
+
+        def run(catalog=catalog):
+            PropertyGenerator().csv_to_properties(catalog, ",")
+
+        yield ("catalog_parse[{}]".format(size), run_parse, max(1, 10000 // size))
+        yield ("csv_to_properties[{}]".format(size), run, max(1, 10000 // size))
+
+
+def bench_location_generator(sizes: list[int]):
+    """
+    Yields one benchmark per catalog size and layout for PropertyGenerator.property_location_generator.
+
+    Arguments:
+    - sizes: A list of integers of catalog sizes
+
+    Returns:
+    - A generator of tuples of (name, function, number)
+    """
+    for size in sizes:
+        properties = PropertyGenerator()
+        properties.csv_to_properties(synthetic_catalog(size), ",")
+
+        for shuffle_layout in (False, True):
+            def run(properties=properties.properties, shuffle_layout=shuffle_layout):
+                property_gen = PropertyGenerator()
+                property_gen.set_rng(random.Random(BENCH_SEED))
+                property_gen.properties = properties
+                property_gen.property_location_generator(shuffle_layout=shuffle_layout)
+
+            yield ("location_generator[{},{}]".format("shuffle" if shuffle_layout else "draw", size), run, max(1, 10000 // size))
+
+
+def bench_valid_moves(row_sizes: list[int]):
+    """
+    Yields one benchmark per move trait and board size for determine_valid_moves, from every location of the board in turn.
+
+    Arguments:
+    - row_sizes: A list of integers of board sizes
+
+    Returns:
+    - A generator of tuples of (name, function, number)
+    """
+    for player_class in (PerpendicularPlayer, DiagonalPlayer, LPlayer):
+        for row_size in row_sizes:
+            player = player_class()
+            locations = [(x, y) for x in range(row_size) for y in range(row_size)]
+
+            def run(player=player, locations=locations, row_size=row_size):
+                for location in locations:
+                    player.set_position(location)
+                    player.determine_valid_moves(row_size)
+
+            yield ("determine_valid_moves[{},{}]".format(player_class.BASE_MOVE_TRAIT, row_size), run, 1)
+
+
+def bench_ai(row_sizes: list[int]):
+    """
+    Yields benchmarks for AIPlayer.ai_move_util and AIPlayer.ai_move on boards of every size.
+
+    Arguments:
+    - row_sizes: A list of integers of board sizes
+
+    Returns:
+    - A generator of tuples of (name, function, number)
+    """
+    for row_size in row_sizes:
+        property_locations = synthetic_board(row_size)
+        rng = random.Random(BENCH_SEED)
+        starts = [rng.choice(list(property_locations)) for _ in range(32)]
+        targets = [rng.choice(list(property_locations)) for _ in range(32)]
+
+        ai_player = AIPlayer()
+        ai_player.set_rng(rng)
+        ai_player.set_output(NullSink())
+        ai_player.set_market_index(MarketIndex(property_locations))
+        ai_player.set_board_version(BoardVersion(property_locations))
+
+        def run_util(ai_player=ai_player, row_size=row_size, starts=starts, targets=targets):
+            for (x, y), (x1, y1) in zip(starts, targets):
+                ai_player.ai_move_util(x, y, 0, row_size, x1, y1)
+
+        def run_move(ai_player=ai_player, row_size=row_size, starts=starts, property_locations=property_locations):
+            for start in starts:
+                ai_player.set_position(start)
+                ai_player.ai_move(list(ai_player.determine_valid_moves(row_size)), property_locations)
+
+        yield ("ai_move_util[{}]".format(row_size), run_util, 1)
+        yield ("ai_move[{}]".format(row_size), run_move, 1)
+
+
+def bench_holdings(holdings: list[int]):
+    """
+    Yields benchmarks for Player.check_win and Player.pay_rent for players owning many properties.
+
+    Arguments:
+    - holdings: A list of integers of the number of properties owned
+
+    Returns:
+    - A generator of tuples of (name, function, number)
+    """
+    for holding in holdings:
+        property_gen = PropertyGenerator()
+        property_gen.csv_to_properties(synthetic_catalog(holding), ",")
+
+        # The owner holds every property with a hotel on each, and the tenant pays rent on the first one
+        owner = Player()
+        owner.set_name("Owner")
+        owner.set_output(NullSink())
+        owner.add_fund(holding * 1000)
+        for property in property_gen.properties:
+            owner.purchase_property(property)
+            owner.purchase_hotel(property)
+        rented = property_gen.properties[0]
+
+        tenant = Player()
+        tenant.set_name("Tenant")
+        tenant.set_output(NullSink())
+
+        def run_check_win(owner=owner, holding=holding):
+            owner.check_win(holding)
+
+        def run_pay_rent(tenant=tenant, rented=rented):
+            # Top the tenant up so every call pays the rent in cash
+            tenant.add_fund(10 ** 9 - tenant.get_fund())
+            tenant.pay_rent(rented)
+
+        yield ("check_win[{}]".format(holding), run_check_win, 100)
+        yield ("pay_rent[{}]".format(holding), run_pay_rent, 100)
+
+
+def bench_games(number_of_games: int):
+    """
+    Yields a benchmark that plays seeded headless games, one game per call.
+
+    Arguments:
+    - number_of_games: An integer of the games played in every round
+
+    Returns:
+    - A generator of tuples of (name, function, number)
+    """
+    seeds = iter(range(BENCH_SEED, BENCH_SEED + 10 ** 9))
+
+    def run():
+        config = SimulationConfig(data_set=3, win_requirement=3, roster=["AI", "AI", "Perpendicular", "L"], max_turns=2000, seed=next(seeds))
+        PyPolySimulator(config).run()
+
+    yield ("headless_game", run, number_of_games)
+
+
+def bench_snapshot():
+    """
+    Yields benchmarks for saving and restoring a game in the middle with GameSnapshot, next to pickling the same object graph.
+
+    Arguments:
+    - None
+
+    Returns:
+    - A generator of tuples of (name, function, number)
+    """
+    simulator = PyPolySimulator(SimulationConfig(data_set=3, win_requirement=5, roster=["AI", "AI", "Perpendicular", "L"], max_turns=80, seed=BENCH_SEED))
+    simulator.run()
+    snapshot = simulator.snapshot()
+
+    def run_pickle():
+        pickle.dumps((simulator.property_locations, simulator.list_of_players, simulator.rng), pickle.HIGHEST_PROTOCOL)
+
+    yield ("snapshot_save", simulator.snapshot, 100)
+    yield ("snapshot_restore", lambda: simulator.restore(snapshot), 100)
+    yield ("snapshot_save_without_rng", lambda: GameSnapshot.save(simulator.property_locations, simulator.list_of_players), 100)
+    yield ("pickle_dumps", run_pickle, 100)
+
+
+def collect_benchmarks(quick: bool) -> list[tuple]:
+    """
+    Lists every benchmark of the suite, in the order they are printed.
+
+    Arguments:
+    - quick: A boolean, if true smaller sizes are used so the suite finishes in a few seconds
+
+    Returns:
+    - A list of tuples of (name, function, number)
+    """
+    catalog_sizes = [100, 1000] if quick else [100, 1000, 10000]
+    row_sizes = [8, 32] if quick else [8, 32, 100]
+    holdings = [100, 1000] if quick else [100, 1000, 10000]
+
+    benchmarks = []
+    benchmarks.extend(bench_csv_to_properties(catalog_sizes))
+    benchmarks.extend(bench_location_generator(catalog_sizes))
+    benchmarks.extend(bench_valid_moves(row_sizes))
+    benchmarks.extend(bench_ai(row_sizes))
+    benchmarks.extend(bench_holdings(holdings))
+    benchmarks.extend(bench_snapshot())
+    benchmarks.extend(bench_games(10 if quick else 50))
+    return benchmarks
+
+
+def run_suite(quick: bool = False, repeat: int = 5, name_filter: str = None) -> list[dict]:
+    """
+    Runs every benchmark of the suite whose name contains name_filter, every player of the benchmarks writes to a NullSink so nothing is printed or formatted.
+
+    Arguments:
+    - quick: A boolean, if true smaller sizes are used
+    - repeat: An integer of the number of timed rounds of every benchmark
+    - name_filter: A string that the name of a benchmark must contain to be run, None to run them all
+
+    Returns:
+    - A list of dictionaries of name, number, best_us and median_us
+    """
+    results = []
+    for name, function, number in collect_benchmarks(quick):
+        if name_filter is not None and name_filter not in name:
+            continue
+
+        # One untimed call first, so tables and caches built on first use are not counted
+        function()
+        best, median = time_call(function, number, repeat)
+        results.append({"name": name, "number": number, "best_us": best, "median_us": median})
+    return results
+
+
+def format_results(results: list[dict]) -> str:
+    """
+    Formats the results as a table with one benchmark per line, in a stable order and layout so runs can be compared with diff.
+
+    Arguments:
+    - results: A list of dictionaries as returned by run_suite
+
+    Returns:
+    - A string of the table
+    """
+    lines = ["{:<40}{:>8}{:>16}{:>16}{:>14}".format("benchmark", "calls", "best us/call", "median us/call", "calls/s")]
+    for result in results:
+        lines.append("{:<40}{:>8}{:>16.3f}{:>16.3f}{:>14.1f}".format(result["name"], result["number"], result["best_us"], result["median_us"], 1e6 / result["best_us"]))
+    return "\n".join(lines)
+
+
+####################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs the PyPoly benchmark suite and prints one line per benchmark.")
+    parser.add_argument("--quick", action="store_true", help="use smaller sizes so the suite finishes in a few seconds")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed rounds of every benchmark")
+    parser.add_argument("--filter", default=None, help="only run the benchmarks whose name contains this")
+    parser.add_argument("--json", default=None, help="also write the results to this JSON file")
+    arguments = parser.parse_args()
+
+    results = run_suite(arguments.quick, arguments.repeat, arguments.filter)
+    print("python {} on {}".format(sys.version.split()[0], sys.platform))
+    print(format_results(results))
+
+    if arguments.json is not None:
+        with open(arguments.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
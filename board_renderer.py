@@ -0,0 +1,203 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import shutil
+import sys
+
+
+class BoardRenderer:
+    """
+    A class that draws the game board for a player, shared by every move trait.
+    The whole frame is built into one string and written with a single write, and in diff mode only the cells that changed since the previous frame are redrawn.
+
+    In diff mode the board is pinned to the top of the terminal and everything else the game prints scrolls underneath it, using a terminal scrolling region.
+    When the board is too tall to leave any lines under it the region cannot be set, so whole frames are written instead until a board of another size, or a taller terminal, fits.
+
+    Attributes:
+        - TWHITE: A string of the escape code for white text
+        - ENDC: A string of the escape code that ends the colour
+        - diff_mode: A boolean of whether only changed cells are redrawn
+        - stream: The file-like object the board is written to, None to write to whatever sys.stdout is at the time
+        - previous_cells: A list of rows of cell strings of the last frame drawn in diff mode, None before the first one or while the board does not fit
+        - previous_row_size: An integer of the row size of the last frame drawn in diff mode
+
+    Behaviours:
+        - render_cells: Works out the text of every cell of the board.
+        - render: Builds the whole board into one string.
+        - frame_from_cells: Joins the cells into the lines of the board.
+        - display: Writes the board in one go, or only its changed cells in diff mode.
+        - reset: Gives the terminal its full scrolling region back and forgets the last frame.
+    """
+
+    # Escape codes used to show the hotels built on a property in white
+    TWHITE = '\033[37m'
+    ENDC = '\033[m'
+
+    def __init__(self, diff_mode: bool = False, stream=None) -> None:
+        """
+        Constructor method for BoardRenderer class.
+
+        Arguments:
+            - diff_mode: A boolean of whether only changed cells are redrawn, off by default
+            - stream: The file-like object the board is written to, None to write to sys.stdout
+
+        Returns:
+            - None
+        """
+        self.diff_mode = diff_mode
+        self.stream = stream
+        self.previous_cells = None
+        self.previous_row_size = 0
+
+    def render_cells(self, player, row_size: int, valid_flag: bool) -> list[list[str]]:
+        """
+        Works out the text of every cell of the board for a player, using a set of valid moves and a dictionary of owned locations so that every cell is a lookup.
+
+        Arguments:
+            - player: The player whose board is drawn
+            - row_size: An integer representing the number of horizontal and vertical grids.
+            - valid_flag: If true, the 'x' indicates a valid movement with the position of player. If false, only the current location of the player is displayed.
+
+        Returns:
+            - cells: A list of rows, each a list of the strings of its cells like '| x '
+        """
+        # Fetch the valid moves, only when we are going to show them
+        valid_moves = set(player.determine_valid_moves(row_size)) if valid_flag else set()
+
+        # Map the location of every property owned by the player to the number of hotels built there
+        hotels_at = {property.get_location(): str(property.get_hotels_built()) for property in player.get_properties_owned()}
+
+        position = player.get_position()
+        player_cell = "| {} ".format(player.get_symbol())
+
+        cells = []
+        for x in range(row_size):
+            row = []
+            for y in range(row_size):
+                location = (x, y)
+
+                # If the location is a valid move, the player is here, the player owns a property here, or else there is nothing there
+                if location in valid_moves:
+                    row.append("| x ")
+                elif location == position:
+                    row.append(player_cell)
+                elif location in hotels_at:
+                    row.append("| {} ".format(BoardRenderer.TWHITE + hotels_at[location] + BoardRenderer.ENDC))
+                else:
+                    row.append("|   ")
+            cells.append(row)
+
+        return cells
+
+    def render(self, player, row_size: int, valid_flag: bool) -> str:
+        """
+        Builds the whole board into one string, drawn exactly the way display_moves has always drawn it.
+
+        Arguments:
+            - player: The player whose board is drawn
+            - row_size: An integer representing the number of horizontal and vertical grids.
+            - valid_flag: If true, the 'x' indicates a valid movement with the position of player.
+
+        Returns:
+            - A string of the board ending with a new line
+        """
+        return self.frame_from_cells(self.render_cells(player, row_size, valid_flag), row_size)
+
+    def frame_from_cells(self, cells: list[list[str]], row_size: int) -> str:
+        """
+        Joins the cells into the lines of the board.
+
+        Arguments:
+            - cells: A list of rows of cell strings
+            - row_size: An integer representing the number of horizontal and vertical grids.
+
+        Returns:
+            - A string of the board ending with a new line
+        """
+        separator = "  " + "+---" * row_size + "+"
+
+        # The first line only holds the number of every column, then every row sits under a separating line
+        lines = ["    " + "   ".join([str(x) for x in range(row_size)])]
+        for x in range(row_size):
+            lines.append(separator)
+            lines.append(str(x) + " " + "".join(cells[x]) + "|")
+        lines.append(separator)
+
+        return "\n".join(lines) + "\n"
+
+    def display(self, player, row_size: int, valid_flag: bool) -> None:
+        """
+        Writes the board for a player in a single write, or only the cells that changed since the previous frame in diff mode.
+
+        Arguments:
+            - player: The player whose board is drawn
+            - row_size: An integer representing the number of horizontal and vertical grids.
+            - valid_flag: If true, the 'x' indicates a valid movement with the position of player.
+
+        Returns:
+            - None
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        cells = self.render_cells(player, row_size, valid_flag)
+
+        # Without diff mode just write the whole frame
+        if not self.diff_mode:
+            stream.write(self.frame_from_cells(cells, row_size))
+            return
+
+        # The board takes up the column numbers, two lines per row and the last separating line
+        frame_height = 2 * row_size + 2
+
+        # On the first frame, or when the board changes size, clear the screen, draw everything at the top and keep the lines under it for the rest of the game to scroll in
+        if self.previous_cells is None or self.previous_row_size != row_size:
+            terminal_height = shutil.get_terminal_size().lines
+
+            # A scrolling region needs at least two lines under the board, without them terminals ignore it and the cell updates would land on scrolled text
+            if frame_height + 1 >= terminal_height:
+                # Give back the region of an earlier board that did fit, then write whole frames, checking again on the next one
+                stream.write(("\033[r" if self.previous_cells is not None else "") + self.frame_from_cells(cells, row_size))
+                stream.flush()
+                self.previous_cells = None
+                self.previous_row_size = row_size
+                return
+
+            stream.write("\033[r\033[2J\033[H" + self.frame_from_cells(cells, row_size) + "\033[{};{}r\033[{};1H".format(frame_height + 1, terminal_height, frame_height + 1))
+
+        # Otherwise remember where the cursor was, redraw only the cells that changed and put the cursor back
+        else:
+            updates = ["\0337"]
+            for x in range(row_size):
+                previous_row = self.previous_cells[x]
+                current_row = cells[x]
+                for y in range(row_size):
+                    if previous_row[y] != current_row[y]:
+                        # Rows sit on every other line under the column numbers, and every cell is four characters wide after the row number
+                        updates.append("\033[{};{}H{}".format(2 * x + 3, len(str(x)) + 2 + 4 * y, current_row[y]))
+            updates.append("\0338")
+            stream.write("".join(updates))
+
+        stream.flush()
+        self.previous_cells = cells
+        self.previous_row_size = row_size
+
+    def reset(self) -> None:
+        """
+        Gives the terminal its full scrolling region back and forgets the last frame, so the next frame is drawn in full.
+
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        if self.diff_mode and self.previous_cells is not None:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write("\033[r")
+            stream.flush()
+        self.previous_cells = None
+        self.previous_row_size = 0
+
+
+# The renderer players draw with when they are not handed one
+DEFAULT_RENDERER = BoardRenderer()
@@ -0,0 +1,57 @@
+# Authors:
+# Team:
+# Date Edited:
+
+class BoardVersion:
+    """
+    A class that counts the changes made to a board, so that anything worked out from the board can be kept until the count moves on.
+    It observes every property on the board, and the count goes up whenever the owner, hotels or rent of a property change.
+    Funds change on nearly every turn, so they are not counted, anything that depends on a fund should put the fund in its own cache key instead.
+
+    Attributes:
+        - version: An integer of the number of changes seen so far
+
+    Behaviours:
+        - get_version: Getter method for variable version.
+        - property_changed: Counts a change to a property.
+    """
+
+    def __init__(self, property_locations: dict) -> None:
+        """
+        Constructor method for BoardVersion class, it starts observing every property on the board.
+
+        Arguments:
+            - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+
+        Returns:
+            - None
+        """
+        self.version = 0
+
+        # Chance tiles share one Property between many locations, so only observe each property once
+        for property in dict.fromkeys(property_locations.values()):
+            property.add_observer(self)
+
+    def get_version(self) -> int:
+        """
+        Getter method for variable version.
+
+        Arguments:
+            - None
+
+        Returns:
+            - version: An integer of the number of changes seen so far
+        """
+        return self.version
+
+    def property_changed(self, property) -> None:
+        """
+        Counts a change to a property, it is called by the property itself.
+
+        Arguments:
+            - property: The Property that changed
+
+        Returns:
+            - None
+        """
+        self.version += 1
@@ -0,0 +1,203 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import math
+import random
+import sys
+
+from property_catalog import CatalogEntry, PropertyCatalog
+
+
+class CatalogGenerator:
+    """
+    A class that makes up seeded property catalogs of any size, so boards of 100x100 tiles and larger can be played and every part of the game can be measured as the board grows.
+
+    Rows are made one at a time from the seed, so a catalog can be streamed into a PropertyCatalog, or out to a CSV file, without the whole data set ever being held as text, and the same settings always make the same catalog.
+    The costs follow the built-in data sets: a hotel costs a fixed share of the property plus 10 and the rent is a fixed share of the property, and every cost is a multiple of 10.
+
+    Attributes:
+        - BASE_COLOURS: A tuple of the colour groups of the built-in data sets, the first colour groups of every catalog are named after them
+        - COST_DISTRIBUTIONS: A tuple of the names of the distributions property costs can be drawn from
+        - CSV_COLUMNS: A list of the column names of the CSV files written, the same as the built-in data sets
+        - number_of_tiles: An integer of the number of tiles of the board, chance tiles included
+        - number_of_colours: An integer of the number of colour groups
+        - seed: An integer seed of the random number generator the costs are drawn from
+        - cost_distribution: A string of one of COST_DISTRIBUTIONS
+        - min_cost: An integer of the lowest property cost
+        - max_cost: An integer of the highest property cost
+        - hotel_cost_ratio: A float of the share of the property cost a hotel costs, on top of 10
+        - rent_ratio: A float of the share of the property cost the rent is
+        - chance_ratio: A float of the share of the tiles that are chance tiles, the board always gets at least 4
+
+    Behaviours:
+        - colour_name: Returns the name of a colour group.
+        - number_of_chance_tiles: Returns the number of chance tiles of the board.
+        - number_of_properties: Returns the number of properties in the catalog.
+        - draw_cost: Draws one property cost.
+        - iter_entries: Makes the CatalogEntry of every property one at a time.
+        - iter_csv_lines: Makes the lines of the catalog as a CSV file one at a time.
+        - write_csv: Streams the catalog to a CSV file.
+        - catalog: Returns the PropertyCatalog of the settings, making it the first time it is asked for.
+    """
+
+    BASE_COLOURS = ("Blue", "Green", "Red", "Yellow")
+
+    COST_DISTRIBUTIONS = ("uniform", "normal", "lognormal")
+
+    CSV_COLUMNS = ["key", "property_name", "property_cost", "hotel_cost", "rent_price", "colour_group"]
+
+    def __init__(self, number_of_tiles: int = 10000, number_of_colours: int = 4, seed: int = 0, cost_distribution: str = "uniform", min_cost: int = 20, max_cost: int = 400, hotel_cost_ratio: float = 1.0, rent_ratio: float = 0.45, chance_ratio: float = 0.08) -> None:
+        """
+        Constructor method for CatalogGenerator class.
+
+        Arguments:
+            - number_of_tiles: An integer of the number of tiles of the board, chance tiles included, a square number like 10000 makes a board of exactly that many tiles
+            - number_of_colours: An integer of the number of colour groups, the properties are dealt into them in turn
+            - seed: An integer seed of the random number generator the costs are drawn from
+            - cost_distribution: A string of one of COST_DISTRIBUTIONS, "normal" centres the costs between min_cost and max_cost and "lognormal" makes most properties cheap and a few dear
+            - min_cost: An integer of the lowest property cost
+            - max_cost: An integer of the highest property cost
+            - hotel_cost_ratio: A float of the share of the property cost a hotel costs, on top of 10
+            - rent_ratio: A float of the share of the property cost the rent is
+            - chance_ratio: A float of the share of the tiles that are chance tiles
+
+        Returns:
+            - None
+        """
+        if cost_distribution not in CatalogGenerator.COST_DISTRIBUTIONS:
+            raise ValueError("{} is not one of {}.".format(cost_distribution, ", ".join(CatalogGenerator.COST_DISTRIBUTIONS)))
+        if number_of_colours < 1:
+            raise ValueError("A catalog needs at least one colour group.")
+        if not 10 <= min_cost <= max_cost:
+            raise ValueError("The costs must be at least 10 and min_cost cannot be above max_cost.")
+
+        self.number_of_tiles = number_of_tiles
+        self.number_of_colours = number_of_colours
+        self.seed = seed
+        self.cost_distribution = cost_distribution
+        self.min_cost = min_cost
+        self.max_cost = max_cost
+        self.hotel_cost_ratio = hotel_cost_ratio
+        self.rent_ratio = rent_ratio
+        self.chance_ratio = chance_ratio
+
+    def colour_name(self, colour_id: int) -> str:
+        """
+        Returns the name of a colour group, the first ones are the colour groups of the built-in data sets and the rest are numbered.
+
+        Arguments:
+            - colour_id: An integer from 0 to number_of_colours - 1
+
+        Returns:
+            - A string of the name of the colour group
+        """
+        if colour_id < len(CatalogGenerator.BASE_COLOURS):
+            return CatalogGenerator.BASE_COLOURS[colour_id]
+        return "Colour {}".format(colour_id + 1)
+
+    def number_of_chance_tiles(self) -> int:
+        """
+        Returns the number of chance tiles of the board, at least 4 like PropertyGenerator.property_location_generator needs, it is passed on as its chance_tiles.
+
+        Arguments:
+            - None
+
+        Returns:
+            - An integer of the number of chance tiles
+        """
+        return min(self.number_of_tiles, max(4, round(self.number_of_tiles * self.chance_ratio)))
+
+    def number_of_properties(self) -> int:
+        """
+        Returns the number of properties in the catalog, the tiles that are not chance tiles.
+
+        Arguments:
+            - None
+
+        Returns:
+            - An integer of the number of properties
+        """
+        return self.number_of_tiles - self.number_of_chance_tiles()
+
+    def draw_cost(self, rng: random.Random) -> int:
+        """
+        Draws one property cost from the distribution, kept between min_cost and max_cost and rounded to a multiple of 10.
+
+        Arguments:
+            - rng: The random.Random to draw from
+
+        Returns:
+            - An integer of the cost
+        """
+        if self.cost_distribution == "uniform":
+            cost = rng.uniform(self.min_cost, self.max_cost)
+        elif self.cost_distribution == "normal":
+            cost = rng.gauss((self.min_cost + self.max_cost) / 2, (self.max_cost - self.min_cost) / 6)
+        else:
+            # Half of the costs fall below the geometric middle of the range, with a long tail towards max_cost
+            cost = rng.lognormvariate(math.log(math.sqrt(self.min_cost * self.max_cost)), math.log(self.max_cost / self.min_cost) / 4)
+
+        cost = min(max(cost, self.min_cost), self.max_cost)
+        return max(10, int(round(cost / 10)) * 10)
+
+    def iter_entries(self):
+        """
+        Makes the CatalogEntry of every property one at a time, the same settings always make the same entries.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A generator of CatalogEntry
+        """
+        rng = random.Random(self.seed)
+
+        # There are only a few colour groups, so every property shares the interned name of its colour
+        colours = [sys.intern(self.colour_name(colour_id)) for colour_id in range(self.number_of_colours)]
+
+        for number in range(self.number_of_properties()):
+            cost = self.draw_cost(rng)
+            yield CatalogEntry("Property {}".format(number + 1), cost, int(cost * self.hotel_cost_ratio) + 10, int(cost * self.rent_ratio), colours[number % self.number_of_colours])
+
+    def iter_csv_lines(self, delimiter: str = ","):
+        """
+        Makes the lines of the catalog as a CSV file in the layout of the built-in data sets, one at a time, starting with the column names.
+
+        Arguments:
+            - delimiter: A string of the delimiter between columns
+
+        Returns:
+            - A generator of strings without line endings
+        """
+        yield delimiter.join(CatalogGenerator.CSV_COLUMNS)
+        for number, entry in enumerate(self.iter_entries()):
+            yield delimiter.join(["property_{}".format(number + 1), entry.property_name, str(entry.property_cost), str(entry.hotel_cost), str(entry.rent_price), entry.colour_group])
+
+    def write_csv(self, file_path: str, delimiter: str = ",") -> None:
+        """
+        Streams the catalog to a CSV file that PropertyGenerator.csv_file_to_properties and the catalog_path of a simulation can read.
+
+        Arguments:
+            - file_path: A string of the path to write to
+            - delimiter: A string of the delimiter between columns
+
+        Returns:
+            - None
+        """
+        with open(file_path, "w", encoding="utf-8") as csv_file:
+            for line in self.iter_csv_lines(delimiter):
+                csv_file.write(line + "\n")
+
+    def catalog(self) -> PropertyCatalog:
+        """
+        Returns the PropertyCatalog of the settings, making it the first time it is asked for in the process, straight from the entries without any CSV text.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A PropertyCatalog
+        """
+        key = ("synthetic", self.number_of_tiles, self.number_of_colours, self.seed, self.cost_distribution, self.min_cost, self.max_cost, self.hotel_cost_ratio, self.rent_ratio, self.chance_ratio)
+        return PropertyCatalog.cached(key, lambda: PropertyCatalog(self.iter_entries()))
@@ -0,0 +1,489 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import json
+
+from property import Property
+
+
+class GameEvent:
+    """
+    The base class of every event of a game, an event only holds plain values (seats, locations and amounts) so it can be written out and read back.
+    Every subclass names its type and its fields, which are turned into and read back from a dictionary in that order.
+    Players are named by their seat, the index of the player in seat order, like in GameSnapshot, so two players with the same name are never mixed up.
+
+    Attributes:
+        - TYPE: A string naming the type of event in the log
+        - FIELDS: A tuple of the names of the fields of the event
+        - turn: An integer of the turn the event happened in, stamped by the EventLog
+
+    Behaviours:
+        - to_dict: Returns the event as a dictionary that can be turned into JSON.
+        - from_dict: Builds the event of the right type back from a dictionary.
+    """
+
+    __slots__ = ("turn",)
+
+    TYPE = "event"
+    FIELDS = ()
+
+    def __init__(self, *values) -> None:
+        """
+        Constructor method for GameEvent class, the values are given in the order of FIELDS.
+
+        Arguments:
+            - values: The values of the fields of the event
+
+        Returns:
+            - None
+        """
+        self.turn = 0
+        for field, value in zip(self.FIELDS, values):
+            setattr(self, field, value)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the event as a dictionary that can be turned into JSON.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A dictionary of the turn, the type and every field of the event
+        """
+        event_dict = {"turn": self.turn, "type": self.TYPE}
+        for field in self.FIELDS:
+            event_dict[field] = getattr(self, field)
+        return event_dict
+
+    @staticmethod
+    def from_dict(event_dict: dict):
+        """
+        Builds the event of the right type back from a dictionary made by to_dict.
+
+        Arguments:
+            - event_dict: A dictionary of the turn, the type and every field of the event
+
+        Returns:
+            - An instance of the subclass of GameEvent named by the type
+        """
+        event_class = EVENT_TYPES[event_dict["type"]]
+        event = event_class(*[event_dict[field] for field in event_class.FIELDS])
+        event.turn = event_dict["turn"]
+        return event
+
+    def __repr__(self) -> str:
+        """
+        Returns the event as a string, to help with debugging.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A string of the type and fields of the event
+        """
+        return "{}({})".format(type(self).__name__, ", ".join("{}={!r}".format(field, getattr(self, field)) for field in ("turn",) + self.FIELDS))
+
+
+class GameStartEvent(GameEvent):
+    """
+    The board and the players at the start of a game, enough to rebuild the game without the catalog it was generated from.
+    tiles is a list of [x, y, property name, property cost, hotel cost, rent price, colour group] and players is a list of [name, symbol, move trait, x, y, fund].
+    """
+    __slots__ = ("tiles", "players")
+    TYPE = "game_start"
+    FIELDS = ("tiles", "players")
+
+
+class TurnEvent(GameEvent):
+    """A player starts their turn."""
+    __slots__ = ("player",)
+    TYPE = "turn"
+    FIELDS = ("player",)
+
+
+class MoveEvent(GameEvent):
+    """A player moves to a location."""
+    __slots__ = ("player", "location")
+    TYPE = "move"
+    FIELDS = ("player", "location")
+
+
+class PurchaseEvent(GameEvent):
+    """A player buys the property at a location from the bank for amount."""
+    __slots__ = ("player", "location", "amount")
+    TYPE = "purchase"
+    FIELDS = ("player", "location", "amount")
+
+
+class HotelEvent(GameEvent):
+    """A player builds a hotel on the property at a location for amount."""
+    __slots__ = ("player", "location", "amount")
+    TYPE = "hotel"
+    FIELDS = ("player", "location", "amount")
+
+
+class SaleEvent(GameEvent):
+    """A player sells the property at a location, and its hotels, back to the bank for amount."""
+    __slots__ = ("player", "location", "amount")
+    TYPE = "sale"
+    FIELDS = ("player", "location", "amount")
+
+
+class RentEvent(GameEvent):
+    """A player pays amount of rent to the owner of the property at a location."""
+    __slots__ = ("player", "owner", "location", "amount")
+    TYPE = "rent"
+    FIELDS = ("player", "owner", "location", "amount")
+
+
+class TransferEvent(GameEvent):
+    """A player who cannot pay the rent gives the property at a location, with its hotels, to the owner instead."""
+    __slots__ = ("player", "owner", "location")
+    TYPE = "transfer"
+    FIELDS = ("player", "owner", "location")
+
+
+class RewardEvent(GameEvent):
+    """A player lands on a Reward tile and gets amount."""
+    __slots__ = ("player", "amount")
+    TYPE = "reward"
+    FIELDS = ("player", "amount")
+
+
+class PenaltyEvent(GameEvent):
+    """A player lands on a Penalty tile and is fined amount."""
+    __slots__ = ("player", "amount")
+    TYPE = "penalty"
+    FIELDS = ("player", "amount")
+
+
+class QuitEvent(GameEvent):
+    """A player quits the game, after selling everything they own."""
+    __slots__ = ("player",)
+    TYPE = "quit"
+    FIELDS = ("player",)
+
+
+class WinEvent(GameEvent):
+    """A player wins the game."""
+    __slots__ = ("player",)
+    TYPE = "win"
+    FIELDS = ("player",)
+
+
+# Every type of event, looked up by the type written in the log
+EVENT_TYPES = {event_class.TYPE: event_class for event_class in (GameStartEvent, TurnEvent, MoveEvent, PurchaseEvent, HotelEvent, SaleEvent, RentEvent, TransferEvent, RewardEvent, PenaltyEvent, QuitEvent, WinEvent)}
+
+
+class EventLog:
+    """
+    A class that records the events of a game in an append-only log of newline-delimited JSON.
+    Events are kept in a buffer and written in one batch whenever it fills up, so recording an event during a turn costs a list append.
+
+    Attributes:
+        - DEFAULT_BUFFER_SIZE: An integer of how many events are buffered by default before they are written
+        - stream: The file-like object the events are written to, None to keep them in memory only
+        - owns_stream: A boolean of whether the log opened the stream itself and must close it
+        - buffer_size: An integer of how many events are buffered before they are written
+        - buffer: A list of the events not written yet
+        - events: A list of every event recorded, kept only when there is no stream
+        - turn: An integer of the turn stamped on the events recorded now
+        - seats: A dictionary whose key is a player and whose value is their seat, filled in by start_game
+
+    Behaviours:
+        - record: Stamps an event with the current turn and adds it to the buffer.
+        - start_game: Records the board and the players at the start of a game.
+        - seat_of: Returns the seat of a player, the events name players by it.
+        - start_turn: Moves the log on to a new turn and records it.
+        - flush: Writes every buffered event to the stream.
+        - close: Writes what is left and closes the stream if the log opened it.
+    """
+
+    DEFAULT_BUFFER_SIZE = 1024
+
+    def __init__(self, path_or_stream=None, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """
+        Constructor method for EventLog class.
+
+        Arguments:
+            - path_or_stream: A string of the path of the file to append to, an open file-like object, or None to keep the events in memory
+            - buffer_size: An integer of how many events are buffered before they are written
+
+        Returns:
+            - None
+        """
+        self.owns_stream = isinstance(path_or_stream, str)
+        self.stream = open(path_or_stream, "a", encoding="utf-8") if self.owns_stream else path_or_stream
+        self.buffer_size = buffer_size
+        self.buffer = list()
+        self.events = list()
+        self.turn = 0
+        self.seats = dict()
+
+    def record(self, event: GameEvent) -> None:
+        """
+        Stamps an event with the current turn and adds it to the buffer, writing the buffer out once it is full.
+
+        Arguments:
+            - event: A GameEvent
+
+        Returns:
+            - None
+        """
+        event.turn = self.turn
+        self.buffer.append(event)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def start_game(self, property_locations: dict, players: list) -> None:
+        """
+        Records the board and the players at the start of a game, and attaches the log to every player so they record what they do.
+
+        Arguments:
+            - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+            - players: A list of the players in seat order
+
+        Returns:
+            - None
+        """
+        tiles = [[x, y, property.get_property_name(), property.get_property_cost(), property.get_hotel_cost(), property.get_rent_price(), property.get_colour_group()] for (x, y), property in property_locations.items()]
+        player_rows = [[player.get_name(), player.get_symbol(), player.get_move_trait(), player.get_position()[0], player.get_position()[1], player.get_fund()] for player in players]
+        self.record(GameStartEvent(tiles, player_rows))
+
+        for seat, player in enumerate(players):
+            self.seats[player] = seat
+            player.set_event_log(self)
+
+    def seat_of(self, player) -> int:
+        """
+        Returns the seat of a player, the events name players by it.
+
+        Arguments:
+            - player: A player of the game started with start_game
+
+        Returns:
+            - An integer of the index of the player in seat order
+        """
+        return self.seats[player]
+
+    def start_turn(self, turn: int, player) -> None:
+        """
+        Moves the log on to a new turn and records that it is the turn of a player.
+
+        Arguments:
+            - turn: An integer of the turn, counting from 1
+            - player: The player whose turn it is
+
+        Returns:
+            - None
+        """
+        self.turn = turn
+        self.record(TurnEvent(self.seat_of(player)))
+
+    def flush(self) -> None:
+        """
+        Writes every buffered event to the stream as one line of JSON per event, in a single write.
+
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        if not self.buffer:
+            return
+        if self.stream is None:
+            self.events.extend(self.buffer)
+        else:
+            self.stream.write("".join(json.dumps(event.to_dict(), separators=(",", ":")) + "\n" for event in self.buffer))
+            self.stream.flush()
+        self.buffer = list()
+
+    def close(self) -> None:
+        """
+        Writes every event left in the buffer and closes the stream if the log opened it.
+
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        self.flush()
+        if self.owns_stream:
+            self.stream.close()
+
+
+def read_events(lines):
+    """
+    Reads the events of a log back, one line of JSON at a time.
+
+    Arguments:
+        - lines: An iterable of lines, like an open log file
+
+    Returns:
+        - A generator of GameEvent
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield GameEvent.from_dict(json.loads(line))
+
+
+class EventReplayer:
+    """
+    A class that rebuilds the board and the players of a game from its event log, without running the game or the AI again.
+    Every event is applied straight to the state: purchases, hotels, sales, rent and transfers move the properties and the money exactly the way the log says they moved.
+    Players are matched by their seat, so players who share a name are kept apart.
+
+    Attributes:
+        - property_locations: A dictionary whose key is a location and whose value is the rebuilt Property, filled in by the game_start event
+        - players: A list of the rebuilt players in seat order
+        - turn: An integer of the turn of the last event applied
+        - winner: An integer of the seat of the player who won, None if nobody has yet
+        - quitters: A list of the seats of the players who quit
+
+    Behaviours:
+        - replay: Applies the events of a log up to a turn.
+        - apply: Applies one event to the state.
+        - give_property: Moves a property from its owner to another player.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method for EventReplayer class.
+
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        self.property_locations = dict()
+        self.players = list()
+        self.turn = 0
+        self.winner = None
+        self.quitters = list()
+
+    def replay(self, events, until_turn: int = None):
+        """
+        Applies the events of a log, in order, up to and including a turn.
+
+        Arguments:
+            - events: An iterable of GameEvent, like read_events of an open log file
+            - until_turn: An integer of the last turn to apply, None to apply the whole log
+
+        Returns:
+            - self, so the state can be read straight off the call
+        """
+        for event in events:
+            if until_turn is not None and event.turn > until_turn:
+                break
+            self.apply(event)
+        return self
+
+    def apply(self, event: GameEvent) -> None:
+        """
+        Applies one event to the state.
+
+        Arguments:
+            - event: A GameEvent
+
+        Returns:
+            - None
+        """
+        self.turn = event.turn
+        event_type = event.TYPE
+
+        if event_type == GameStartEvent.TYPE:
+            # Player records its events into this module, so it can only be imported once both are loaded
+            from player import Player
+
+            # The chance tiles are shared between every location they are at, just like PropertyGenerator does it
+            chance_tiles = dict()
+            for x, y, name, property_cost, hotel_cost, rent_price, colour in event.tiles:
+                if colour is None:
+                    property = chance_tiles.setdefault(name, Property(name, None, None, None, None))
+                else:
+                    property = Property(name, property_cost, hotel_cost, rent_price, colour)
+                    property.set_location((x, y))
+                self.property_locations[(x, y)] = property
+
+            for name, symbol, move_trait, x, y, fund in event.players:
+                player = Player()
+                player.set_name(name)
+                player.set_symbol(symbol)
+                player.set_move_trait(move_trait)
+                player.set_position((x, y))
+                player.set_fund(fund)
+                self.players.append(player)
+            return
+
+        if event_type == TurnEvent.TYPE:
+            return
+
+        player = self.players[event.player]
+
+        if event_type == MoveEvent.TYPE:
+            player.set_position(tuple(event.location))
+
+        elif event_type == PurchaseEvent.TYPE:
+            property = self.property_locations[tuple(event.location)]
+            player.reduce_fund(event.amount)
+            self.give_property(property, player)
+
+        elif event_type == HotelEvent.TYPE:
+            # Count a first hotel the way building it does, so the property keeps its place among those of its colour
+            property = self.property_locations[tuple(event.location)]
+            player.reduce_fund(event.amount)
+            property.set_hotels_built(property.get_hotels_built() + 1)
+            player.track_hotel(property)
+
+        elif event_type == SaleEvent.TYPE:
+            property = self.property_locations[tuple(event.location)]
+            player.add_fund(event.amount)
+            player.untrack_property(property)
+            del player.properties_owned[property]
+            property.set_owner(Property.ORIGINAL_OWNER)
+            property.set_hotels_built(0)
+
+        elif event_type == RentEvent.TYPE:
+            player.reduce_fund(event.amount)
+            self.players[event.owner].add_fund(event.amount)
+
+        elif event_type == TransferEvent.TYPE:
+            self.give_property(self.property_locations[tuple(event.location)], self.players[event.owner])
+
+        elif event_type == RewardEvent.TYPE:
+            player.add_fund(event.amount)
+
+        elif event_type == PenaltyEvent.TYPE:
+            player.reduce_fund(event.amount)
+
+        elif event_type == QuitEvent.TYPE:
+            self.quitters.append(event.player)
+
+        elif event_type == WinEvent.TYPE:
+            self.winner = event.player
+
+    def give_property(self, property: Property, new_owner) -> None:
+        """
+        Moves a property, with its hotels, from its owner to another player, the bank included.
+
+        Arguments:
+            - property: The Property to move
+            - new_owner: The Player who gets it
+
+        Returns:
+            - None
+        """
+        old_owner = property.get_owner()
+        if old_owner != Property.ORIGINAL_OWNER:
+            old_owner.untrack_property(property)
+            del old_owner.properties_owned[property]
+
+        property.set_owner(new_owner)
+        new_owner.properties_owned[property] = None
+        new_owner.track_property(property)
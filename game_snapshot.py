@@ -0,0 +1,207 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import random
+import struct
+from array import array
+
+from property import Property
+from ai_player import AIPlayer
+
+
+class GameSnapshot:
+    """
+    A class that saves the state of a game into a compact binary format and restores it, so long simulations can be checkpointed and games can be forked from the middle.
+
+    Only what changes during a game is saved, the layout of the board and the roster are taken from the game the snapshot is restored into, which must be set up the same way (the same seed or the same catalog and layout).
+    Properties and players are saved as integer ids instead of object references: a property is its position among the distinct properties of the board in board order, and a player is its seat in the list of players.
+
+    The format is, with struct fields in little-endian order and arrays in the byte order of the machine:
+        - A header of MAGIC, VERSION, flags, the number of properties, the number of players and the turn count
+        - One array per property field: the owner id (-1 for the bank), the hotels built and the rent price
+        - Per player: fund, position, AI flag, the ids of the properties owned in the order they were acquired, and for an AIPlayer its first_run, target and previous_moves
+        - If flags has RNG_FLAG, the state of the game's random.Random
+
+    Attributes:
+        - MAGIC: Bytes every snapshot starts with
+        - VERSION: An integer of the version of the format
+        - RNG_FLAG: An integer flag set when the state of the random number generator is saved
+        - BANK_ID: An integer saved as the owner of a property owned by the bank
+        - TARGET_COMMANDS: A tuple of the commands an AIPlayer target can hold, saved as their index
+        - HEADER, PLAYER, AI_PLAYER, RNG_STATE: struct.Struct instances of the fixed-size parts of the format
+        - RNG_WORDS: An integer of the number of words in the state of the Mersenne Twister
+
+    Behaviours:
+        - board_properties: Returns the distinct properties of a board in board order, the index of a property is its id.
+        - save: Saves the state of a game into bytes.
+        - restore: Restores the state of a game from bytes.
+    """
+
+    MAGIC = b"PPSN"
+    VERSION = 1
+
+    RNG_FLAG = 1
+
+    BANK_ID = -1
+
+    # Index 0 is the (-1,-1) target an AIPlayer starts with, which holds no command
+    TARGET_COMMANDS = (None, "BUY", "BUILD", "SELL", "GOTO")
+
+    # magic, version, flags, number of properties, number of players, turn count
+    HEADER = struct.Struct("<4sBBIHI")
+
+    # fund, x, y, is AI, number of properties owned
+    PLAYER = struct.Struct("<qiiBI")
+
+    # first_run, target command, target x, target y, number of previous moves
+    AI_PLAYER = struct.Struct("<BBiiB")
+
+    # version of the state, whether gauss_next is set, gauss_next, then the 625 words of the Mersenne Twister follow as an array
+    RNG_STATE = struct.Struct("<BBd")
+
+    # The number of words in the state of the Mersenne Twister
+    RNG_WORDS = 625
+
+    @staticmethod
+    def board_properties(property_locations: dict) -> list:
+        """
+        Returns the distinct properties of a board in board order, leaving out the chance tiles, the index of a property in this list is its id.
+
+        Arguments:
+            - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+
+        Returns:
+            - A list of properties
+        """
+        return [property for property in dict.fromkeys(property_locations.values()) if property.get_colour_group() is not None]
+
+    @staticmethod
+    def save(property_locations: dict, players: list, turn_count: int = 0, rng: random.Random = None) -> bytes:
+        """
+        Saves the state of a game into bytes.
+
+        Arguments:
+            - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+            - players: A list of the players in seat order
+            - turn_count: An integer of the number of turns played so far
+            - rng: The random.Random of the game, None to leave it out
+
+        Returns:
+            - A bytes object of the snapshot
+        """
+        properties = GameSnapshot.board_properties(property_locations)
+        property_ids = {property: property_id for property_id, property in enumerate(properties)}
+        player_ids = {player: player_id for player_id, player in enumerate(players)}
+
+        save_rng = isinstance(rng, random.Random)
+        parts = [GameSnapshot.HEADER.pack(GameSnapshot.MAGIC, GameSnapshot.VERSION, GameSnapshot.RNG_FLAG if save_rng else 0, len(properties), len(players), turn_count)]
+
+        # Save every field of the properties as one array, which packs them all in a single call
+        owners = array("i", [GameSnapshot.BANK_ID if property.get_owner() == Property.ORIGINAL_OWNER else player_ids[property.get_owner()] for property in properties])
+        hotels = array("B", [property.get_hotels_built() for property in properties])
+        rents = array("i", [property.get_rent_price() for property in properties])
+        parts.extend((owners.tobytes(), hotels.tobytes(), rents.tobytes()))
+
+        for player in players:
+            owned = array("I", [property_ids[property] for property in player.properties_owned])
+            x, y = player.get_position()
+            is_ai = isinstance(player, AIPlayer)
+            parts.append(GameSnapshot.PLAYER.pack(player.get_fund(), x, y, is_ai, len(owned)))
+            parts.append(owned.tobytes())
+
+            if is_ai:
+                # The target is a (command, location) tuple, or (-1,-1) before the first decision
+                if player.target[0] in GameSnapshot.TARGET_COMMANDS[1:]:
+                    command = GameSnapshot.TARGET_COMMANDS.index(player.target[0])
+                    target_x, target_y = player.target[1]
+                else:
+                    command, target_x, target_y = 0, -1, -1
+
+                previous_moves = array("i", [coordinate for move in player.previous_moves for coordinate in move])
+                parts.append(GameSnapshot.AI_PLAYER.pack(player.first_run, command, target_x, target_y, len(player.previous_moves)))
+                parts.append(previous_moves.tobytes())
+
+        if save_rng:
+            state_version, words, gauss_next = rng.getstate()
+            parts.append(GameSnapshot.RNG_STATE.pack(state_version, gauss_next is not None, gauss_next or 0.0))
+            parts.append(array("I", words).tobytes())
+
+        return b"".join(parts)
+
+    @staticmethod
+    def restore(data: bytes, property_locations: dict, players: list, rng: random.Random = None) -> int:
+        """
+        Restores the state of a game from bytes, into a game set up with the same board and roster as the one that was saved.
+        Properties are only changed through their setters when they differ from the snapshot, so observers like the market index stay in sync.
+
+        Arguments:
+            - data: A bytes object made by save
+            - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+            - players: A list of the players in seat order
+            - rng: The random.Random of the game, its state is restored if the snapshot has one
+
+        Returns:
+            - turn_count: An integer of the number of turns played when the snapshot was saved
+        """
+        magic, version, flags, number_of_properties, number_of_players, turn_count = GameSnapshot.HEADER.unpack_from(data, 0)
+        if magic != GameSnapshot.MAGIC or version != GameSnapshot.VERSION:
+            raise ValueError("This is not a version {} PyPoly snapshot.".format(GameSnapshot.VERSION))
+
+        properties = GameSnapshot.board_properties(property_locations)
+        if number_of_properties != len(properties) or number_of_players != len(players):
+            raise ValueError("The snapshot was saved from a game with {} properties and {} players, not {} and {}.".format(number_of_properties, number_of_players, len(properties), len(players)))
+
+        offset = GameSnapshot.HEADER.size
+
+        # Read the arrays of property fields back
+        owners = array("i")
+        owners.frombytes(data[offset:offset + 4 * number_of_properties])
+        offset += 4 * number_of_properties
+        hotels = array("B")
+        hotels.frombytes(data[offset:offset + number_of_properties])
+        offset += number_of_properties
+        rents = array("i")
+        rents.frombytes(data[offset:offset + 4 * number_of_properties])
+        offset += 4 * number_of_properties
+
+        for property, owner_id, hotels_built, rent_price in zip(properties, owners, hotels, rents):
+            owner = Property.ORIGINAL_OWNER if owner_id == GameSnapshot.BANK_ID else players[owner_id]
+            if property.get_owner() is not owner:
+                property.set_owner(owner)
+            if property.get_hotels_built() != hotels_built:
+                property.set_hotels_built(hotels_built)
+            if property.get_rent_price() != rent_price:
+                property.set_rent_price(rent_price)
+
+        for player in players:
+            fund, x, y, is_ai, number_owned = GameSnapshot.PLAYER.unpack_from(data, offset)
+            offset += GameSnapshot.PLAYER.size
+            owned = array("I")
+            owned.frombytes(data[offset:offset + 4 * number_owned])
+            offset += 4 * number_owned
+
+            player.set_fund(fund)
+            player.set_position((x, y))
+            player.set_properties_owned([properties[property_id] for property_id in owned])
+
+            if is_ai:
+                first_run, command, target_x, target_y, number_of_moves = GameSnapshot.AI_PLAYER.unpack_from(data, offset)
+                offset += GameSnapshot.AI_PLAYER.size
+                coordinates = array("i")
+                coordinates.frombytes(data[offset:offset + 8 * number_of_moves])
+                offset += 8 * number_of_moves
+
+                player.first_run = bool(first_run)
+                player.target = (GameSnapshot.TARGET_COMMANDS[command], (target_x, target_y)) if command != 0 else (-1,-1)
+                player.previous_moves = [(coordinates[index], coordinates[index + 1]) for index in range(0, len(coordinates), 2)]
+                player.evaluation_cache.clear()
+
+        if flags & GameSnapshot.RNG_FLAG and rng is not None:
+            state_version, has_gauss_next, gauss_next = GameSnapshot.RNG_STATE.unpack_from(data, offset)
+            offset += GameSnapshot.RNG_STATE.size
+            words = array("I")
+            words.frombytes(data[offset:offset + 4 * GameSnapshot.RNG_WORDS])
+            rng.setstate((state_version, tuple(words), gauss_next if has_gauss_next else None))
+
+        return turn_count
@@ -0,0 +1,268 @@
+# Authors:
+# Team:
+# Date Edited:
+
+from property import Property
+from ai_player import AIPlayer
+from game_snapshot import GameSnapshot
+
+
+class BoardTracker:
+    """
+    A class that watches the properties of one board and remembers which of them have changed, so a GameState can be read off the board or written into it by only looking at the tiles that changed.
+
+    Attributes:
+        - properties: A list of the distinct properties of the board in board order, leaving out the chance tiles, the index of a property is its id like in GameSnapshot
+        - property_ids: A dictionary whose key is a property and whose value is its id
+        - dirty: A set of the ids of the properties that changed since the board last matched state
+        - state: The GameState the board matched when it was last captured, updated or applied, None before that
+
+    Behaviours:
+        - property_changed: Remembers that a property has changed.
+    """
+
+    __slots__ = ("properties", "property_ids", "dirty", "state")
+
+    def __init__(self, property_locations: dict) -> None:
+        """
+        Constructor method for BoardTracker class, it starts observing every property on the board.
+
+        Arguments:
+            - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+
+        Returns:
+            - None
+        """
+        self.properties = GameSnapshot.board_properties(property_locations)
+        self.property_ids = {property: property_id for property_id, property in enumerate(self.properties)}
+        self.dirty = set()
+        self.state = None
+
+        for property in self.properties:
+            property.add_observer(self)
+
+    def property_changed(self, property) -> None:
+        """
+        Remembers that a property has changed, it is called by the property itself.
+
+        Arguments:
+            - property: The Property that changed
+
+        Returns:
+            - None
+        """
+        self.dirty.add(self.property_ids[property])
+
+
+class GameState:
+    """
+    A class holding the state of a game, the board and the players, as plain values so that it can be cloned thousands of times per decision by search and rollout AIs.
+
+    The tiles are kept copy-on-write: every GameState of a game shares one base, the owner, hotels and rent of every tile when the game was first captured, and only keeps its own copy of the tiles that differ from it.
+    Cloning copies those changed tiles and one small tuple per player, so it costs O(changed tiles) instead of walking every Property and, through the owners, every Player the way copy.deepcopy of the board would.
+    Writing a state into a board with apply only touches the tiles that changed on the board or between the two states, which is what makes replaying many rollouts from one position cheap.
+
+    Owners are saved as the seat of the player, or GameSnapshot.BANK_ID for the bank, and properties by their id, like in GameSnapshot.
+
+    Attributes:
+        - base: A tuple of (owners, hotels, rents) tuples of every tile when the game was first captured, shared by every state of the game
+        - tiles: A dictionary whose key is the id of a tile that differs from base and whose value is its (owner, hotels, rent)
+        - players: A tuple with a (fund, position, owned, plan) tuple per seat, owned is a tuple of the ids of the properties in the order they were acquired and plan is (first_run, target, previous_moves) for an AIPlayer, else None
+
+    Behaviours:
+        - capture: Reads the state of a game off its board.
+        - clone: Returns a copy of the state that can be changed without changing this one.
+        - update: Returns the state of the game now, reading only the tiles that changed since this state.
+        - get_tile: Returns the owner, hotels and rent of a tile.
+        - set_tile: Changes the owner, hotels and rent of a tile.
+        - apply: Writes the state into a board set up with the same layout and roster.
+    """
+
+    __slots__ = ("base", "tiles", "players")
+
+    def __init__(self, base: tuple, tiles: dict, players: tuple) -> None:
+        """
+        Constructor method for GameState class, use capture to read a state off a game.
+
+        Arguments:
+            - base: A tuple of (owners, hotels, rents) tuples shared by every state of the game
+            - tiles: A dictionary of the tiles that differ from base
+            - players: A tuple with a (fund, position, owned, plan) tuple per seat
+
+        Returns:
+            - None
+        """
+        self.base = base
+        self.tiles = tiles
+        self.players = players
+
+    @staticmethod
+    def read_tile(property: Property, seats: dict) -> tuple:
+        """
+        Returns the owner, hotels and rent of a property as they are saved in a state.
+
+        Arguments:
+            - property: The Property to read
+            - seats: A dictionary whose key is a player and whose value is their seat
+
+        Returns:
+            - A tuple of (owner, hotels, rent)
+        """
+        owner = property.get_owner()
+        return (GameSnapshot.BANK_ID if owner == Property.ORIGINAL_OWNER else seats[owner], property.get_hotels_built(), property.get_rent_price())
+
+    @staticmethod
+    def read_players(tracker: BoardTracker, players: list) -> tuple:
+        """
+        Returns the state of every player, it costs as much as the properties they own and not the board.
+
+        Arguments:
+            - tracker: The BoardTracker of the board the players play on
+            - players: A list of the players in seat order
+
+        Returns:
+            - A tuple with a (fund, position, owned, plan) tuple per seat
+        """
+        states = []
+        for player in players:
+            owned = tuple(tracker.property_ids[property] for property in player.properties_owned)
+            plan = (player.first_run, player.target, tuple(player.previous_moves)) if isinstance(player, AIPlayer) else None
+            states.append((player.get_fund(), player.get_position(), owned, plan))
+        return tuple(states)
+
+    @staticmethod
+    def capture(tracker: BoardTracker, players: list) -> "GameState":
+        """
+        Reads the state of a game off its board, this reads every tile and is only needed once per game, after that update only reads what has changed.
+
+        Arguments:
+            - tracker: The BoardTracker of the board of the game
+            - players: A list of the players in seat order
+
+        Returns:
+            - A GameState of the game
+        """
+        seats = {player: seat for seat, player in enumerate(players)}
+        rows = [GameState.read_tile(property, seats) for property in tracker.properties]
+        base = tuple(zip(*rows)) if len(rows) > 0 else ((), (), ())
+
+        state = GameState(base, dict(), GameState.read_players(tracker, players))
+        tracker.dirty.clear()
+        tracker.state = state
+        return state
+
+    def clone(self) -> "GameState":
+        """
+        Returns a copy of the state that can be changed without changing this one, it shares the base and copies only the tiles that differ from it.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A GameState
+        """
+        return GameState(self.base, dict(self.tiles), self.players)
+
+    def update(self, tracker: BoardTracker, players: list) -> "GameState":
+        """
+        Returns the state of the game now, as a clone of this state with only the tiles that changed since it was read off the board read again.
+        The board must have matched this state when it was captured, updated or applied last, otherwise it is read whole.
+
+        Arguments:
+            - tracker: The BoardTracker of the board of the game
+            - players: A list of the players in seat order
+
+        Returns:
+            - A GameState of the game
+        """
+        if tracker.state is not self:
+            return GameState.capture(tracker, players)
+
+        seats = {player: seat for seat, player in enumerate(players)}
+        state = self.clone()
+        for property_id in tracker.dirty:
+            state.set_tile(property_id, *GameState.read_tile(tracker.properties[property_id], seats))
+        state.players = GameState.read_players(tracker, players)
+
+        tracker.dirty.clear()
+        tracker.state = state
+        return state
+
+    def get_tile(self, property_id: int) -> tuple:
+        """
+        Returns the owner, hotels and rent of a tile.
+
+        Arguments:
+            - property_id: An integer of the id of the property
+
+        Returns:
+            - A tuple of (owner, hotels, rent)
+        """
+        tile = self.tiles.get(property_id)
+        if tile is not None:
+            return tile
+        owners, hotels, rents = self.base
+        return (owners[property_id], hotels[property_id], rents[property_id])
+
+    def set_tile(self, property_id: int, owner: int, hotels: int, rent: int) -> None:
+        """
+        Changes the owner, hotels and rent of a tile, a tile set back to its base is forgotten so clones stay small.
+        A state that a board has been captured, updated or applied from is what the board is compared against, so clone it before changing it.
+
+        Arguments:
+            - property_id: An integer of the id of the property
+            - owner: An integer of the seat of the owner, GameSnapshot.BANK_ID for the bank
+            - hotels: An integer of the number of hotels built
+            - rent: An integer of the rent price
+
+        Returns:
+            - None
+        """
+        owners, hotels_built, rents = self.base
+        if owners[property_id] == owner and hotels_built[property_id] == hotels and rents[property_id] == rent:
+            self.tiles.pop(property_id, None)
+        else:
+            self.tiles[property_id] = (owner, hotels, rent)
+
+    def apply(self, tracker: BoardTracker, players: list) -> None:
+        """
+        Writes the state into a board set up with the same layout and roster, like a copy of the board in a worker.
+        Only the tiles that changed on the board since it last matched a state, or that differ between that state and this one, are looked at, and properties are only changed through their setters so observers stay in sync.
+
+        Arguments:
+            - tracker: The BoardTracker of the board to write into
+            - players: A list of the players of that board in seat order
+
+        Returns:
+            - None
+        """
+        known = tracker.state
+        if known is None or known.base is not self.base:
+            property_ids = range(len(tracker.properties))
+        else:
+            property_ids = tracker.dirty.union(known.tiles, self.tiles)
+
+        for property_id in property_ids:
+            property = tracker.properties[property_id]
+            owner_id, hotels_built, rent_price = self.get_tile(property_id)
+            owner = Property.ORIGINAL_OWNER if owner_id == GameSnapshot.BANK_ID else players[owner_id]
+            if property.get_owner() is not owner:
+                property.set_owner(owner)
+            if property.get_hotels_built() != hotels_built:
+                property.set_hotels_built(hotels_built)
+            if property.get_rent_price() != rent_price:
+                property.set_rent_price(rent_price)
+
+        for player, (fund, position, owned, plan) in zip(players, self.players):
+            player.set_fund(fund)
+            player.set_position(position)
+            player.set_properties_owned([tracker.properties[property_id] for property_id in owned])
+
+            if plan is not None:
+                player.first_run, player.target, previous_moves = plan
+                player.previous_moves = list(previous_moves)
+                player.evaluation_cache.clear()
+
+        # The setters above told the tracker about the tiles they changed, but the board matches this state now
+        tracker.dirty.clear()
+        tracker.state = self
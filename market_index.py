@@ -0,0 +1,230 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import heapq
+from property import Property
+
+
+class MarketIndex:
+    """
+    A class that keeps, for one board, the properties still owned by the bank in a heap per colour group ordered by property cost, so every AIPlayer on the board can share it.
+    It observes every property, so purchases and sales update it as they happen instead of the board being sorted and scanned again.
+
+    Sold properties are not taken out of their heap straight away, they are thrown away when they reach the top of it (lazy deletion), and a property that goes back to the bank is only pushed again if it is not still sitting in its heap.
+
+    Attributes:
+        - NOT_WINNABLE: An integer returned as the cost of a colour group that cannot be completed anymore, larger than any real cost
+        - colours: A list of the colour groups of the board, in the order of the catalog that was loaded, the index of a colour group in this list is its colour id
+        - colour_ids: A dictionary whose key is a colour group and whose value is its colour id
+        - heaps: A list indexed by colour id of the heap of (property cost, board order, property) of every colour group
+        - board_order: A dictionary whose key is a property and whose value is its position on the board, used to break ties in cost the way a stable sort would
+        - listed: A set of the properties that have an entry in their heap, even if it is out of date
+        - bank_owned: A set of the properties the bank owns right now
+        - bank_owned_counts: A list indexed by colour id of the number of properties of every colour group owned by the bank
+        - completion_costs: A list indexed by colour id of a dictionary per colour group of the costs to complete it already worked out, keyed by the number of properties needed, it is emptied whenever a property of the colour group changes hands
+
+    Behaviours:
+        - get_colours: Returns the colour groups of the board.
+        - get_colour_id: Returns the colour id of a colour group.
+        - add_colour: Gives a colour group the next colour id and an empty heap.
+        - property_changed: Puts a property that has just gone back to the bank in its heap again and keeps the counts up to date.
+        - clean_top: Throws away the entries at the top of a heap that are no longer owned by the bank.
+        - cheapest_buyable: Returns the cheapest property still owned by the bank in a colour group.
+        - cost_to_complete: Returns the cost of buying and building a hotel on the cheapest properties a player still needs in a colour group.
+    """
+
+    # The cost reported for a colour group that cannot be completed, same as AIPlayer.calculate used to report
+    NOT_WINNABLE = 999999
+
+    def __init__(self, property_locations: dict, colours: list = None) -> None:
+        """
+        Constructor method for MarketIndex class, it lists every property owned by the bank and starts observing every property on the board.
+
+        Arguments:
+            - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+            - colours: A list of the colour groups of the catalog that was loaded, like PropertyGenerator.get_colours, None to number the colour groups in the order they are found on the board
+
+        Returns:
+            - None
+        """
+        self.colours = list()
+        self.colour_ids = dict()
+        self.heaps = list()
+        self.board_order = dict()
+        self.listed = set()
+        self.bank_owned = set()
+        self.bank_owned_counts = list()
+        self.completion_costs = list()
+
+        # The colour groups of the catalog come first so colour ids do not depend on the layout, any the catalog did not list follow in board order
+        for colour in colours or ():
+            if colour is not None and colour not in self.colour_ids:
+                self.add_colour(colour)
+
+        for order, property in enumerate(property_locations.values()):
+
+            # Chance tiles have no colour group and can never be bought
+            colour = property.get_colour_group()
+            if colour is None or property in self.board_order:
+                continue
+
+            if colour not in self.colour_ids:
+                self.add_colour(colour)
+            colour_id = self.colour_ids[colour]
+
+            self.board_order[property] = order
+            if property.get_owner() == Property.ORIGINAL_OWNER:
+                self.heaps[colour_id].append((property.get_property_cost(), order, property))
+                self.listed.add(property)
+                self.bank_owned.add(property)
+                self.bank_owned_counts[colour_id] += 1
+
+            # Hear about every later purchase and sale of the property
+            property.add_observer(self)
+
+        # Turn every list into a heap in one go instead of pushing one property at a time
+        for heap in self.heaps:
+            heapq.heapify(heap)
+
+    def get_colours(self) -> list[str]:
+        """
+        Getter method for variable colours.
+
+        Arguments:
+            - None
+
+        Returns:
+            - colours: A list of the colour groups of the board, the index of a colour group is its colour id
+        """
+        return self.colours
+
+    def get_colour_id(self, colour: str) -> int:
+        """
+        Returns the colour id of a colour group, its index in colours.
+
+        Arguments:
+            - colour: A string of the colour group
+
+        Returns:
+            - An integer of the colour id
+        """
+        return self.colour_ids[colour]
+
+    def add_colour(self, colour: str) -> None:
+        """
+        Gives a colour group the next colour id and an empty heap.
+
+        Arguments:
+            - colour: A string of the colour group
+
+        Returns:
+            - None
+        """
+        self.colour_ids[colour] = len(self.colours)
+        self.colours.append(colour)
+        self.heaps.append(list())
+        self.bank_owned_counts.append(0)
+        self.completion_costs.append(dict())
+
+    def property_changed(self, property: Property) -> None:
+        """
+        Keeps the index up to date when the owner of a property changes, it is called by the property itself.
+
+        Arguments:
+            - property: The Property that changed
+
+        Returns:
+            - None
+        """
+        bank_owned = property.get_owner() == Property.ORIGINAL_OWNER
+
+        # Hotel and rent changes do not matter here, only a property moving between the bank and a player does
+        if bank_owned == (property in self.bank_owned):
+            return
+
+        # The costs to complete this colour group are out of date now
+        colour_id = self.colour_ids[property.get_colour_group()]
+        self.completion_costs[colour_id].clear()
+
+        if bank_owned:
+            self.bank_owned.add(property)
+            self.bank_owned_counts[colour_id] += 1
+
+            # Only push the property again if its old entry has already been thrown away
+            if property not in self.listed:
+                heapq.heappush(self.heaps[colour_id], (property.get_property_cost(), self.board_order[property], property))
+                self.listed.add(property)
+        else:
+            self.bank_owned.discard(property)
+            self.bank_owned_counts[colour_id] -= 1
+
+    def clean_top(self, colour_id: int) -> list:
+        """
+        Throws away the entries at the top of the heap of a colour group that are no longer owned by the bank.
+
+        Arguments:
+            - colour_id: An integer of the colour id of the colour group
+
+        Returns:
+            - heap: The heap of the colour group, with a property owned by the bank at the top if there is one
+        """
+        heap = self.heaps[colour_id]
+        while heap and heap[0][2] not in self.bank_owned:
+            self.listed.discard(heapq.heappop(heap)[2])
+        return heap
+
+    def cheapest_buyable(self, colour: str):
+        """
+        Returns the cheapest property still owned by the bank in a colour group, ties go to the property found first on the board.
+
+        Arguments:
+            - colour: A string of the colour group
+
+        Returns:
+            - A Property, or None if the bank owns nothing in this colour group
+        """
+        colour_id = self.colour_ids.get(colour)
+        if colour_id is None:
+            return None
+        heap = self.clean_top(colour_id)
+        return heap[0][2] if heap else None
+
+    def cost_to_complete(self, colour: str, owned_count: int, winning_condition: int) -> int:
+        """
+        Returns the cost of buying, and building a hotel on, the cheapest properties a player still needs in a colour group to reach the winning condition.
+
+        Arguments:
+            - colour: A string of the colour group
+            - owned_count: An integer of how many properties of this colour group the player already owns
+            - winning_condition: The properties needed to win the game in integer
+
+        Returns:
+            - winning_cost: An integer of the cost, or NOT_WINNABLE if the bank does not have enough properties left
+        """
+        needed = winning_condition - owned_count
+        if needed <= 0:
+            return 0
+        colour_id = self.colour_ids.get(colour)
+        if colour_id is None or self.bank_owned_counts[colour_id] < needed:
+            return MarketIndex.NOT_WINNABLE
+
+        # Every player that needs the same number of properties gets the same answer until the colour group changes hands again
+        completion_costs = self.completion_costs[colour_id]
+        if needed in completion_costs:
+            return completion_costs[needed]
+
+        # Pop the properties needed off the top, throwing away the ones sold on the way, then push them back
+        heap = self.heaps[colour_id]
+        taken = list()
+        winning_cost = 0
+        while len(taken) < needed:
+            entry = heapq.heappop(self.clean_top(colour_id))
+            winning_cost += entry[0] + entry[2].get_hotel_cost()
+            taken.append(entry)
+        for entry in taken:
+            heapq.heappush(heap, entry)
+
+        completion_costs[needed] = winning_cost
+
+        return winning_cost
@@ -0,0 +1,333 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import itertools
+import math
+import pickle
+import random
+
+from move_graph import MoveGraph
+from ai_player import AIPlayer
+from game_state import BoardTracker, GameState
+from ai_decision_pool import board_layout, worker_board
+
+
+# Numbers the layouts of every MonteCarloAIPlayer, ids can be reused by a later game so they cannot name a layout
+LAYOUT_NUMBERS = itertools.count(1)
+
+
+def rollout_turn(player, move_trait: str, property_locations: dict, row_size: int, winning_condition: int, rng: random.Random) -> bool:
+    """
+    Plays one fast turn of a rollout the way PyPolySimulator plays it: an AIPlayer follows its own plan and buys or builds when it reaches its target, any other player takes a random move and buys or builds whenever it can afford it.
+
+    Arguments:
+    - player: The player whose turn it is, on a board of the rollout
+    - move_trait: A string of the move trait of the player
+    - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+    - row_size: An integer of the number of horizontal and vertical grids
+    - winning_condition: An integer of the number of properties needed to win
+    - rng: The random.Random of the rollout
+
+    Returns:
+    - A boolean that is True if the player has won with this turn
+    """
+    moves = MoveGraph.get_move_table(move_trait, row_size)[player.get_position()]
+    if len(moves) == 0:
+        return False
+
+    if isinstance(player, AIPlayer):
+        move = player.ai_move(moves, property_locations)
+        player.set_position(move)
+        player.determine_action(property_locations)
+        if player.target[1] == move:
+            player.buy_or_build(move, property_locations)
+        return player.check_win(winning_condition)
+
+    move = rng.choice(moves)
+    player.set_position(move)
+    if player.determine_action(property_locations):
+        property = property_locations[move]
+        if property.get_owner() == "Bank":
+            if player.get_fund() >= property.get_property_cost():
+                player.purchase_property(property)
+        elif property.get_hotels_built() != 2 and player.get_fund() >= property.get_hotel_cost():
+            player.purchase_hotel(property)
+    return player.check_win(winning_condition)
+
+
+def colour_progress(player, winning_condition: int) -> float:
+    """
+    Returns how close the best colour group of a player is to winning, from 0 to 1, owning a property of the colour is half way to counting it and building a hotel on it is the other half.
+
+    Arguments:
+    - player: The player, on a board of the rollout
+    - winning_condition: An integer of the number of properties needed to win
+
+    Returns:
+    - A float between 0 and 1
+    """
+    best = 0
+    for colour, owned in player.colour_counts.items():
+        best = max(best, owned + player.colour_hotel_counts.get(colour, 0))
+    return min(best / (2 * winning_condition), 1.0)
+
+
+def rollout_score(players: list, seat: int, winning_condition: int) -> float:
+    """
+    Scores the end of a rollout that nobody won for the player in a seat, from 0 to 1: a quarter is their share of the worth on the board and the rest is how far their best colour group is ahead of the best colour group of the other players.
+
+    Arguments:
+    - players: A list of the players of the rollout in seat order
+    - seat: An integer of the seat of the player being scored
+    - winning_condition: An integer of the number of properties needed to win
+
+    Returns:
+    - A float between 0 and 1
+    """
+    worths = []
+    for player in players:
+        worth = player.get_fund()
+        for property in player.properties_owned:
+            worth += property.get_property_cost() + property.get_hotel_cost() * property.get_hotels_built()
+        worths.append(worth)
+
+    total = sum(worths)
+    share = worths[seat] / total if total > 0 else 1 / len(players)
+    lead = colour_progress(players[seat], winning_condition) - max(colour_progress(player, winning_condition) for index, player in enumerate(players) if index != seat)
+    return 0.25 * share + 0.75 * (lead + 1) / 2
+
+
+def run_rollouts(layout_key: str, layout_data: bytes, state: GameState, seat: int, move_traits: list, row_size: int, winning_condition: int, candidate: tuple, number_of_rollouts: int, depth: int, seed: int) -> float:
+    """
+    Plays a number of rollouts of one candidate move and returns its average score, this is the function every worker of the rollout pool runs, and it is called in place when there is no pool.
+    Every rollout starts from the state of the game on the worker's own copy of the board, so the game itself is never touched, and only the tiles the last rollout changed have to be put back.
+
+    Arguments:
+    - layout_key: A string that names the layout of the board
+    - layout_data: The pickled layout made by board_layout
+    - state: The GameState of the game
+    - seat: An integer of the seat of the player deciding
+    - move_traits: A list of the move trait of every seat
+    - row_size: An integer of the number of horizontal and vertical grids
+    - winning_condition: An integer of the number of properties needed to win
+    - candidate: A tuple of (move, action), action is "BUY", "BUILD" or None
+    - number_of_rollouts: An integer of the number of rollouts to play
+    - depth: An integer of the number of turns every rollout is played for after the move
+    - seed: An integer seed of the random number generator of the rollouts
+
+    Returns:
+    - A float of the average score of the rollouts, from 0 to 1
+    """
+    property_locations, players, tracker = worker_board(layout_key, layout_data)
+    rng = random.Random(seed)
+    for player in players:
+        player.set_rng(rng)
+
+        # The AI seats of the rollouts play to the winning condition of this game, the worker board is shared with other tables
+        if isinstance(player, AIPlayer):
+            player.set_winning_condition(winning_condition)
+
+    move, action = candidate
+    total = 0.0
+    for _ in range(number_of_rollouts):
+        state.apply(tracker, players)
+        player = players[seat]
+
+        # Play the candidate: move, resolve the tile and take the action if it can still be afforded after rent or a penalty
+        player.set_position(move)
+        player.determine_action(property_locations)
+        property = property_locations[move]
+        if action == "BUY" and property.get_owner() == "Bank" and player.get_fund() >= property.get_property_cost():
+            player.purchase_property(property)
+        elif action == "BUILD" and property.get_owner() is player and property.get_hotels_built() != 2 and player.get_fund() >= property.get_hotel_cost():
+            player.purchase_hotel(property)
+
+        if player.check_win(winning_condition):
+            total += 1.0
+            continue
+
+        # Play the rest of the table the way the simulator would, starting from the next seat
+        score = None
+        for turn in range(depth):
+            turn_seat = (seat + 1 + turn) % len(players)
+            if rollout_turn(players[turn_seat], move_traits[turn_seat], property_locations, row_size, winning_condition, rng):
+                score = 1.0 if turn_seat == seat else 0.0
+                break
+        total += score if score is not None else rollout_score(players, seat, winning_condition)
+
+    return total / number_of_rollouts
+
+
+class MonteCarloAIPlayer(AIPlayer):
+    """
+    A class representing an AI player that picks its move by playing many short games, rollouts, from the current state instead of following the rules of AIPlayer.
+    Every possible move, together with buying or building where it lands, is played out by an equal share of the rollouts and the one that scores best is taken.
+    In a rollout every AIPlayer, this one included, follows the rules of AIPlayer and every other player moves at random, so the rollouts play out the way the rest of the game is likely to go.
+
+    It keeps the interface of AIPlayer: ai_move picks the move and sets the target to ("BUY", move), ("BUILD", move) or ("GOTO", move), and buy_or_build carries the target out.
+    The rollouts are played on a copy of the board brought up to date with a GameState, so they never print, draw from the game's random number generator, or touch the game itself.
+    The GameState is kept up to date with a BoardTracker on the board of the game, so every decision only reads the tiles that changed since the last one.
+
+    Attributes:
+        - rollouts: An integer of the number of rollouts played per decision
+        - rollout_depth: An integer of the number of turns every rollout is played for after the move
+        - rollout_pool: An executor the rollouts of every candidate are sent to, None to play them in place
+        - players: A list of every player of the game in seat order, the rollouts need the whole table
+        - layout: A tuple of (property_locations, layout key, pickled layout, tracker) of the board the layout was made for, the BoardTracker watches the board of the game
+
+    Behaviours:
+        - set_players: Setter method for variable players.
+        - set_rollout_pool: Setter method for variable rollout_pool.
+        - candidates: Returns every (move, action) pair worth playing out.
+        - layout_for: Returns the name and pickled layout of the board.
+        - game_state: Returns the GameState of the game now.
+        - ai_move: Method that return the move whose rollouts scored best.
+    """
+
+    __slots__ = ("rollouts", "rollout_depth", "rollout_pool", "players", "layout")
+
+    def __init__(self, rollouts: int = 64, rollout_depth: int = 24) -> None:
+        """
+        Constructor method of MonteCarloAIPlayer class.
+
+        Arguments:
+            - rollouts: An integer of the number of rollouts played per decision
+            - rollout_depth: An integer of the number of turns every rollout is played for after the move
+
+        Returns:
+            - None
+        """
+        super().__init__()
+        self.rollouts = rollouts
+        self.rollout_depth = rollout_depth
+        self.rollout_pool = None
+        self.players = None
+        self.layout = None
+
+    def set_players(self, players: list) -> None:
+        """
+        Setter method for variable players, the game hands every MonteCarloAIPlayer the list of players once they have all been created.
+
+        Arguments:
+            - players: A list of every player of the game in seat order, including this one
+
+        Returns:
+            - None
+        """
+        self.players = players
+
+    def set_rollout_pool(self, rollout_pool) -> None:
+        """
+        Setter method for variable rollout_pool.
+
+        Arguments:
+            - rollout_pool: A concurrent.futures executor, like a ProcessPoolExecutor to use every core, None to play the rollouts in place
+
+        Returns:
+            - None
+        """
+        self.rollout_pool = rollout_pool
+
+    def candidates(self, possible_moves: list[tuple], property_locations: dict) -> list[tuple]:
+        """
+        Returns every (move, action) pair worth playing out: every move on its own, and buying or building where it lands when that can be afforded now.
+
+        Arguments:
+            - possible_moves: A list of possible valid moves
+            - property_locations: A dicionary of all property locations
+
+        Returns:
+            - A list of tuples of (move, action), action is "BUY", "BUILD" or None
+        """
+        candidates = []
+        for move in possible_moves:
+            candidates.append((move, None))
+            property = property_locations[move]
+            if property.get_colour_group() is None:
+                continue
+            if property.get_owner() == "Bank" and self.get_fund() >= property.get_property_cost():
+                candidates.append((move, "BUY"))
+            elif property.get_owner() is self and property.get_hotels_built() != 2 and self.get_fund() >= property.get_hotel_cost():
+                candidates.append((move, "BUILD"))
+        return candidates
+
+    def layout_for(self, property_locations: dict) -> tuple:
+        """
+        Returns the name and pickled layout of the board, it is only worked out once per board.
+
+        Arguments:
+            - property_locations: A dicionary of all property locations
+
+        Returns:
+            - A tuple of (layout key, pickled layout)
+        """
+        if self.layout is None or self.layout[0] is not property_locations:
+            layout_key = "mc-{}".format(next(LAYOUT_NUMBERS))
+            self.layout = (property_locations, layout_key, pickle.dumps(board_layout(property_locations, self.players)), BoardTracker(property_locations))
+        return (self.layout[1], self.layout[2])
+
+    def game_state(self, property_locations: dict) -> GameState:
+        """
+        Returns the GameState of the game now, the board is only read whole the first time, after that only the tiles that changed since the last decision are read.
+
+        Arguments:
+            - property_locations: A dicionary of all property locations
+
+        Returns:
+            - A GameState of the game
+        """
+        self.layout_for(property_locations)
+        tracker = self.layout[3]
+        if tracker.state is None:
+            return GameState.capture(tracker, self.players)
+        return tracker.state.update(tracker, self.players)
+
+    def ai_move(self, possible_moves: list[tuple], property_locations: dict) -> tuple:
+        """
+        This method will play every candidate out with an equal share of the rollouts and return the move of the candidate that scored best.
+        Without the list of players there is no table to play out, so the rules of AIPlayer are used instead.
+
+        Arguments:
+            - possible_moves: A list of possible valid moves
+            - property_locations: A dicionary of all property locations
+
+        Returns:
+            - move: The best move MonteCarloAIPlayer should go
+        """
+        if self.players is None or len(possible_moves) == 0:
+            return super().ai_move(possible_moves, property_locations)
+
+        # There is nothing to play out when there is only one thing to do
+        candidates = self.candidates(possible_moves, property_locations)
+        if len(candidates) == 1:
+            best = 0
+        else:
+            row_size = int(math.sqrt(len(property_locations)))
+            layout_key, layout_data = self.layout_for(property_locations)
+            state = self.game_state(property_locations)
+            seat = self.players.index(self)
+            move_traits = [player.get_move_trait() for player in self.players]
+
+            # Every candidate gets its own seed drawn from the game, so a seeded game plays the same with or without a pool
+            per_candidate = max(1, self.rollouts // len(candidates))
+            seed = self.rng.getrandbits(32)
+            arguments = [(layout_key, layout_data, state, seat, move_traits, row_size, self.get_winning_condition(), candidate, per_candidate, self.rollout_depth, seed + index) for index, candidate in enumerate(candidates)]
+
+            if self.rollout_pool is not None:
+                futures = [self.rollout_pool.submit(run_rollouts, *task) for task in arguments]
+                scores = [future.result() for future in futures]
+            else:
+                scores = [run_rollouts(*task) for task in arguments]
+
+            # Take the best candidate, the first one listed wins a tie
+            best = max(range(len(candidates)), key=lambda index: scores[index])
+
+        move, action = candidates[best]
+        self.target = (action if action is not None else "GOTO", move)
+
+        # Remember where we have been, as ai_move does
+        self.previous_moves.append(move)
+        if len(self.previous_moves) > 3:
+            self.previous_moves.pop(0)
+        return move
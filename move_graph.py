@@ -0,0 +1,158 @@
+# Authors:
+# Team:
+# Date Edited:
+
+class MoveGraph:
+    """
+    A class that builds, once per move trait and board size, the table of valid moves from every location on the board, so that players and the AIPlayer only have to look their moves up.
+
+    Attributes:
+        - MOVE_OFFSETS: A dictionary whose key is a move trait and whose value is a tuple of (row, column) offsets the trait can move by
+        - MAX_DISTANCE_TABLES: An integer of how many distance tables are kept before the oldest one is thrown away
+        - move_tables: A dictionary whose key is a tuple of (move trait, row size) and whose value is the table built for it
+        - distance_tables: A dictionary whose key is a tuple of (move trait, row size, targets) and whose value is the distance table built for it
+
+    Behaviours:
+        - get_move_table: Returns the table of valid moves for a move trait and board size, building it the first time it is asked for.
+        - build_move_table: Builds the table of valid moves for a move trait and board size.
+        - get_distance_table: Returns the number of moves needed to reach a target from every location, building it the first time it is asked for.
+        - get_nearest_distance_table: Returns the number of moves needed to reach the closest of many targets from every location, building it the first time it is asked for.
+        - build_distance_table: Runs a breadth first search out of the targets to find the number of moves needed to reach the closest of them from every location.
+    """
+
+    # The offsets every move trait can move by, the keys match the BASE_MOVE_TRAIT of each player class
+    MOVE_OFFSETS = {
+        "Perpendicular": ((1, 0), (-1, 0), (0, 1), (0, -1)),
+        "Diagonal": ((1, 1), (-1, 1), (1, -1), (-1, -1)),
+        "L": ((-2, 1), (-1, 2), (1, 2), (2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)),
+    }
+
+    # Every distance table holds one entry per location, so only keep a bounded number of them around for big boards
+    MAX_DISTANCE_TABLES = 128
+
+    # Tables that have already been built, shared by every player and every game in the process
+    move_tables = dict()
+
+    # Distance tables that have already been built, one per target or set of targets that has been asked for
+    distance_tables = dict()
+
+    @staticmethod
+    def get_move_table(move_trait: str, row_size: int) -> dict:
+        """
+        Returns the table of valid moves for a move trait and board size, building it the first time it is asked for.
+
+        Arguments:
+            - move_trait: A string representing how the player move in game
+            - row_size: An integer representing the number of horizontal and vertical grids
+
+        Returns:
+            - move_table: A dictionary whose key is a location and whose value is a sorted tuple of the locations that can be moved to from it
+        """
+        key = (move_trait, row_size)
+        move_table = MoveGraph.move_tables.get(key)
+
+        # Only build the table on the first call for this trait and board size
+        if move_table is None:
+            move_table = MoveGraph.build_move_table(move_trait, row_size)
+            MoveGraph.move_tables[key] = move_table
+
+        return move_table
+
+    @staticmethod
+    def build_move_table(move_trait: str, row_size: int) -> dict:
+        """
+        Builds the table of valid moves for a move trait and board size.
+
+        Arguments:
+            - move_trait: A string representing how the player move in game
+            - row_size: An integer representing the number of horizontal and vertical grids
+
+        Returns:
+            - move_table: A dictionary whose key is a location and whose value is a sorted tuple of the locations that can be moved to from it
+        """
+        offsets = MoveGraph.MOVE_OFFSETS[move_trait]
+        move_table = dict()
+
+        # For every location keep the offsets that stay on the board, sorted the same way determine_valid_moves used to sort them
+        for x in range(row_size):
+            for y in range(row_size):
+                moves = [(x + dx, y + dy) for dx, dy in offsets if 0 <= x + dx < row_size and 0 <= y + dy < row_size]
+                moves.sort()
+                move_table[(x, y)] = tuple(moves)
+
+        return move_table
+
+    @staticmethod
+    def get_distance_table(move_trait: str, row_size: int, target: tuple) -> dict:
+        """
+        Returns the number of moves needed to reach a target from every location, building it the first time it is asked for.
+
+        Arguments:
+            - move_trait: A string representing how the player move in game
+            - row_size: An integer representing the number of horizontal and vertical grids
+            - target: A tuple of the location to reach
+
+        Returns:
+            - distance_table: A dictionary whose key is a location and whose value is the number of moves from it to target, locations that can never reach target are left out
+        """
+        return MoveGraph.get_nearest_distance_table(move_trait, row_size, (target,))
+
+    @staticmethod
+    def get_nearest_distance_table(move_trait: str, row_size: int, targets: tuple) -> dict:
+        """
+        Returns the number of moves needed to reach the closest of many targets from every location, building it the first time it is asked for.
+        It costs one search of the board however many targets there are, so the closest of thousands of reward tiles is found as fast as a single one.
+
+        Arguments:
+            - move_trait: A string representing how the player move in game
+            - row_size: An integer representing the number of horizontal and vertical grids
+            - targets: A tuple of the locations to reach
+
+        Returns:
+            - distance_table: A dictionary whose key is a location and whose value is the number of moves from it to the closest target, locations that can never reach a target are left out
+        """
+        key = (move_trait, row_size, targets)
+        distance_table = MoveGraph.distance_tables.get(key)
+
+        # Only search the board on the first call for this trait, board size and targets
+        if distance_table is None:
+            distance_table = MoveGraph.build_distance_table(move_trait, row_size, targets)
+
+            # Throw away the oldest table when there are too many, dictionaries remember the order they were filled in
+            if len(MoveGraph.distance_tables) >= MoveGraph.MAX_DISTANCE_TABLES:
+                del MoveGraph.distance_tables[next(iter(MoveGraph.distance_tables))]
+            MoveGraph.distance_tables[key] = distance_table
+
+        return distance_table
+
+    @staticmethod
+    def build_distance_table(move_trait: str, row_size: int, targets: tuple) -> dict:
+        """
+        Runs a breadth first search out of the targets, all at once, to find the number of moves needed to reach the closest of them from every location.
+        Every move trait can move back the way it came, so searching out of the targets gives the distances into them.
+
+        Arguments:
+            - move_trait: A string representing how the player move in game
+            - row_size: An integer representing the number of horizontal and vertical grids
+            - targets: A tuple of the locations to reach
+
+        Returns:
+            - distance_table: A dictionary whose key is a location and whose value is the number of moves from it to the closest target
+        """
+        move_table = MoveGraph.get_move_table(move_trait, row_size)
+        distance_table = {target: 0 for target in targets}
+
+        # Visit the board one ring of moves at a time, every location is given the distance of the ring it is first seen in
+        frontier = list(distance_table)
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for location in frontier:
+                for move in move_table[location]:
+                    if move not in distance_table:
+                        distance_table[move] = distance
+                        next_frontier.append(move)
+            frontier = next_frontier
+
+        return distance_table
@@ -0,0 +1,214 @@
+# Authors:
+# Team:
+# Date Edited:
+
+from property import Property
+
+# NumPy is optional, the rest of the game runs without it and only NumpyBoardState needs it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class NumpyBoardState:
+    """
+    A class that mirrors the board in parallel NumPy arrays, one entry per tile in row-major order, so board-wide questions are answered with vectorized operations instead of loops over Property objects.
+    It registers itself as an observer of every property, so buying, selling, building hotels and changing rent through the usual object API keep the arrays in sync.
+
+    Attributes:
+        - BANK_ID: An integer stored as the owner of a property owned by the bank
+        - NO_OWNER_ID: An integer stored as the owner of a chance tile
+        - PROPERTY_KIND: An integer stored as the kind of a normal property
+        - PENALTY_KIND: An integer stored as the kind of a Penalty tile
+        - REWARD_KIND: An integer stored as the kind of a Reward tile
+        - row_size: An integer representing the number of horizontal and vertical grids
+        - players: A list of the players, the index of a player is its owner id
+        - player_ids: A dictionary whose key is a player and whose value is its owner id
+        - colours: A list of the colour groups on the board, the index of a colour is its colour id
+        - cost, hotel_cost, rent, hotels_built, owner_id, colour_id, kind: Parallel NumPy arrays of integers with one entry per tile
+
+    Behaviours:
+        - tile_index: Returns the index in the arrays of a location.
+        - tile_location: Returns the location of an index in the arrays.
+        - property_changed: Copies the owner, hotels and rent of a property that has just changed into the arrays.
+        - net_worth_per_player: Returns the value of the properties and hotels owned by every player.
+        - rent_per_tile: Returns the rent charged on every tile right now.
+        - rent_exposure_per_tile: Returns the rent a player would have to pay on every tile.
+        - cheapest_bank_owned_per_colour: Returns the location of the cheapest property still owned by the bank in every colour.
+        - reward_locations: Returns the locations of every Reward tile.
+    """
+
+    BANK_ID = -1
+    NO_OWNER_ID = -2
+
+    PROPERTY_KIND = 0
+    PENALTY_KIND = 1
+    REWARD_KIND = 2
+
+    def __init__(self, property_locations: dict, players: list) -> None:
+        """
+        Constructor method for NumpyBoardState class, it fills the arrays from the board and starts observing every property.
+
+        Arguments:
+            - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+            - players: A list of every player in the game
+
+        Returns:
+            - None
+        """
+        if numpy is None:
+            raise ImportError("NumpyBoardState needs NumPy, install it with: pip install numpy")
+
+        number_of_tiles = len(property_locations)
+        self.row_size = int(round(number_of_tiles ** 0.5))
+
+        self.players = list(players)
+        self.player_ids = {player: player_id for player_id, player in enumerate(self.players)}
+
+        # Collect the colour groups in the order the board uses them
+        self.colours = list()
+        colour_ids = dict()
+
+        self.cost = numpy.zeros(number_of_tiles, dtype=numpy.int64)
+        self.hotel_cost = numpy.zeros(number_of_tiles, dtype=numpy.int64)
+        self.rent = numpy.zeros(number_of_tiles, dtype=numpy.int64)
+        self.hotels_built = numpy.zeros(number_of_tiles, dtype=numpy.int64)
+        self.owner_id = numpy.full(number_of_tiles, NumpyBoardState.NO_OWNER_ID, dtype=numpy.int64)
+        self.colour_id = numpy.full(number_of_tiles, -1, dtype=numpy.int64)
+        self.kind = numpy.full(number_of_tiles, NumpyBoardState.PROPERTY_KIND, dtype=numpy.int8)
+
+        for location, property in property_locations.items():
+            index = self.tile_index(location)
+
+            # Chance tiles have no costs or owner, they are only told apart by their name
+            if property.get_property_name() == "Penalty":
+                self.kind[index] = NumpyBoardState.PENALTY_KIND
+                continue
+            if property.get_property_name() == "Reward":
+                self.kind[index] = NumpyBoardState.REWARD_KIND
+                continue
+
+            colour = property.get_colour_group()
+            if colour not in colour_ids:
+                colour_ids[colour] = len(self.colours)
+                self.colours.append(colour)
+
+            self.cost[index] = property.get_property_cost()
+            self.hotel_cost[index] = property.get_hotel_cost()
+            self.colour_id[index] = colour_ids[colour]
+            self.property_changed(property)
+
+            # Keep the arrays in sync with every later change to the property
+            property.add_observer(self)
+
+    def tile_index(self, location: tuple) -> int:
+        """
+        Returns the index in the arrays of a location.
+
+        Arguments:
+            - location: A tuple of (row, column)
+
+        Returns:
+            - An integer of the row-major index
+        """
+        return location[0] * self.row_size + location[1]
+
+    def tile_location(self, index: int) -> tuple:
+        """
+        Returns the location of an index in the arrays.
+
+        Arguments:
+            - index: An integer of the row-major index
+
+        Returns:
+            - A tuple of (row, column)
+        """
+        return divmod(int(index), self.row_size)
+
+    def property_changed(self, property: Property) -> None:
+        """
+        Copies the owner, hotels and rent of a property that has just changed into the arrays, it is called by the property itself.
+
+        Arguments:
+            - property: The Property that changed
+
+        Returns:
+            - None
+        """
+        index = self.tile_index(property.get_location())
+        owner = property.get_owner()
+        self.owner_id[index] = NumpyBoardState.BANK_ID if owner == Property.ORIGINAL_OWNER else self.player_ids[owner]
+        self.hotels_built[index] = property.get_hotels_built()
+        self.rent[index] = property.get_rent_price()
+
+    def net_worth_per_player(self):
+        """
+        Returns the value of the properties and hotels owned by every player, counted the way display_player_properties counts them.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A NumPy array of integers, indexed by owner id
+        """
+        owned = self.owner_id >= 0
+        value = self.cost[owned] + self.hotel_cost[owned] * self.hotels_built[owned]
+        return numpy.bincount(self.owner_id[owned], weights=value, minlength=len(self.players)).astype(numpy.int64)
+
+    def rent_per_tile(self):
+        """
+        Returns the rent charged on every tile right now, rent goes up by 20% per hotel and nothing is charged on tiles nobody owns.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A NumPy array of integers, one per tile
+        """
+        # numpy.rint rounds halves to even just like round does in Player.pay_rent
+        rent = numpy.rint(self.rent * (1 + 0.2 * self.hotels_built)).astype(numpy.int64)
+        return numpy.where(self.owner_id >= 0, rent, 0)
+
+    def rent_exposure_per_tile(self, player):
+        """
+        Returns the rent a player would have to pay on every tile, which is nothing on their own tiles.
+
+        Arguments:
+            - player: The player landing on the tiles
+
+        Returns:
+            - A NumPy array of integers, one per tile
+        """
+        return numpy.where(self.owner_id == self.player_ids[player], 0, self.rent_per_tile())
+
+    def cheapest_bank_owned_per_colour(self) -> dict:
+        """
+        Returns the location of the cheapest property still owned by the bank in every colour, ties go to the first tile in row-major order.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A dictionary whose key is a colour group and whose value is a location, colours with nothing left to buy are left out
+        """
+        buyable = numpy.flatnonzero(self.owner_id == NumpyBoardState.BANK_ID)
+
+        # Sort the buyable tiles by colour, then cost, then index, and keep the first tile of every colour
+        order = numpy.lexsort((buyable, self.cost[buyable], self.colour_id[buyable]))
+        sorted_tiles = buyable[order]
+        colour_ids, first = numpy.unique(self.colour_id[sorted_tiles], return_index=True)
+
+        return {self.colours[colour_id]: self.tile_location(sorted_tiles[index]) for colour_id, index in zip(colour_ids, first)}
+
+    def reward_locations(self) -> list[tuple]:
+        """
+        Returns the locations of every Reward tile, in row-major order.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A list of locations
+        """
+        return [self.tile_location(index) for index in numpy.flatnonzero(self.kind == NumpyBoardState.REWARD_KIND)]
@@ -0,0 +1,243 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import sys
+from abc import ABC, abstractmethod
+
+
+class OutputSink(ABC):
+    """
+    A class that the game logic writes its messages to instead of calling print, so that where the messages go, and whether they are formatted at all, is up to the game running it.
+
+    Every message has a kind, like "purchase" or "rent", a template and the fields that fill the template in.
+    The template is only formatted by sinks that show the message, so a NullSink costs the game no formatting and no I/O.
+
+    Behaviours:
+        - format: Fills a template in with its fields.
+        - emit: Takes one message, every sink must implement it.
+        - flush: Writes out whatever the sink is holding on to, it does nothing unless the sink holds messages back.
+    """
+
+    @staticmethod
+    def format(template: str, fields: dict) -> str:
+        """
+        Fills a template in with its fields, a template with no fields is used as it is so that it may contain braces.
+
+        Arguments:
+            - template: A string like "{player} purchased {property}."
+            - fields: A dictionary of the values of the fields of the template
+
+        Returns:
+            - A string of the message
+        """
+        if fields:
+            return template.format(**fields)
+        return template
+
+    @abstractmethod
+    def emit(self, kind: str, template: str, end: str = "\n", **fields) -> None:
+        """
+        Takes one message.
+
+        Arguments:
+            - kind: A string naming what the message is about, like "purchase" or "rent"
+            - template: A string of the message, with the fields in braces
+            - end: A string written after the message, like the end of print
+            - fields: The values of the fields of the template
+
+        Returns:
+            - None
+        """
+
+    def flush(self) -> None:
+        """
+        Writes out whatever the sink is holding on to.
+
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        return None
+
+
+class ConsoleSink(OutputSink):
+    """
+    A sink that prints every message straight away, the way the game always has.
+
+    Attributes:
+        - stream: The file-like object messages are printed to, None to print to whatever sys.stdout is at the time
+
+    Behaviours:
+        - emit: Prints the message.
+    """
+
+    def __init__(self, stream=None) -> None:
+        """
+        Constructor method for ConsoleSink class.
+
+        Arguments:
+            - stream: The file-like object messages are printed to, None to print to sys.stdout
+
+        Returns:
+            - None
+        """
+        self.stream = stream
+
+    def emit(self, kind: str, template: str, end: str = "\n", **fields) -> None:
+        """
+        Prints the message.
+
+        Arguments:
+            - kind: A string naming what the message is about
+            - template: A string of the message, with the fields in braces
+            - end: A string written after the message
+            - fields: The values of the fields of the template
+
+        Returns:
+            - None
+        """
+        print(OutputSink.format(template, fields), end=end, file=self.stream)
+
+
+class NullSink(OutputSink):
+    """
+    A sink that throws every message away without formatting it, used by simulations that only want the outcome of a game.
+
+    Behaviours:
+        - emit: Does nothing.
+    """
+
+    def emit(self, kind: str, template: str, end: str = "\n", **fields) -> None:
+        """
+        Does nothing, the message is thrown away.
+
+        Arguments:
+            - kind: A string naming what the message is about
+            - template: A string of the message, with the fields in braces
+            - end: A string written after the message
+            - fields: The values of the fields of the template
+
+        Returns:
+            - None
+        """
+        return None
+
+
+class BufferedSink(OutputSink):
+    """
+    A sink that holds on to its messages and writes them all out with a single write when it is flushed, so that a game can flush once per turn instead of writing every line.
+
+    Attributes:
+        - stream: The file-like object messages are written to, None to write to whatever sys.stdout is at the time
+        - pending: A list of the strings of the messages that have not been written yet
+
+    Behaviours:
+        - emit: Holds on to the message.
+        - flush: Writes every message held in one go.
+    """
+
+    def __init__(self, stream=None) -> None:
+        """
+        Constructor method for BufferedSink class.
+
+        Arguments:
+            - stream: The file-like object messages are written to, None to write to sys.stdout
+
+        Returns:
+            - None
+        """
+        self.stream = stream
+        self.pending = []
+
+    def emit(self, kind: str, template: str, end: str = "\n", **fields) -> None:
+        """
+        Holds on to the message until the next flush.
+
+        Arguments:
+            - kind: A string naming what the message is about
+            - template: A string of the message, with the fields in braces
+            - end: A string written after the message
+            - fields: The values of the fields of the template
+
+        Returns:
+            - None
+        """
+        self.pending.append(OutputSink.format(template, fields) + end)
+
+    def flush(self) -> None:
+        """
+        Writes every message held in one go.
+
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        if len(self.pending) == 0:
+            return
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write("".join(self.pending))
+        stream.flush()
+        self.pending.clear()
+
+
+class StructuredSink(OutputSink):
+    """
+    A sink that keeps every message as a dictionary of its kind, its text and its fields, for tools that want to look at what happened without parsing text.
+
+    Attributes:
+        - events: A list of dictionaries like {"kind": "purchase", "message": "Bob purchased Park Lane.", "player": "Bob", "property": "Park Lane"}
+
+    Behaviours:
+        - emit: Keeps the message as a dictionary.
+        - clear: Forgets every message kept so far.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method for StructuredSink class.
+
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        self.events = []
+
+    def emit(self, kind: str, template: str, end: str = "\n", **fields) -> None:
+        """
+        Keeps the message as a dictionary, its fields keep the values they were given.
+
+        Arguments:
+            - kind: A string naming what the message is about
+            - template: A string of the message, with the fields in braces
+            - end: A string written after the message, it is not kept
+            - fields: The values of the fields of the template
+
+        Returns:
+            - None
+        """
+        event = {"kind": kind, "message": OutputSink.format(template, fields)}
+        event.update(fields)
+        self.events.append(event)
+
+    def clear(self) -> None:
+        """
+        Forgets every message kept so far.
+
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        self.events.clear()
+
+
+# The sink players and properties write to when they are not handed one
+DEFAULT_SINK = ConsoleSink()
@@ -3,6 +3,9 @@
 #Date Edited:
 
 from property import Property
+from board_renderer import DEFAULT_RENDERER, BoardRenderer
+from output_sink import DEFAULT_SINK, OutputSink
+from event_log import EventLog, PurchaseEvent, HotelEvent, SaleEvent, RentEvent, TransferEvent, RewardEvent, PenaltyEvent
 import math
 import random
 
@@ -16,23 +19,42 @@ class Player:
         - fund: An integer representing the amount of fund that self currently own.
         - move_trait: A string representing how the player move in game.
         - position: A tuple representing the coordinate of player, the first element in tuple will be value in x axis , second element will be value in y axis.
-        - properties_owned: properties_owned: A list of the properties owned by player.
+        - properties_owned: properties_owned: A dictionary used as an ordered set of the properties owned by player, its keys are the properties in the order they were acquired.
+        - rng: The random number generator used for rewards and penalties, the random module unless a seeded random.Random is set.
+        - colour_counts: A dictionary whose key is a colour group and whose value is how many properties of that colour the player owns.
+        - colour_hotel_counts: A dictionary whose key is a colour group and whose value is how many properties of that colour the player owns with at least one hotel.
+        - colour_properties: A dictionary whose key is a colour group and whose value is a dictionary used as an ordered set of the properties of that colour owned by the player, in the order they were acquired.
+        - event_log: The EventLog the player records its purchases, hotels, sales, rent, rewards and penalties in, None to record nothing.
+        - output: The OutputSink the player tells what happened through, instead of printing it.
 
     Behaviours:
         - Constructor: A method that is called when an object is created.
         - Getters: Methods that returns the provided attributes.
         - Setters: Methods that changes the provided attributes.
+        - owns_property: Returns whether the player owns a property.
+        - get_number_of_properties_owned: Returns how many properties the player owns.
+        - get_colour_count: Returns how many properties of a colour group the player owns.
+        - get_colour_hotel_count: Returns how many properties of a colour group the player owns with at least one hotel.
+        - get_colour_properties: Returns the properties of a colour group the player owns.
+        - track_property: Adds a property that has just been acquired to the colour counts.
+        - track_hotel: Counts the first hotel built on a property owned towards its colour.
+        - untrack_property: Takes a property that is about to be given up out of the colour counts.
+        - rebuild_colour_index: Recounts the colour counts from scratch.
         - add_fund: Method of adding the amount(argument) to the funds a player has.
         - reduce_fund: Method of reducing the amount(argument) from the funds a player has.
         - purchase_property: A method that allows the player to purchase the property from the bank.
         - purchase_hotel: A method that is used to build a hotel on property if player owns it and has enough funds to build upon it.
         - sell_property: A method that allows the player to sell the property that they own to bank.
+        - display_moves: A method that displays the player's current position and valid moves on the game board, using the shared BoardRenderer.
         - display_player_properties: A method used to display properties owned by the player and the total value of them in order of color group
         - check_win: A method for checking if the player fullfills the winning condition.
         - pay_rent: When a player is located on another player's property, he will have to pay rent associated with the property cost and the number of hotels built.
         - determine_action: Determine which action should player do by the property player located on.
     """
     
+    # Every player keeps its attributes in fixed slots instead of a per-instance dictionary, subclasses must declare the slots they add
+    __slots__ = ("name", "symbol", "fund", "move_trait", "position", "properties_owned", "rng", "colour_counts", "colour_hotel_counts", "colour_properties", "event_log", "output")
+
     # The initial fund that every player have
     STARTING_FUND = 150
 
@@ -61,8 +83,24 @@ class Player:
         # Set up a variable that represents the current position of the player
         self.position = (None, None)
 
-        # Set up a list that stores all the properties that the player currently owns
-        self.properties_owned = list()
+        # Set up a dictionary that stores all the properties that the player currently owns as its keys, it remembers the order they were acquired in and finds or removes a property without searching
+        self.properties_owned = dict()
+
+        # Set up the random number generator, the random module by default so that games are not seeded unless asked to be
+        self.rng = random
+
+        # Set up the counts of properties owned, and of properties owned with a hotel, per colour group so that win checks do not have to look through every property
+        self.colour_counts = dict()
+        self.colour_hotel_counts = dict()
+
+        # Set up the properties owned grouped by colour group, so that looking at the properties of one colour does not go through every property
+        self.colour_properties = dict()
+
+        # Set up the event log, nothing is recorded unless the game hands the player one
+        self.event_log = None
+
+        # Set up the output sink, the shared console one unless the game hands the player another
+        self.output = DEFAULT_SINK
         
     def get_name(self) -> str:
         """
@@ -100,17 +138,41 @@ class Player:
         """
         return self.fund
 
-    def get_properties_owned(self) -> list:
+    def get_properties_owned(self):
         """
-        Getter method for variable properties_owned.
+        Getter method for variable properties_owned, it costs nothing however many properties are owned.
         
         Arguments:
             - None
 
         Returns:
-            - properties_owned: A list of the properties owned by player
+            - properties_owned: A read-only view of the properties owned by player, in the order they were acquired, it follows later purchases and sales so take a list of it to index it or to sell while going through it
+        """
+        return self.properties_owned.keys()
+
+    def owns_property(self, property: Property) -> bool:
+        """
+        Returns whether the player owns a property, without searching through every property owned.
+        
+        Arguments:
+            - property: An object representing the actual property
+
+        Returns:
+            - A boolean that is True if the property is owned by the player
+        """
+        return property in self.properties_owned
+
+    def get_number_of_properties_owned(self) -> int:
         """
-        return self.properties_owned
+        Returns how many properties the player owns.
+        
+        Arguments:
+            - None
+
+        Returns:
+            - An integer of the number of properties owned by player
+        """
+        return len(self.properties_owned)
 
     def get_position(self) -> tuple:
         """
@@ -136,6 +198,42 @@ class Player:
         """
         return self.move_trait
 
+    def get_rng(self) -> random.Random:
+        """
+        Getter method for variable rng.
+        
+        Arguments:
+            - None
+
+        Returns:
+            - rng: The random number generator used by the player
+        """
+        return self.rng
+
+    def get_event_log(self) -> EventLog:
+        """
+        Getter method for variable event_log.
+        
+        Arguments:
+            - None
+
+        Returns:
+            - event_log: The EventLog of the player, None if nothing is recorded
+        """
+        return self.event_log
+
+    def get_output(self) -> OutputSink:
+        """
+        Getter method for variable output.
+        
+        Arguments:
+            - None
+
+        Returns:
+            - output: The OutputSink the player tells what happened through
+        """
+        return self.output
+
     def set_name(self, name: str) -> None:
         """
         Setter method for variable name.
@@ -160,6 +258,18 @@ class Player:
         """
         self.symbol = symbol
 
+    def set_fund(self, fund: int) -> None:
+        """
+        Setter method for variable fund, used when a saved game is restored, during a game use add_fund and reduce_fund.
+        
+        Arguments:
+            - fund: An integer representing the amount of fund that self currently own
+
+        Returns:
+            - None
+        """
+        self.fund = fund
+
     def set_position(self, position: tuple) -> None:
         """
         Setter method for variable position.
@@ -172,17 +282,20 @@ class Player:
         """
         self.position = position
 
-    def set_properties_owned(self, property: Property) -> None:
+    def set_properties_owned(self, property: list) -> None:
         """
         Setter method for variable properties_owned.
         
         Arguments:
-            property: Instances of Class Property
+            property: A list of instances of Class Property
 
         Returns:
             - None
         """
-        self.properties_owned = property
+        self.properties_owned = dict.fromkeys(property)
+
+        # The properties owned have been swapped out, so count the colours again
+        self.rebuild_colour_index()
 
     def set_move_trait(self, move_trait: str) -> None:
         """
@@ -196,6 +309,143 @@ class Player:
         """
         self.move_trait = move_trait
 
+    def set_rng(self, rng: random.Random) -> None:
+        """
+        Setter method for variable rng.
+        
+        Arguments:
+            - rng: A random.Random instance, seeding it makes the player's rewards and penalties reproducible
+
+        Returns:
+            - None
+        """
+        self.rng = rng
+
+    def set_event_log(self, event_log: EventLog) -> None:
+        """
+        Setter method for variable event_log.
+        
+        Arguments:
+            - event_log: The EventLog to record in, None to record nothing
+
+        Returns:
+            - None
+        """
+        self.event_log = event_log
+
+    def set_output(self, output: OutputSink) -> None:
+        """
+        Setter method for variable output.
+        
+        Arguments:
+            - output: The OutputSink to tell what happened through, like a NullSink to say nothing
+
+        Returns:
+            - None
+        """
+        self.output = output
+
+    def get_colour_count(self, colour: str) -> int:
+        """
+        Returns how many properties of a colour group the player owns.
+        
+        Arguments:
+            - colour: A string of the colour group
+
+        Returns:
+            - An integer of the number of properties of that colour owned by the player
+        """
+        return self.colour_counts.get(colour, 0)
+
+    def get_colour_hotel_count(self, colour: str) -> int:
+        """
+        Returns how many properties of a colour group the player owns with at least one hotel built on them.
+        
+        Arguments:
+            - colour: A string of the colour group
+
+        Returns:
+            - An integer of the number of properties of that colour owned by the player with a hotel
+        """
+        return self.colour_hotel_counts.get(colour, 0)
+
+    def get_colour_properties(self, colour: str):
+        """
+        Returns the properties of a colour group the player owns, it costs nothing however many properties are owned.
+        
+        Arguments:
+            - colour: A string of the colour group
+
+        Returns:
+            - A read-only view of the properties of that colour owned by the player, in the order they were acquired, take a list of it to sell while going through it
+        """
+        properties = self.colour_properties.get(colour)
+        if properties is None:
+            return dict().keys()
+        return properties.keys()
+
+    def track_property(self, property: Property) -> None:
+        """
+        Adds a property that has just been acquired to the colour counts, together with its hotels.
+        
+        Arguments:
+            - property: An object representing the actual property
+
+        Returns:
+            - None
+        """
+        colour = property.get_colour_group()
+        self.colour_counts[colour] = self.colour_counts.get(colour, 0) + 1
+        self.colour_properties.setdefault(colour, dict())[property] = None
+        if property.get_hotels_built() >= 1:
+            self.colour_hotel_counts[colour] = self.colour_hotel_counts.get(colour, 0) + 1
+
+    def track_hotel(self, property: Property) -> None:
+        """
+        Counts the first hotel built on a property owned towards winning with its colour, it has to be called after the hotel is built.
+        
+        Arguments:
+            - property: An object representing the actual property
+
+        Returns:
+            - None
+        """
+        if property.get_hotels_built() == 1:
+            colour = property.get_colour_group()
+            self.colour_hotel_counts[colour] = self.colour_hotel_counts.get(colour, 0) + 1
+
+    def untrack_property(self, property: Property) -> None:
+        """
+        Takes a property that is about to be given up out of the colour counts, it has to be called before its hotels are reset.
+        
+        Arguments:
+            - property: An object representing the actual property
+
+        Returns:
+            - None
+        """
+        colour = property.get_colour_group()
+        self.colour_counts[colour] -= 1
+        del self.colour_properties[colour][property]
+        if property.get_hotels_built() >= 1:
+            self.colour_hotel_counts[colour] -= 1
+
+    def rebuild_colour_index(self) -> None:
+        """
+        Recounts the colour counts from scratch out of the properties owned.
+        
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        self.colour_counts = dict()
+        self.colour_hotel_counts = dict()
+        self.colour_properties = dict()
+        for property in self.properties_owned:
+            self.track_property(property)
+
     def add_fund(self, amount: int) -> None:
         """
         This is a method of adding the amount(argument) to the funds a player has.
@@ -256,14 +506,17 @@ class Player:
         """
         # Check whether the player's fund is greater than or equal to the property cost
         if self.get_fund() >= property.get_property_cost():
-            # If it is the case, add the property to the list of properties_owned, reduce their funds by the cost of the property and change the owner of the property
-            self.properties_owned.append(property)
+            # If it is the case, add the property to properties_owned, reduce their funds by the cost of the property and change the owner of the property
+            self.properties_owned[property] = None
             self.reduce_fund(property.get_property_cost())
             property.set_owner(self)
-            print("{} purchased {}.".format(self.get_name(), property.get_property_name()))
+            self.track_property(property)
+            if self.event_log is not None:
+                self.event_log.record(PurchaseEvent(self.event_log.seat_of(self), property.get_location(), property.get_property_cost()))
+            self.output.emit("purchase", "{player} purchased {property}.", player = self.get_name(), property = property.get_property_name())
         else:
             # In the event that the player's funds is less than the cost of the property, just output that the player does not have enough funds
-            print("{} cannot purchase {} due to insufficient funds.".format(self.get_name(), property.get_property_name()))
+            self.output.emit("insufficient_funds", "{player} cannot purchase {property} due to insufficient funds.", player = self.get_name(), property = property.get_property_name())
            
     def purchase_hotel(self, property: Property) -> None:
         """
@@ -276,19 +529,24 @@ class Player:
             - None
         """
         # First check whether the player does not own the property, if they do not own the property, print out that they do not own the property and then attempt to buy the said property.
-        if property not in self.get_properties_owned():
-            print("{} must purchase {} before constructing a hotel.")
+        if not self.owns_property(property):
+            self.output.emit("not_owned", "{player} must purchase {property} before constructing a hotel.", player = self.get_name(), property = property.get_property_name())
             self.purchase_property(property)
         # In the event that the player does own the property
         else:
             # If the player has more than enough funds to purchase a hotel, construct a hotel, reduce their funds by the hotel cost and then print out that the player has purchased the property
             if self.get_fund() >= property.get_hotel_cost():
-                property.construct_hotel()
+                property.construct_hotel(self.output)
                 self.reduce_fund(property.get_hotel_cost())
+                if self.event_log is not None:
+                    self.event_log.record(HotelEvent(self.event_log.seat_of(self), property.get_location(), property.get_hotel_cost()))
+
+                # The first hotel on a property makes it count towards winning with its colour
+                self.track_hotel(property)
 
             # In the event that the player does not have enough funds, tell the player
             else:
-                print("{} cannot construct a hotel on {} due to insufficient funds.".format(self.get_name(), property.get_property_name()))
+                self.output.emit("insufficient_funds", "{player} cannot construct a hotel on {property} due to insufficient funds.", player = self.get_name(), property = property.get_property_name())
 
     def sell_property(self, property: Property) -> None:
         """
@@ -301,30 +559,50 @@ class Player:
             - None
         """
         # Check whether the property is owned by the Player
-        if property in self.get_properties_owned():
+        if self.owns_property(property):
             
-            # Remove the property from the list of properties owned by the player
-            self.properties_owned.remove(property)
+            # Remove the property from the properties owned by the player, and from the colour counts while it still has its hotels
+            del self.properties_owned[property]
+            self.untrack_property(property)
 
             # Give the funds back to the player, funds which are calculated by this equation: property_cost + (number of hotels built * hotel_cost)
             property_cost_total = property.get_property_cost() + (property.get_hotels_built() * property.get_hotel_cost())
             self.add_fund(property_cost_total)
+            if self.event_log is not None:
+                self.event_log.record(SaleEvent(self.event_log.seat_of(self), property.get_location(), property_cost_total))
 
             # Reset the property, essentially change the owner
             property.set_owner(Property.ORIGINAL_OWNER)
 
-            #! What about the hotels built in the property? Do they not get reset??
-            property.hotels_built = 0
+            # The hotels go back to the bank with the property
+            property.set_hotels_built(0)
 
             # Inform the player that the property has been sold
-            print("{} sold {} for ${}.".format(self.get_name(), property.get_property_name(), property_cost_total))
+            self.output.emit("sale", "{player} sold {property} for ${amount}.", player = self.get_name(), property = property.get_property_name(), amount = property_cost_total)
             
-    def display_player_properties(self) -> None:
+    def display_moves(self, row_size: int, valid_flag: bool, renderer: BoardRenderer = None) -> None:
         """
-        A method used to display properties owned by the player and the total value of them in order of color group.
+        This is a method that displays the player's current position and valid moves based on whether valid_flags is true or false on the game board.
+        Every move trait draws the same board, so they all share this method and the valid moves come from the subclass' determine_valid_moves.
         
         Arguments:
+            - row_size: An integer representing the number of horizontal and vertical grids.
+            - valid_flag: If true, the 'x' indicates a valid movement with the position of player. If false, only the current location of the player is displayed.
+            - renderer: The BoardRenderer to draw with, None for the shared default one
+
+        Returns:
             - None
+        """
+        if renderer is None:
+            renderer = DEFAULT_RENDERER
+        renderer.display(self, row_size, valid_flag)
+
+    def display_player_properties(self, colours: list = None) -> None:
+        """
+        A method used to display properties owned by the player and the total value of them in order of color group.
+        
+        Arguments:
+            - colours: A list of the colour groups of the board in the order they are shown, the colour groups the player owns in the order they were first bought if None
 
         Returns:
             - None
@@ -334,34 +612,41 @@ class Player:
         properties_worth = 0
         hotels_worth = 0
 
-        for color in Property.COLOUR_GROUPS:
+        # Group the properties by colour once, so showing them costs as much as the properties owned and not the properties owned times the colour groups
+        properties_by_colour = dict()
+        for property_obj in self.properties_owned:
+            properties_by_colour.setdefault(property_obj.get_colour_group(), []).append(property_obj)
+
+        if colours is None:
+            colours = list(properties_by_colour)
+
+        for color in colours:
             # Initialize a variable that will keep track on whether the color has been printed or not in order to stop printing the same color out multiple of times
             color_printed = False
 
             # A counter that is just used for cleaner outputs
             counter = 1
 
-            # Loop through every single property that the player owns
-            for property_obj in self.get_properties_owned():
-
-                # If the color group of the property matches with the color that we are using right now, switch the color_printed variable to true and print our color out
-                if property_obj.get_colour_group() == color:
-                    if color_printed == False:  
-                        print(color.upper())
-                        color_printed = True
-
-                    # Print out the text of what the property is worth, and how much the hotels are worth, even if there are none
-                    print("{}. ${} {} (${} Hotels x {})".format(counter, property_obj.get_property_cost(), property_obj.get_property_name(), property_obj.get_hotel_cost(), property_obj.get_hotels_built()))
-                    
-                    # Add the property cost, hotel costs to our total and increment our counter
-                    properties_worth += property_obj.get_property_cost()
-                    hotels_worth += property_obj.get_hotel_cost() * property_obj.get_hotels_built()
-                    counter += 1
+            # Loop through every single property that the player owns of this color
+            for property_obj in properties_by_colour.get(color, ()):
+
+                # If the color has not been printed yet, switch the color_printed variable to true and print our color out
+                if color_printed == False:  
+                    self.output.emit("holdings", color.upper())
+                    color_printed = True
+
+                # Print out the text of what the property is worth, and how much the hotels are worth, even if there are none
+                self.output.emit("holdings", "{number}. ${cost} {property} (${hotel_cost} Hotels x {hotels})", number = counter, cost = property_obj.get_property_cost(), property = property_obj.get_property_name(), hotel_cost = property_obj.get_hotel_cost(), hotels = property_obj.get_hotels_built())
+                
+                # Add the property cost, hotel costs to our total and increment our counter
+                properties_worth += property_obj.get_property_cost()
+                hotels_worth += property_obj.get_hotel_cost() * property_obj.get_hotels_built()
+                counter += 1
         
         # Print out our totals (Property cost total and hotel cost total)
-        print("TOTAL")
-        print("${} worth of properties".format(properties_worth))
-        print("${} worth of hotels".format(hotels_worth))
+        self.output.emit("holdings", "TOTAL")
+        self.output.emit("holdings", "${amount} worth of properties", amount = properties_worth)
+        self.output.emit("holdings", "${amount} worth of hotels", amount = hotels_worth)
 
     
     def check_win(self, winning_condition: int) -> bool:
@@ -375,20 +660,11 @@ class Player:
             - return boolean as whether the player has met the winning condition
         """
         
-        # Go through each color group
-        for color in Property.COLOUR_GROUPS:
-            # Put a counter that keeps track of how many properties we have within the same color group
-            number_of_properties_in_color_group = 0
-            
-            # Loop through all properties that the player owns, in the event that the player's property is within the same color group and the property has a hotel built on it, increment the number_of_properties_in_color_group
-            for property in self.get_properties_owned():
-                if color == property.get_colour_group() and property.get_hotels_built() >= 1:
-                    number_of_properties_in_color_group += 1
-            
-                # In the event that our counter is greater than or equal to our winning condition, print out that the player has won and return True
-                if number_of_properties_in_color_group >= winning_condition:
-                    print("Game over! {} WINS!".format(self.get_name()))
-                    return True
+        # Go through the count of properties with a hotel in each color group, in the event that a count is greater than or equal to our winning condition, print out that the player has won and return True
+        for number_of_properties_in_color_group in self.colour_hotel_counts.values():
+            if number_of_properties_in_color_group >= winning_condition:
+                self.output.emit("win", "Game over! {player} WINS!", player = self.get_name())
+                return True
 
         # In the event that the condition has not been satisfied, return False
         return False
@@ -418,39 +694,38 @@ class Player:
         if player_balance >= rent_cost:
             self.reduce_fund(rent_cost)
             property_owner.add_fund(rent_cost)
+            if self.event_log is not None:
+                self.event_log.record(RentEvent(self.event_log.seat_of(self), self.event_log.seat_of(property_owner), property.get_location(), rent_cost))
 
         # In the event that the player does own a property but has no cash 
-        elif len(self.get_properties_owned()) >= 1:
+        elif self.get_number_of_properties_owned() >= 1:
 
-            # Initialize a variable that will contain our value and our index, their indexes are respectively 0 and 1 in our tuple
-            lowest_value = (0, 0)
-
-            # Loop through all properties that are owned by the player, and look for the lowest value amongst them
-            for owned_property in self.get_properties_owned():
-                value = owned_property.get_property_cost() + (owned_property.get_hotel_cost() * owned_property.get_hotels_built())
-                if value < lowest_value[0]:
-                    lowest_value = (value, self.get_properties_owned().index(owned_property))
-            
-            # Fetch the object of the lowest valued property
-            transacted_property = self.properties_owned[lowest_value[1]]
+            # Look through all properties that are owned by the player in one pass and fetch the object of the lowest valued property, the earliest acquired one wins a tie
+            transacted_property = min(self.properties_owned, key=lambda owned_property: owned_property.get_property_cost() + (owned_property.get_hotel_cost() * owned_property.get_hotels_built()))
 
-            # Transfer the lowest valued property over to the property owner where the player landed on, by setting the new property owner and adding it to the player's list of owned properties
+            # Transfer the lowest valued property over to the property owner where the player landed on, by setting the new property owner and adding it to the player's owned properties
             transacted_property.set_owner(property_owner)
-            property_owner.properties_owned.append(transacted_property)
+            property_owner.properties_owned[transacted_property] = None
+            property_owner.track_property(transacted_property)
 
             # Remove the property from the previous player
-            self.properties_owned.remove(transacted_property)
+            del self.properties_owned[transacted_property]
+            self.untrack_property(transacted_property)
+            if self.event_log is not None:
+                self.event_log.record(TransferEvent(self.event_log.seat_of(self), self.event_log.seat_of(property_owner), transacted_property.get_location()))
 
-            print("{} does not have sufficient funds. {} gives {} to {} instead.".format(self, self, transacted_property, property_owner))
+            self.output.emit("transfer", "{player} does not have sufficient funds. {player} gives {property} to {owner} instead.", player = self.get_name(), property = transacted_property.get_property_name(), owner = property_owner.get_name())
         
         # In the event that the player who has landed on the property has no cash or not enough cash and has no property, then transfer all the money from the player to the property owner's fund
         else:
             property_owner.add_fund(player_balance)
             self.reduce_fund(player_balance)
+            if self.event_log is not None:
+                self.event_log.record(RentEvent(self.event_log.seat_of(self), self.event_log.seat_of(property_owner), property.get_location(), player_balance))
 
         # If the player's balance has changed compared to what it was initially, print out the string saying that they have paid rent.
         if player_balance != self.get_fund():
-            print("{} paid ${} as a rental charge to {} and has ${} left.".format(self, player_balance - self.get_fund(), property_owner, self.get_fund()))
+            self.output.emit("rent", "{player} paid ${amount} as a rental charge to {owner} and has ${fund} left.", player = self.get_name(), amount = player_balance - self.get_fund(), owner = property_owner.get_name(), fund = self.get_fund())
 
             
     def determine_action(self, property_locations: dict) -> bool:
@@ -473,15 +748,19 @@ class Player:
 
         # If the property's name at the current player's location is called Reward, then add funds by a random integer ranging from 30 to 150. Then print out that the player has gotten rewarded.
         if property_at_position.get_property_name() == "Reward":
-            reward = random.randint(30,150)
+            reward = self.rng.randint(30,150)
             self.add_fund(reward)
-            print("{} landed on Reward and has been rewarded ${}.".format(self.get_name(), reward))
+            if self.event_log is not None:
+                self.event_log.record(RewardEvent(self.event_log.seat_of(self), reward))
+            self.output.emit("reward", "{player} landed on Reward and has been rewarded ${amount}.", player = self.get_name(), amount = reward)
 
         # If the property's name at the current player's location is called Penalty, then reduce funds by current_funds * a random percentage ranging from 5% to 30%
         elif property_at_position.get_property_name() == "Penalty":
-            fine = round(self.get_fund() * (random.randint(5, 30) / 100))
+            fine = round(self.get_fund() * (self.rng.randint(5, 30) / 100))
             self.reduce_fund(fine)
-            print("{} landed on Penalty and has been fined ${}.".format(self.get_name(), fine))
+            if self.event_log is not None:
+                self.event_log.record(PenaltyEvent(self.event_log.seat_of(self), fine))
+            self.output.emit("penalty", "{player} landed on Penalty and has been fined ${amount}.", player = self.get_name(), amount = fine)
         
         # If the property at current position is either owned by the bank or the player who landed on it, set purchasable_or_own_property to True
         elif property_at_position.get_owner() == "Bank" or property_at_position.get_owner() == self:
@@ -489,14 +768,14 @@ class Player:
             
             # Check whether the owner is the bank, if it is then print out that the "{player} has landed on {property_name}"
             if property_at_position.get_owner() == "Bank":
-                print("{} landed on {}.".format(self.get_name(), property_at_position.get_property_name()))
+                self.output.emit("landed", "{player} landed on {property}.", player = self.get_name(), property = property_at_position.get_property_name())
             # Else, it would mean that the player who landed on the property is the property owner of said property, in that case we would print out that the "{player} has landed on {property_name}, a property that they own."
             else:
-                print("{} landed on {}, a property that they own.".format(self.get_name(), property_at_position.get_property_name()))
+                self.output.emit("landed", "{player} landed on {property}, a property that they own.", player = self.get_name(), property = property_at_position.get_property_name())
         
         # In the event that the property is owned by another player, pay rent to the player.
         else:
-            print("{} landed on {}, a property owned by {}.".format(self.get_name(), property_at_position.get_property_name(), property_at_position.get_owner()))
+            self.output.emit("landed", "{player} landed on {property}, a property owned by {owner}.", player = self.get_name(), property = property_at_position.get_property_name(), owner = property_at_position.get_owner().get_name())
             self.pay_rent(property_at_position)
         
         # Return the boolean that states whether the property is owned by the player or that it is purchasable.
@@ -1,35 +1,41 @@
+from output_sink import DEFAULT_SINK, OutputSink
+from property_catalog import CatalogEntry
+
 class Property:
     """
-    Class that represents a property.
+    Class that represents a property standing on the board of one game.
+
+    The data that never changes, the name, costs and colour group, is kept in a CatalogEntry shared by every game built from the same data set, and the property only keeps what changes during its game.
 
     Attributes:
         - ORIGINAL_OWNER: A string representing the owner of property before game.
-        - COLOUR_GROUPS: A list of all possible colour group of properties.
-        - property_name: A string of the name of property.
-        - property_cost: An integer of the cost of property.
-        - hotel_cost: An integer of the cost of building a hotel.
-        - rent_price: An integer of the rental price when other player landed on this property.
-        - colour_group: A string of colour group where this property belongs.
+        - entry: The CatalogEntry of the name, costs and colour group of the property.
+        - rent_price: An integer of the rental price when other player landed on this property, it starts at the rent price of the entry.
         - hotels_built: An integer of how many hotel has been built on this property.
         - location: A tuple representing (row,column) of the property.
         - owner: A string of the ORIGINAL_OWNER or A class of player after being purchased.
+        - observers: A tuple of objects told through their property_changed method whenever the owner, hotels or rent of this property change.
 
     Behaviour:
         - Constructor: A method that is called when an object is created.
+        - from_entry: Makes a property standing on a catalog entry.
         - Getters: Methods that returns the provided attributes.
         - Setters: Methods that changes the provided attributes.
         - construct_hotel: Methods that construct hotel on this property upon called.
+        - add_observer: Registers an object to be told about changes to this property.
+        - remove_observer: Stops telling an object about changes to this property.
+        - notify_observers: Tells every observer that this property has changed.
     """
 
+    # Every property keeps its attributes in fixed slots instead of a per-instance dictionary, big boards hold tens of thousands of properties
+    __slots__ = ("entry", "rent_price", "hotels_built", "location", "owner", "observers")
+
     # The original owner of the properties is the Bank, so set up ORIGINAL_OWNER = "Bank"
     ORIGINAL_OWNER = "Bank"
 
-    # We only have four colour groups and they are "Blue", "Green", "Red" and "Yellow".
-    COLOUR_GROUPS = ["Blue", "Green", "Red", "Yellow"]
-
     def __init__(self, property_name: str, property_cost: int, hotel_cost: int, rent_price: int, colour_group: str) -> None:
         """
-        Constructor method for Property class.
+        Constructor method for Property class, it makes a CatalogEntry of its own, games built from a data set use from_entry to share the entries of a PropertyCatalog instead.
     
         Arguments:
             - property_name: A string representing name of the property
@@ -41,21 +47,12 @@ class Property:
         Returns:
             - None
         """
-        # Set up a string that represents the name of the property
-        self.property_name = property_name.title()
-
-        # Set up an integer that represents the cost of the property 
-        self.property_cost = property_cost
-
-        # Set up an integer that represents the cost of building a hotel on that property
-        self.hotel_cost = hotel_cost
+        # Set up the entry that holds the name, the costs, the rent price the property starts with and the colour group
+        self.entry = CatalogEntry(property_name, property_cost, hotel_cost, rent_price, colour_group)
 
         # Set up an integer that represents the rent price which a player must pay when entering another player's property
         self.rent_price = rent_price
 
-        # Set up a string that represents the colour group which the property belongs to
-        self.colour_group = colour_group
-
         # Set up an integer that represents how many hotels have been built on the property
         self.hotels_built = 0
 
@@ -65,6 +62,41 @@ class Property:
         # Set up a string that represents the original owner of the property
         self.owner = Property.ORIGINAL_OWNER
 
+        # Set up an empty tuple of observers, most properties never get one so nothing is allocated until then
+        self.observers = ()
+
+    @staticmethod
+    def from_entry(entry: CatalogEntry) -> "Property":
+        """
+        Makes a property standing on a catalog entry, without making or parsing anything else, this is how every game built from a PropertyCatalog lays out its board.
+
+        Arguments:
+            - entry: The CatalogEntry of the property, it is shared and never changed
+
+        Returns:
+            - A Property owned by the bank with no hotels and no location yet
+        """
+        property = Property.__new__(Property)
+        property.entry = entry
+        property.rent_price = entry.rent_price
+        property.hotels_built = 0
+        property.location = (None, None)
+        property.owner = Property.ORIGINAL_OWNER
+        property.observers = ()
+        return property
+
+    def get_entry(self) -> CatalogEntry:
+        """
+        Getter method for variable entry.
+        
+        Arguments:
+            - None
+
+        Returns:
+            - entry: The CatalogEntry of the property
+        """
+        return self.entry
+
     def get_property_name(self) -> str:
         """
         Getter method for variable property_name.
@@ -75,7 +107,7 @@ class Property:
         Returns:
             - property_name: A string representing name of the property
         """
-        return self.property_name
+        return self.entry.property_name
 
     def get_property_cost(self) -> int:
         """
@@ -87,7 +119,7 @@ class Property:
         Returns:
             - property_cost: An integer representing the cost of the property acquisition
         """
-        return self.property_cost
+        return self.entry.property_cost
 
     def get_hotel_cost(self) -> int:
         """
@@ -99,7 +131,7 @@ class Property:
         Returns:
             - hotel_cost: An interger representing the cost of hotel construction 
         """
-        return self.hotel_cost
+        return self.entry.hotel_cost
 
     def get_hotels_built(self) -> int:
         """
@@ -135,7 +167,7 @@ class Property:
         Returns:
             - colour_group: A string representing the colour group the property belongs to
         """
-        return self.colour_group
+        return self.entry.colour_group
 
     def get_owner(self) -> object:
         """
@@ -172,6 +204,7 @@ class Property:
             - None
         """
         self.owner = owner
+        self.notify_observers()
 
     def set_rent_price(self, rent_price: int) -> None:
         """
@@ -184,6 +217,20 @@ class Property:
             - None
         """
         self.rent_price = rent_price
+        self.notify_observers()
+
+    def set_hotels_built(self, hotels_built: int) -> None:
+        """
+        Setter method for variable hotels_built.
+        
+        Arguments:
+            - hotels_built: An integer representing the number of hotels built on the property
+
+        Returns:
+            - None
+        """
+        self.hotels_built = hotels_built
+        self.notify_observers()
 
     def set_location(self, location: tuple) -> None:
         """
@@ -197,28 +244,68 @@ class Property:
         """
         self.location = location
 
-    def construct_hotel(self) -> None:
+    def construct_hotel(self, output: OutputSink = None) -> None:
         """
         This is a method for determine whether a hotel can be built and for constructing one if it can.
         
         Arguments:
-            - None
+            - output: The OutputSink to tell the players what happened through, None for the shared default one
 
         Returns:
             - None
         """
+        if output is None:
+            output = DEFAULT_SINK
+
         # Check whether the player has built two hotels on the same property or not, if they have, then print out they've built the maximum number of hotels allowed on the property.
         if self.get_hotels_built() != 2:
-            self.hotels_built = self.get_hotels_built() + 1
+            self.set_hotels_built(self.get_hotels_built() + 1)
             
             # Check whether hotels_built is greater than 1 in order to print the appropriate string
             if self.get_hotels_built() > 1:
-                print("{} hotels have been built on {}.".format(self.hotels_built,self.property_name))
+                output.emit("hotel", "{hotels} hotels have been built on {property}.", hotels = self.hotels_built, property = self.entry.property_name)
             else:
-                print("{} hotel has been built on {}.".format(self.hotels_built,self.property_name))
+                output.emit("hotel", "{hotels} hotel has been built on {property}.", hotels = self.hotels_built, property = self.entry.property_name)
         else:
-            print("The maximum number of hotels have been built on {}.".format(self.property_name))
+            output.emit("hotel_limit", "The maximum number of hotels have been built on {property}.", property = self.entry.property_name)
     
+    def add_observer(self, observer) -> None:
+        """
+        Registers an object to be told about changes to this property, it must have a property_changed(property) method.
+        
+        Arguments:
+            - observer: The object to tell
+
+        Returns:
+            - None
+        """
+        self.observers = self.observers + (observer,)
+
+    def remove_observer(self, observer) -> None:
+        """
+        Stops telling an object about changes to this property.
+        
+        Arguments:
+            - observer: The object to stop telling
+
+        Returns:
+            - None
+        """
+        self.observers = tuple(registered for registered in self.observers if registered is not observer)
+
+    def notify_observers(self) -> None:
+        """
+        Tells every observer that the owner, hotels or rent of this property have changed.
+        
+        Arguments:
+            - None
+
+        Returns:
+            - None
+        """
+        for observer in self.observers:
+            observer.property_changed(self)
+
     def __str__(self) -> str:
         """
         A special method that is used to define how an object should be represented as a string.
@@ -229,7 +316,7 @@ class Property:
         Returns:
             - property_name: A string representing name of the property
         """
-        return self.property_name
+        return self.entry.property_name
 
     def __repr__(self) -> str:
         """
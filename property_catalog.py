@@ -0,0 +1,233 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import os
+import sys
+
+
+class CatalogEntry:
+    """
+    A class holding the data of one property of a data set that never changes during a game, shared by every board built from the data set.
+    What does change during a game, the owner, the hotels built, the location and the rent price, is kept by the Property standing on the board, which only refers to its entry.
+
+    Entries are never changed once they are made, so every Property of every game in the process can share one.
+
+    Attributes:
+        - property_name: A string of the name of the property, in title case.
+        - property_cost: An integer of the cost of the property, None for a chance tile.
+        - hotel_cost: An integer of the cost of building a hotel, None for a chance tile.
+        - rent_price: An integer of the rent price the property starts a game with, None for a chance tile.
+        - colour_group: A string of the colour group of the property, None for a chance tile.
+
+    Behaviours:
+        - key: Returns the data of the entry as a tuple, equal entries have equal keys.
+    """
+
+    __slots__ = ("property_name", "property_cost", "hotel_cost", "rent_price", "colour_group")
+
+    def __init__(self, property_name: str, property_cost: int, hotel_cost: int, rent_price: int, colour_group: str) -> None:
+        """
+        Constructor method for CatalogEntry class.
+
+        Arguments:
+            - property_name: A string of the name of the property, it is put in title case and interned
+            - property_cost: An integer of the cost of the property
+            - hotel_cost: An integer of the cost of building a hotel
+            - rent_price: An integer of the rent price the property starts a game with
+            - colour_group: A string of the colour group of the property
+
+        Returns:
+            - None
+        """
+        # Title casing makes a new string, so intern that one, it is the string every Property of the entry shares
+        self.property_name = sys.intern(property_name.title())
+        self.property_cost = property_cost
+        self.hotel_cost = hotel_cost
+        self.rent_price = rent_price
+        self.colour_group = colour_group
+
+    def key(self) -> tuple:
+        """
+        Returns the data of the entry as a tuple, equal entries have equal keys.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A tuple of (property_name, property_cost, hotel_cost, rent_price, colour_group)
+        """
+        return (self.property_name, self.property_cost, self.hotel_cost, self.rent_price, self.colour_group)
+
+
+class PropertyCatalog:
+    """
+    A class holding the entries of one data set, parsed and interned once per process so that every game started from the same data set skips parsing it again and shares its entries.
+
+    Catalogs are cached by where their data came from: the rows and delimiter of CSV data, or the path, delimiter, size and modification time of a CSV file.
+    Within a catalog, rows with the same data share one entry, and every name and colour group string is interned, so a board with thousands of properties of four colours only holds four colour strings.
+
+    Attributes:
+        - PENALTY: The CatalogEntry of the penalty chance tile
+        - REWARD: The CatalogEntry of the reward chance tile
+        - MAX_CATALOGS: An integer of how many catalogs are kept before the oldest one is thrown away
+        - catalogs: A dictionary whose key describes where the data of a catalog came from and whose value is the catalog, shared by every game in the process
+        - entries: A tuple of the CatalogEntry of every row, in the order of the data set
+        - colours: A tuple of the colour groups of the catalog, in the order they were first found
+
+    Behaviours:
+        - get_entries: Getter method for variable entries.
+        - get_colours: Getter method for variable colours.
+        - iter_entries: Reads CSV data one line at a time and makes a CatalogEntry per row.
+        - from_csv: Returns the catalog of CSV data, parsing it the first time it is asked for.
+        - from_file: Returns the catalog of a CSV file, reading it the first time it is asked for and again if the file has changed.
+        - cached: Returns a cached catalog, building it the first time it is asked for.
+    """
+
+    # The chance tiles hold no data of their own, every board shares these two entries
+    PENALTY = CatalogEntry("Penalty", None, None, None, None)
+    REWARD = CatalogEntry("Reward", None, None, None, None)
+
+    # Every catalog holds one entry per row, so only keep a bounded number of them around
+    MAX_CATALOGS = 16
+
+    # Catalogs that have already been built, shared by every game in the process
+    catalogs = dict()
+
+    def __init__(self, entries) -> None:
+        """
+        Constructor method for PropertyCatalog class, rows with the same data share one entry.
+
+        Arguments:
+            - entries: An iterable of CatalogEntry
+
+        Returns:
+            - None
+        """
+        interned = dict()
+        colours = dict()
+        kept = []
+        for entry in entries:
+            entry = interned.setdefault(entry.key(), entry)
+            colours[entry.colour_group] = None
+
+            # A data set may list the same property twice, the board still gets both tiles but they share the entry
+            kept.append(entry)
+        self.entries = tuple(kept)
+        self.colours = tuple(colours)
+
+    def get_entries(self) -> tuple:
+        """
+        Getter method for variable entries.
+
+        Arguments:
+            - None
+
+        Returns:
+            - entries: A tuple of the CatalogEntry of every row, in the order of the data set
+        """
+        return self.entries
+
+    def get_colours(self) -> tuple:
+        """
+        Getter method for variable colours.
+
+        Arguments:
+            - None
+
+        Returns:
+            - colours: A tuple of the colour groups of the catalog, in the order they were first found
+        """
+        return self.colours
+
+    @staticmethod
+    def iter_entries(lines, delimiter: str):
+        """
+        Reads CSV data one line at a time and makes a CatalogEntry per row, as they are asked for.
+        The column indices are looked up once from the header, so rows can be streamed from a file or any other iterable of lines without keeping the raw text around.
+
+        Arguments:
+            - lines: An iterable of strings whose first non-empty line contains our column names, like a list of rows or an open file
+            - delimiter: A string that specifies the delimiter we used
+
+        Returns:
+            - A generator of CatalogEntry
+        """
+        column_name = None
+
+        for row in lines:
+            # Get rid of the line ending left by files and skip any empty line
+            row = row.rstrip("\r\n")
+            if row == "":
+                continue
+
+            # The first line we meet contains our column names, so look up where every column is just once
+            if column_name is None:
+                column_name = row.split(delimiter)
+                rent_price_index = column_name.index("rent_price")
+                property_cost_index = column_name.index("property_cost")
+                hotel_cost_index = column_name.index("hotel_cost")
+                property_name_index = column_name.index("property_name")
+                colour_group_index = column_name.index("colour_group")
+                continue
+
+            # Use the delimiter to split our row into an array and make an entry from it, the entry title cases and interns the name and the colour group is interned here
+            row = row.split(delimiter)
+            yield CatalogEntry(row[property_name_index], int(row[property_cost_index]), int(row[hotel_cost_index]), int(row[rent_price_index]), sys.intern(row[colour_group_index]))
+
+    @staticmethod
+    def cached(key: tuple, build) -> "PropertyCatalog":
+        """
+        Returns a cached catalog, building it the first time it is asked for and throwing the oldest one away when there are too many.
+
+        Arguments:
+            - key: A tuple describing where the data of the catalog comes from
+            - build: A function with no arguments that returns the catalog
+
+        Returns:
+            - A PropertyCatalog
+        """
+        catalog = PropertyCatalog.catalogs.get(key)
+
+        # Only build the catalog on the first call for this data
+        if catalog is None:
+            catalog = build()
+            PropertyCatalog.catalogs[key] = catalog
+            if len(PropertyCatalog.catalogs) > PropertyCatalog.MAX_CATALOGS:
+                del PropertyCatalog.catalogs[next(iter(PropertyCatalog.catalogs))]
+
+        return catalog
+
+    @staticmethod
+    def from_csv(data: list, delimiter: str) -> "PropertyCatalog":
+        """
+        Returns the catalog of CSV data, parsing it the first time it is asked for.
+
+        Arguments:
+            - data: A list of strings that contains our CSV data, the first one contains our column names
+            - delimiter: A string that specifies the delimiter we used
+
+        Returns:
+            - A PropertyCatalog
+        """
+        # The rows themselves are the key, strings remember their hash so this costs far less than parsing them again
+        return PropertyCatalog.cached(("csv", tuple(data), delimiter), lambda: PropertyCatalog(PropertyCatalog.iter_entries(data, delimiter)))
+
+    @staticmethod
+    def from_file(file_path: str, delimiter: str = ",") -> "PropertyCatalog":
+        """
+        Returns the catalog of a CSV file, reading it one line at a time the first time it is asked for and again if the file has changed since.
+
+        Arguments:
+            - file_path: A string of the path to the CSV file, its first line contains our column names
+            - delimiter: A string that specifies the delimiter we used
+
+        Returns:
+            - A PropertyCatalog
+        """
+        def build() -> PropertyCatalog:
+            with open(file_path, "r", encoding="utf-8") as csv_file:
+                return PropertyCatalog(PropertyCatalog.iter_entries(csv_file, delimiter))
+
+        status = os.stat(file_path)
+        return PropertyCatalog.cached(("file", os.path.abspath(file_path), delimiter, status.st_size, status.st_mtime_ns), build)
@@ -3,6 +3,7 @@
 # Date Edited:
 
 from property import Property
+from property_catalog import PropertyCatalog
 import random
 import property_csv_data_a
 import property_csv_data_b
@@ -17,10 +18,17 @@ class PropertyGenerator:
     - properties: A list that contains our Property instances
     - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
     - number_of_locations: An integer that contains the number of properties
+    - rng: The random number generator used to lay out the board, the random module unless a seeded random.Random is set
+    - colours: A dictionary whose keys are the colour groups of every catalog loaded, in the order the catalogs list them, used as an ordered set
 
     Behaviours:
-    - csv_to_properties: Reads data off of a CSV and then creates a new Property object which later gets appended to a list.
-    - property_location_generator: Generates the property locations by fetching the number of properties and assigning a random position to the property.
+    - set_rng: Sets the random number generator used to lay out the board.
+    - get_colours: Returns the colour groups of every catalog loaded.
+    - iter_properties: Reads CSV data one line at a time and creates the Property objects lazily.
+    - catalog_to_properties: Appends a new Property object for every entry of a PropertyCatalog.
+    - csv_to_properties: Appends a new Property object for every row of CSV data, parsing it only once per process.
+    - csv_file_to_properties: Appends a new Property object for every row of a CSV file, reading it only once per process.
+    - property_location_generator: Generates the property locations by fetching the number of properties and assigning a random position to the property, optionally with a single shuffle for big boards.
     """
 
     def __init__(self) -> None:
@@ -41,53 +49,108 @@ class PropertyGenerator:
         # Set up an integer that contains the number of properties and set it to zero initially
         self.number_of_locations = 0
 
-    def csv_to_properties(self, data: str, delimiter: str) -> None:
+        # Set up the random number generator, the random module by default so that boards are not seeded unless asked to be
+        self.rng = random
+
+        # Set up the colour groups of the catalogs, in the order they list them
+        self.colours = dict()
+
+    def set_rng(self, rng: random.Random) -> None:
         """
-        Reads data off of a CSV and then creates a new Property object which later gets appended to a list.
+        Setter method for variable rng.
 
         Arguments:
-            - data: A string that contains our CSV data
+            - rng: A random.Random instance, seeding it makes the board layout reproducible
+
+        Returns:
+            - None
+        """
+        self.rng = rng
+
+    def get_colours(self) -> list[str]:
+        """
+        Returns the colour groups of every catalog loaded, in the order the catalogs list them, this is the colour set of the game and the index of a colour group is its colour id.
+
+        Arguments:
+            - None
+
+        Returns:
+            - A list of strings of the colour groups
+        """
+        return list(self.colours)
+
+    def iter_properties(self, lines, delimiter: str):
+        """
+        Reads CSV data one line at a time and creates the Property objects lazily, one per row, as they are asked for.
+        Every property gets an entry of its own, data sets that are used for more than one game should go through a PropertyCatalog instead.
+
+        Arguments:
+            - lines: An iterable of strings whose first non-empty line contains our column names, like a list of rows or an open file
             - delimiter: A string that specifies the delimiter we used
 
+        Returns:
+            - A generator of Property objects
+        """
+        for entry in PropertyCatalog.iter_entries(lines, delimiter):
+            self.colours[entry.colour_group] = None
+            yield Property.from_entry(entry)
+
+    def catalog_to_properties(self, catalog: PropertyCatalog) -> None:
+        """
+        Creates a new Property object standing on every entry of a catalog and appends it to the properties list, nothing is parsed.
+
+        Arguments:
+            - catalog: A PropertyCatalog
+
         Returns:
             - None
         """
-        # First get the column names
-        column_name = data[0].split(delimiter)
+        self.properties.extend(Property.from_entry(entry) for entry in catalog.get_entries())
+        self.colours.update(dict.fromkeys(catalog.get_colours()))
 
-        # Skip the first entry in the data list as that just contains our column names
-        for row in data[1:]:
-            # Use the delimiter to split our row into an array
-            row = row.split(delimiter)
+    def csv_to_properties(self, data: list, delimiter: str) -> None:
+        """
+        Creates a new Property object for every row of CSV data and appends it to the properties list.
+        The data is only parsed the first time it is used in the process, after that the properties stand on the entries of its cached PropertyCatalog.
 
-            # Look for the index of our columns and then fetch the respective data of the row at that index
-            rent_price = int(row[column_name.index("rent_price")])
-            property_cost = int(row[column_name.index("property_cost")])
-            hotel_cost = int(row[column_name.index("hotel_cost")])
-            property_name = row[column_name.index("property_name")]
-            key = row[column_name.index("key")]
-            colour_group = row[column_name.index("colour_group")]
+        Arguments:
+            - data: A list of strings that contains our CSV data, the first one contains our column names
+            - delimiter: A string that specifies the delimiter we used
 
-            # Create a property object
-            property_obj = Property(property_name, property_cost, hotel_cost, rent_price, colour_group)
+        Returns:
+            - None
+        """
+        self.catalog_to_properties(PropertyCatalog.from_csv(data, delimiter))
 
-            # Append it to the properties list
-            self.properties.append(property_obj)
+    def csv_file_to_properties(self, file_path: str, delimiter: str = ",") -> None:
+        """
+        Creates a new Property object for every row of a CSV file and appends it to the properties list.
+        The file is read one line at a time, so big catalogs never have to fit in memory as text, and only the first time it is used in the process or after it has changed.
 
-    def property_location_generator(self) -> None:
+        Arguments:
+            - file_path: A string of the path to the CSV file, its first line contains our column names
+            - delimiter: A string that specifies the delimiter we used
+
+        Returns:
+            - None
+        """
+        self.catalog_to_properties(PropertyCatalog.from_file(file_path, delimiter))
+
+    def property_location_generator(self, shuffle_layout: bool = False, chance_tiles: int = 4) -> None:
         """
         Generates the property locations by fetching the number of properties and assigning a random position to the property.
 
         Arguments:
-            - None
+            - shuffle_layout: A boolean, if true the board is laid out with a single shuffle of every tile which takes time in proportion to the size of the board, if false the original draw-and-remove loop is used
+            - chance_tiles: An integer of the least number of chance tiles, more are added to make the board square
 
         Output:
             - None
         """
         # First find the number of properties that exist
         number_of_properties = len(self.properties)
-        # There should at the very least be 4 chance grids, so add the number 4
-        number_of_properties += 4
+        # There should at the very least be 4 chance grids, or as many as were asked for
+        number_of_properties += max(4, chance_tiles)
 
         # Find the square root of number_of_properties
         root_value = math.sqrt(number_of_properties)
@@ -112,8 +175,20 @@ class PropertyGenerator:
         number_of_penalty_grids = number_of_chance_grids // 2
 
         # Set up two instances of penalties and rewards
-        penalty_object = Property("Penalty", None, None, None, None)
-        reward_object = Property("Reward", None, None, None, None)
+        penalty_object = Property.from_entry(PropertyCatalog.PENALTY)
+        reward_object = Property.from_entry(PropertyCatalog.REWARD)
+
+        # If we want the shuffled layout, line every tile up once, shuffle them in place with a single Fisher-Yates pass and deal them out row by row
+        if shuffle_layout:
+            list_of_properties.extend([penalty_object] * number_of_penalty_grids)
+            list_of_properties.extend([reward_object] * (number_of_chance_grids - number_of_penalty_grids))
+            self.rng.shuffle(list_of_properties)
+
+            for index, property_obj in enumerate(list_of_properties):
+                location = divmod(index, int(root_value))
+                self.property_locations[location] = property_obj
+                property_obj.set_location(location)
+            return
 
         # Create placeholders within the list_of_properties that will be replaced with either penalty or reward instances.
         list_of_properties.extend("P" * number_of_penalty_grids)
@@ -124,7 +199,7 @@ class PropertyGenerator:
             for column in range(int(root_value)):
 
                 # Choose a random element within that list, it can either be a property, "P" or "R"
-                random_element = random.choice(list_of_properties)
+                random_element = self.rng.choice(list_of_properties)
 
                 # Check whether the random element is neither a "P" or an "R" which would mean that our current location will contain a normal property
                 if random_element != "P" and random_element != "R":
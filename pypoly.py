@@ -1,3 +1,4 @@
+import argparse
 import time
 import math
 import random
@@ -6,6 +7,13 @@ from property_generator import PropertyGenerator
 from player import Player
 from player_move import PerpendicularPlayer, DiagonalPlayer, LPlayer
 from ai_player import AIPlayer
+from market_index import MarketIndex
+from board_version import BoardVersion
+from turn_profiler import TurnProfiler
+from board_renderer import BoardRenderer
+from event_log import EventLog, MoveEvent, QuitEvent, WinEvent
+from output_sink import DEFAULT_SINK, OutputSink, BufferedSink
+from ai_decision_pool import AIDecisionPool
 
 import property_csv_data_a
 import property_csv_data_b
@@ -20,23 +28,37 @@ class PyPoly:
     - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value.
     - win_requirement: An integer that will store our winning condition/requirement
     - ongoing: A boolean that represents whether the game is ongoing or not 
+    - profiler: A TurnProfiler that times the phases of every turn, it records nothing unless it has been enabled
+    - board_renderer: The BoardRenderer every player's board is drawn with
+    - event_log: The EventLog every turn, move and transaction of the game is recorded in, None to record nothing
+    - output: The OutputSink everything the game and its players say is written to, it is flushed before every prompt, before the board is drawn and at the end of every turn
+    - ai_pool: The AIDecisionPool the moves of the AIPlayers are worked out in, None to work them out in place
+    - turn_count: An integer of the number of turns played so far
+    - market_index: The MarketIndex of the properties the bank still owns, shared by every AIPlayer
+    - board_version: The BoardVersion that counts the changes to the board, shared by every AIPlayer
 
     Behaviours:
+    - prompt: Flushes the output and asks the user to type something in.
     - validate_range_input: Prompts the user to type a value that is within the range, if the value is not within the range, it will keep on prompting until it is.
     - ai_thinking: This function is responsible for printing out that the AI is thinking, it handles generating a random delay to generate suspense.
     - pre_start_game: Essentially asks for the number of players, player names, winning condition and what data it should use.
     - regular_player_turn: This function is responsible for playing a normal player's turn
     - ai_player_turn: This function is responsible for playing an AIPlayer's turn, very similar to regular_player_turn but the options are chosen automatically by the AIPlayer.
+    - action_phase: Names the profiler phase of resolving the tile a player landed on.
 
     """
 
-    def __init__(self) -> None:
+    def __init__(self, profiler: TurnProfiler = None, board_renderer: BoardRenderer = None, event_log: EventLog = None, output: OutputSink = None, ai_pool: AIDecisionPool = None) -> None:
         """
         A constructor method for the PyPoly class.
         Calls self.pre_start_game() as soon as it is done constructing.
 
         Arguments:
-        - none
+        - profiler: A TurnProfiler to time the phases of every turn with, None for a disabled one
+        - board_renderer: A BoardRenderer to draw the board with, None for one that draws every frame in full
+        - event_log: An EventLog to record the game in, None to record nothing, it is closed when the game ends
+        - output: An OutputSink to write to, None for the shared console one that prints straight away
+        - ai_pool: An AIDecisionPool to work out the moves of the AIPlayers in with a time budget, None to work them out in place, it is closed when the game ends
 
         Returns:
         - none
@@ -48,17 +70,58 @@ class PyPoly:
         # Set up a dictionary that will contain our property locations. Our key would be our tuple that represents the coordinate of the property, and our value is our property instance.
         self.property_locations = dict()
 
+        # Set up a variable that will store the market index of the board once it has been generated
+        self.market_index = None
+
+        # Set up a variable that will store the counter of changes to the board once it has been generated
+        self.board_version = None
+
         # Set up a variable that will store our winning condition/requirement
         self.win_requirement = 0
         
         # Set up a variable that keeps track of whether the game is ongoing or not, have it set up as True initially
         self.ongoing = True
 
+        # Set up the profiler, a disabled one unless we were handed one
+        if profiler is None:
+            profiler = TurnProfiler()
+        self.profiler = profiler
+
+        # Set up the board renderer, one that draws every frame in full unless we were handed one
+        if board_renderer is None:
+            board_renderer = BoardRenderer()
+        self.board_renderer = board_renderer
+
+        # Set up the event log and the count of turns stamped on its events
+        self.event_log = event_log
+        self.turn_count = 0
+
+        # Set up the output sink, the shared console one unless we were handed one
+        if output is None:
+            output = DEFAULT_SINK
+        self.output = output
+
+        # Set up the pool the AIPlayers decide in, they decide in place unless we were handed one
+        self.ai_pool = ai_pool
+
         # Start up pre_start_game to start getting information regarding the game.
         self.pre_start_game()
 
 ######################################   Misc   ######################################
 
+    def prompt(self, text: str) -> str:
+        """
+        Flushes the output, so that everything said so far is on the screen, and asks the user to type something in.
+
+        Arguments:
+        - text: A string that asks the players to input something
+
+        Returns:
+        - A string of what the user typed in
+        """
+        self.output.flush()
+        return input(text)
+
     def validate_range_input(self, prompt: str, range: tuple, display_bounds: bool) -> int:
         """
         Prompts the user to type a value that is within the range, if the value is not within the range, it will keep on prompting until it is.
@@ -74,9 +137,9 @@ class PyPoly:
         
         # If display_bounds is true, then display the boundaries like (1 → 2) alongside the prompt while asking for input, else do not display the bounds only
         if display_bounds:
-            input_value = input("{prompt} ({range_low} → {range_high}): ".format(prompt = prompt, range_low = range[0], range_high = range[1]))
+            input_value = self.prompt("{prompt} ({range_low} → {range_high}): ".format(prompt = prompt, range_low = range[0], range_high = range[1]))
         else:
-            input_value = input("{prompt}".format(prompt = prompt))
+            input_value = self.prompt("{prompt}".format(prompt = prompt))
 
         # This while loop stays True and the only way to exit it is when our input value has been confirmed to be a digit and is within bounds
         while(True):
@@ -90,7 +153,7 @@ class PyPoly:
                     break
             
             # Asks the user to enter a valid number if it is not a digit or if it is not within the bounds
-            input_value = input("Please enter a valid number ({range_low} → {range_high}): ".format(range_low = range[0], range_high = range[1]))
+            input_value = self.prompt("Please enter a valid number ({range_low} → {range_high}): ".format(range_low = range[0], range_high = range[1]))
         
         # Return our input back as a number
         return int(input_value)
@@ -119,7 +182,7 @@ class PyPoly:
             divided_delay = delay/3
 
             # Print out our thinking string
-            print(thinking, end='\r')
+            self.output.emit("thinking", thinking, end = '\r')
 
             # Add in a dot to our thinking string for the next time around
             thinking += "."
@@ -127,6 +190,21 @@ class PyPoly:
             # Sleep by our divided delay
             time.sleep(divided_delay)
 
+    def action_phase(self, player_obj) -> str:
+        """
+        Names the profiler phase of resolving the tile a player landed on, landing on a property owned by somebody else means paying rent.
+
+        Arguments:
+        - player_obj: An instance of any player
+
+        Returns:
+        - A string of the name of the phase
+        """
+        owner = self.property_locations[player_obj.get_position()].get_owner()
+        if owner != "Bank" and owner != player_obj and owner is not None:
+            return "rent_payment"
+        return "determine_action"
+
 ########################################## Pre-start ##########################################
 
     def pre_start_game(self):
@@ -144,11 +222,11 @@ class PyPoly:
         # # # Property Generation # # #
 
         # Print out a string that will welcome the player into the game
-        print("\n")
-        print("-"*24)
-        print("Welcome to 💰 PyPoly 💰!")
-        print("-"*24)
-        print("\n")
+        self.output.emit("message", "\n")
+        self.output.emit("message", "-"*24)
+        self.output.emit("message", "Welcome to 💰 PyPoly 💰!")
+        self.output.emit("message", "-"*24)
+        self.output.emit("message", "\n")
 
         # Create a new instance of the PropertyGenerator class in order to generate the property_locations
         property_gen = PropertyGenerator()
@@ -176,11 +254,16 @@ class PyPoly:
         # Save the property locations
         self.property_locations = property_gen.property_locations
 
+        # Index the properties the bank owns once, every AIPlayer shares it
+        self.market_index = MarketIndex(self.property_locations, property_gen.get_colours())
+
+        # Count the changes to the board, so the AIPlayers only re-evaluate after something has changed
+        self.board_version = BoardVersion(self.property_locations)
+
         # # # Players # # #
 
         # Ask for the winning requirement and set the win_requirement
         self.win_requirement = self.validate_range_input("\n\nWhat is the number of properties needed to win?", (1,5), True)
-        AIPlayer.WINNING_CONDITION = self.win_requirement
 
         # Start asking for how many players will play, it is bounded from 2 to 6 players
         number_of_players = self.validate_range_input("\n\nHow many players do you want?", (2, 6), True)
@@ -215,19 +298,19 @@ class PyPoly:
         for regular_player_number in range(number_of_regular_players):
             
             # Fetch player name first and once it has been validated as not a duplicate name or an empty name, append it to the list of player names
-            player_name = input("\n\nWhat is player {number}'s name? \n".format(number = regular_player_number+1))
+            player_name = self.prompt("\n\nWhat is player {number}'s name? \n".format(number = regular_player_number+1))
             while(player_name in list_of_regular_player_names or player_name == ""):
                 if player_name == "":
-                    player_name = input("Please enter a different name as a name cannot be empty. \n")
+                    player_name = self.prompt("Please enter a different name as a name cannot be empty. \n")
                 else:
-                    player_name = input("Please enter a different name as that name is taken. \n")
+                    player_name = self.prompt("Please enter a different name as that name is taken. \n")
             list_of_regular_player_names.append(player_name)
             
             # Print out an empty line for the sake of cleanliness
-            print("\n")
+            self.output.emit("message", "\n")
             
             # Ask the user of the player's move trait
-            print("\nWhat is {player_name}'s move trait?".format(player_name = player_name))
+            self.output.emit("message", "\nWhat is {player_name}'s move trait?", player_name = player_name)
             move_trait_choice = self.validate_range_input("[1] Perpendicular \n[2] Diagonal \n[3] L \n", (1, 3), False)
             
             # Create a player instance according to their move trait
@@ -241,6 +324,7 @@ class PyPoly:
             # Set their symbols and names
             player_instance.set_name(player_name)
             player_instance.set_symbol(str(regular_player_number+1))
+            player_instance.set_output(self.output)
 
             # Fetch the property locations and save it as a list
             property_locations = list(self.property_locations.keys())
@@ -266,6 +350,10 @@ class PyPoly:
             
             # Set up a new instance of AIPlayer
             ai_player_instance = AIPlayer()
+            ai_player_instance.set_market_index(self.market_index)
+            ai_player_instance.set_board_version(self.board_version)
+            ai_player_instance.set_winning_condition(self.win_requirement)
+            ai_player_instance.set_output(self.output)
 
             # Choose a random name from the list of possible ai player names and have it removed from the list to avoid duplicate AI player names.
             ai_player_name = random.choice(list_of_possible_ai_player_names)
@@ -290,8 +378,12 @@ class PyPoly:
             # Add the ai_player_instance to our list_of_players
             self.list_of_players.append(ai_player_instance)
 
+        # Record the board and the players as the game starts
+        if self.event_log is not None:
+            self.event_log.start_game(self.property_locations, self.list_of_players)
+
         # Print out empty lines for the sake of cleanliness
-        print("\n \n")
+        self.output.emit("message", "\n \n")
 
         # Start the game as the prerequisites have been met.
         self.start_game()
@@ -313,39 +405,47 @@ class PyPoly:
         row_size = int(math.sqrt(len(self.property_locations)))
         
         # Print out where the player is currently
-        print("\nPlayer {player_name} is currently at location {position}.".format(player_name = player_obj.get_name(), position = player_obj.get_position()))
+        self.output.emit("position", "\nPlayer {player} is currently at location {position}.", player = player_obj.get_name(), position = player_obj.get_position())
 
         # Display the board for the player and the possible positions that they can move towards to.
-        player_obj.display_moves(row_size, True)
+        self.output.flush()
+        with self.profiler.phase("board_rendering"):
+            player_obj.display_moves(row_size, True, self.board_renderer)
 
         # Print out two empty lines for the sake of cleanliness
-        print("\n \n")
+        self.output.emit("message", "\n \n")
 
         # Start asking for the player for them to choose a location to move towards to
         # Start by fetching the valid moves
-        valid_moves_list = player_obj.determine_valid_moves(row_size)
+        with self.profiler.phase("move_generation"):
+            valid_moves_list = player_obj.determine_valid_moves(row_size)
 
         # Display the options of the positions
-        print("Pick one valid move:")
+        self.output.emit("message", "Pick one valid move:")
         for index in range(len(valid_moves_list)):
-            print("[{index}] - {element}".format(index = index + 1, element = valid_moves_list[index]))
+            self.output.emit("option", "[{index}] - {element}", index = index + 1, element = valid_moves_list[index])
         
         # Check whether the input is valid or not and if it is valid, sleep for 3 seconds, then move towards the new location
         choice = self.validate_range_input("",(1, len(valid_moves_list)), False)
         time.sleep(3)
         player_obj.set_position(valid_moves_list[choice-1])
+        if self.event_log is not None:
+            self.event_log.record(MoveEvent(self.event_log.seat_of(player_obj), player_obj.get_position()))
         
         # Print out two empty lines for the sake of cleanliness
-        print("\n \n")
+        self.output.emit("message", "\n \n")
 
         # Print out that the player has moved towards a new location
-        print("Player {player_name} has moved to {position}".format(player_name = player_obj.get_name(), position = player_obj.get_position()))
+        self.output.emit("move", "Player {player} has moved to {position}", player = player_obj.get_name(), position = player_obj.get_position())
 
         # Display the board
-        player_obj.display_moves(row_size, False)
+        self.output.flush()
+        with self.profiler.phase("board_rendering"):
+            player_obj.display_moves(row_size, False, self.board_renderer)
 
         # Determine what action to take based on the player's location while also checking whether the property is purchasable or owned by the player
-        purchasable_or_own_property = player_obj.determine_action(self.property_locations)
+        with self.profiler.phase(self.action_phase(player_obj)):
+            purchasable_or_own_property = player_obj.determine_action(self.property_locations)
 
         # Create a list that will contain our options that the player can choose from
         options_list = []
@@ -367,7 +467,7 @@ class PyPoly:
                 options_list.append("Build a Hotel")
 
         # Check if the player has any properties or not
-        if len(player_obj.get_properties_owned()) != 0:
+        if player_obj.get_number_of_properties_owned() != 0:
 
             # If the player does own a property or more, add in property related options
             options_list.append("Display Owned Properties")
@@ -383,6 +483,8 @@ class PyPoly:
             # Check whether the player has met the win condition, if they have, break out of the while loop and set self.ongoing to False
             if player_obj.check_win(self.win_requirement):
                 self.ongoing = False
+                if self.event_log is not None:
+                    self.event_log.record(WinEvent(self.event_log.seat_of(player_obj)))
                 break
 
             # Sleep for 2 seconds to add some suspense
@@ -395,7 +497,7 @@ class PyPoly:
             user_prompt = ""
 
             # Print out that the user should pick a choice
-            print("\n\nYou have ${funds} in your fund, make a smart pick:".format(funds = player_obj.get_fund()))
+            self.output.emit("fund", "\n\nYou have ${fund} in your fund, make a smart pick:", fund = player_obj.get_fund())
 
             # This will start concatenating our options to user_prompt
             for index in range(len(options_list)):
@@ -420,10 +522,11 @@ class PyPoly:
 
                 # If the user said yes, then proceed with purchase of the property and remove the option from the list
                 if yes_or_no == 1:
-                    player_obj.purchase_property(property)
+                    with self.profiler.phase("buy_build_sell"):
+                        player_obj.purchase_property(property)
 
                     # Check whether "Display Owned Properties" does not exist within the list, if it does not, then add it in and if "Display Owned Properties" does not exist within the list, it is right to assume that "Sell a Property" does not exist either.
-                    if not "Display Owned Properties" in options_list and len(player_obj.get_properties_owned()):
+                    if not "Display Owned Properties" in options_list and player_obj.get_number_of_properties_owned():
                         options_list.insert(0, "Sell A Property")
                         options_list.insert(0, "Display Owned Properties")
 
@@ -442,46 +545,47 @@ class PyPoly:
 
                 # If the user said yes, then proceed with building a hotel
                 if yes_or_no == 1:
-                    player_obj.purchase_hotel(property)
+                    with self.profiler.phase("buy_build_sell"):
+                        player_obj.purchase_hotel(property)
                     options_list.remove(user_choice)
 
             elif user_choice == "Display Owned Properties":
                 
                 # Print out an empty line for the sake of cleanliness
-                print("\n")
+                self.output.emit("message", "\n")
 
                 # Print out dashed lines
-                print("-"*50 + "\n")
+                self.output.emit("message", "-"*50 + "\n")
 
                 # Display player properties
-                player_obj.display_player_properties()
+                player_obj.display_player_properties(self.market_index.get_colours())
 
                 # Print out an empty line for the sake of cleanliness
-                print("\n")
+                self.output.emit("message", "\n")
 
-                owned_properties = player_obj.get_properties_owned()
+                owned_properties = list(player_obj.get_properties_owned())
 
                 # Start printing out the locations of the properties
-                print("Locations:")
+                self.output.emit("message", "Locations:")
                 for index in range(len(owned_properties)):
-                    print("{property_number}. {property_name}, its location {location} and belongs to the color group {color_group}.".format(property_number = index + 1, property_name = owned_properties[index].get_property_name(), location = owned_properties[index].get_location(), color_group = owned_properties[index].get_colour_group()))
+                    self.output.emit("holdings", "{property_number}. {property_name}, its location {location} and belongs to the color group {color_group}.", property_number = index + 1, property_name = owned_properties[index].get_property_name(), location = owned_properties[index].get_location(), color_group = owned_properties[index].get_colour_group())
 
                 # Print out dashed lines
-                print("\n" + "-"*50)
+                self.output.emit("message", "\n" + "-"*50)
             
 
             # If the player would like to sell a property
             elif user_choice == "Sell A Property":
                 
                 # Get a copy of the properties owned by the player and add "Nevermind" to the list of options
-                sell_property_options = player_obj.get_properties_owned().copy()
+                sell_property_options = list(player_obj.get_properties_owned())
                 sell_property_options.append("Nevermind.")
 
                 # Set up a variable that will contain our user prompt
                 user_prompt = ""
 
                 # Print out
-                print("\nChoose a property to sell:")
+                self.output.emit("message", "\nChoose a property to sell:")
 
                 # This will start concatenating our options to user_prompt
                 for index in range(len(sell_property_options)):
@@ -502,16 +606,17 @@ class PyPoly:
                 if sell_property_options[choice-1] != "Nevermind.":
 
                     # Print out an empty line for the sake of cleanliness
-                    print("\n")
+                    self.output.emit("message", "\n")
 
                     # Sell the property
-                    player_obj.sell_property(sell_property_options[choice-1])
+                    with self.profiler.phase("buy_build_sell"):
+                        player_obj.sell_property(sell_property_options[choice-1])
 
                     # Remove the option
                     options_list.remove(user_choice)
 
                     # Also check whether the player owns any more properties or not, if not, remove the option of displaying their own properties
-                    if len(player_obj.get_properties_owned()) == 0:
+                    if player_obj.get_number_of_properties_owned() == 0:
                         options_list.remove("Display Owned Properties")
                         
                         # Check if the option of building hotels still exists, if it does, remove it
@@ -526,21 +631,23 @@ class PyPoly:
             elif user_choice == "Quit Game":
 
                 # Print out two empty lines for the sake of cleanliness
-                print("\n \n")
+                self.output.emit("message", "\n \n")
 
                 # Start selling the properties that the player owns, that is if they own any
-                for property in player_obj.get_properties_owned():
+                for property in list(player_obj.get_properties_owned()):
                     player_obj.sell_property(property)
 
                 # If the player has money, print out that they have donated it to charity
                 if player_obj.get_fund() > 0:
-                    print("\n{player_name} has donated ${amount} to charity!".format(player_name = player_obj.get_name(), amount = player_obj.get_fund()))
+                    self.output.emit("donation", "\n{player} has donated ${amount} to charity!", player = player_obj.get_name(), amount = player_obj.get_fund())
 
                 # Print out that the player has quit the game
-                print("\n{player_name} has quit the game!".format(player_name = player_obj.get_name()))
+                self.output.emit("quit", "\n{player} has quit the game!", player = player_obj.get_name())
 
                 # Remove the player from the list of players
                 self.list_of_players.remove(player_obj)
+                if self.event_log is not None:
+                    self.event_log.record(QuitEvent(self.event_log.seat_of(player_obj)))
 
                 # Break the loop
                 break
@@ -562,50 +669,62 @@ class PyPoly:
         row_size = int(math.sqrt(len(self.property_locations)))
         
         # Print out where the player is currently
-        print("\nPlayer {player_name} is currently at location {position}.".format(player_name = player_obj.get_name(), position = player_obj.get_position()))
+        self.output.emit("position", "\nPlayer {player} is currently at location {position}.", player = player_obj.get_name(), position = player_obj.get_position())
 
         # Display the board for the player and the possible positions that they can move towards to.
-        player_obj.display_moves(row_size, True)
+        self.output.flush()
+        with self.profiler.phase("board_rendering"):
+            player_obj.display_moves(row_size, True, self.board_renderer)
 
         # Start fetching the valid moves and display them to the user
-        valid_moves_list = player_obj.determine_valid_moves(row_size)
+        with self.profiler.phase("move_generation"):
+            valid_moves_list = player_obj.determine_valid_moves(row_size)
 
         # Display the moves that are available
         for index in range(len(valid_moves_list)):
-            print("[{index}] - {element}".format(index = index + 1, element = valid_moves_list[index]))
+            self.output.emit("option", "[{index}] - {element}", index = index + 1, element = valid_moves_list[index])
 
         # Print out an empty line for the sake of cleanliness
-        print("\n")
+        self.output.emit("message", "\n")
         
         # Print out that the AI is thinking, the function handles delays and adds a bit of suspense
         self.ai_thinking(player_obj.get_name())
 
         # Have the AI decide on a location that it would like to move towards to.
-        move = player_obj.ai_move(valid_moves_list, self.property_locations)
+        with self.profiler.phase("ai_move"):
+            if self.ai_pool is not None:
+                move = self.ai_pool.decide(player_obj, valid_moves_list, self.property_locations, self.list_of_players)
+            else:
+                move = player_obj.ai_move(valid_moves_list, self.property_locations)
 
         # Print out empty lines
-        print("")
+        self.output.emit("message", "")
 
         # Print out the option that the AI has picked
-        print(valid_moves_list.index(move)+1)
+        self.output.emit("choice", "{choice}", choice = valid_moves_list.index(move)+1)
         
         # Print out two empty lines for the sake of cleanliness.
-        print("\n \n")
+        self.output.emit("message", "\n \n")
         
         # Sleep for 3 seconds
         time.sleep(3)
 
         # Move the AI and display current location
         player_obj.set_position(move)
+        if self.event_log is not None:
+            self.event_log.record(MoveEvent(self.event_log.seat_of(player_obj), move))
 
         # Print out that the player has moved towards a new location
-        print("Player {player_name} has moved to {position}".format(player_name = player_obj.get_name(), position = player_obj.get_position()))
+        self.output.emit("move", "Player {player} has moved to {position}", player = player_obj.get_name(), position = player_obj.get_position())
 
         # Print out the board
-        player_obj.display_moves(row_size, False)
+        self.output.flush()
+        with self.profiler.phase("board_rendering"):
+            player_obj.display_moves(row_size, False, self.board_renderer)
 
         # Determine what action to take based on the player's location 
-        purchasable_or_own_property = player_obj.determine_action(self.property_locations)
+        with self.profiler.phase(self.action_phase(player_obj)):
+            purchasable_or_own_property = player_obj.determine_action(self.property_locations)
 
         # Set up an options list that will contain our options
         options_list = []
@@ -630,7 +749,7 @@ class PyPoly:
                 options_list.append("Build a Hotel")
         
         # Check whether the AIPlayer owns any properties then add the option of selling properties
-        if len(player_obj.get_properties_owned()) != 0:
+        if player_obj.get_number_of_properties_owned() != 0:
             options_list.append("Display Owned Properties")
             options_list.append("Sell A Property")
 
@@ -639,7 +758,7 @@ class PyPoly:
         options_list.append("Quit Game")
 
         # Print out that the user should pick a choice
-        print("\n\nYou have ${funds} in your fund, make a smart pick:".format(funds = player_obj.get_fund()))
+        self.output.emit("fund", "\n\nYou have ${fund} in your fund, make a smart pick:", fund = player_obj.get_fund())
 
         # This will start concatenating our options to user_prompt which would print out the options that the AI is able to pick
         for index in range(len(options_list)):
@@ -651,7 +770,7 @@ class PyPoly:
                 user_prompt += ": "
 
         # Print out our prompt
-        print(user_prompt)
+        self.output.emit("options", user_prompt)
 
         # Put in a delay and have the AI "think"
         self.ai_thinking(player_obj.get_name())
@@ -666,19 +785,19 @@ class PyPoly:
             if plan == "BUY":
 
                 # Print out our choice
-                print("\n" + str(options_list.index("Purchase the Property") + 1))
+                self.output.emit("choice", "\n{choice}", choice = options_list.index("Purchase the Property") + 1)
 
                 # Print out the property cost and its color group
-                print("\n\nThe price of the property is ${property_cost} and it belongs to the {color_group} color group. \n[1] - Purchase it! \n[2] - Nevermind. \n".format(property_cost = property_at_location.get_property_cost(), color_group = property_at_location.get_colour_group()))
+                self.output.emit("offer", "\n\nThe price of the property is ${property_cost} and it belongs to the {color_group} color group. \n[1] - Purchase it! \n[2] - Nevermind. \n", property_cost = property_at_location.get_property_cost(), color_group = property_at_location.get_colour_group())
 
                 # Add in a delay to make selecting options more natural
                 time.sleep(2)
 
                 # Print out that it has selected the option 1
-                print(1)
+                self.output.emit("choice", "1")
 
                 # Check whether "Display Owned Properties" does not exist within the list, if it does not, then add it in and if "Display Owned Properties" does not exist within the list, it is right to assume that "Sell a Property" does not exist either.
-                if not "Display Owned Properties" in options_list and len(player_obj.get_properties_owned()):
+                if not "Display Owned Properties" in options_list and player_obj.get_number_of_properties_owned():
                     options_list.insert(0, "Sell A Property")
                     options_list.insert(0, "Display Owned Properties")
 
@@ -689,20 +808,20 @@ class PyPoly:
             elif plan == "BUILD":
                 
                 # Print out our choice
-                print("\n" + str(options_list.index("Build a Hotel") + 1))
+                self.output.emit("choice", "\n{choice}", choice = options_list.index("Build a Hotel") + 1)
 
                 # Calculate the rent before building the hotel and after
                 rent_before = round(property_at_location.get_rent_price() * (1 + (0.2 * property_at_location.get_hotels_built())))
                 rent_after = round(property_at_location.get_rent_price() * (1 + (0.2 * (property_at_location.get_hotels_built() + 1 ))))
 
                 # Print out the price of building a hotel and the rent increase, and print out the option that it chose
-                print("\n\nThe cost of building the hotel is {hotel_cost} and the rent will increase from {rent_before} → {rent_after} \n[1] - Build a hotel! \n[2] - Nevermind. \n".format(hotel_cost = property_at_location.get_hotel_cost(), rent_before = rent_before, rent_after = rent_after))
+                self.output.emit("offer", "\n\nThe cost of building the hotel is {hotel_cost} and the rent will increase from {rent_before} → {rent_after} \n[1] - Build a hotel! \n[2] - Nevermind. \n", hotel_cost = property_at_location.get_hotel_cost(), rent_before = rent_before, rent_after = rent_after)
                 
                 # Add in a delay to make selecting options more natural
                 time.sleep(2)
                 
                 # Print out the option that the AI has chosen
-                print(1)
+                self.output.emit("choice", "1")
 
                 # Remove the option of building a hotel
                 options_list.remove("Build a Hotel")
@@ -711,17 +830,17 @@ class PyPoly:
             elif plan == "SELL":
 
                 # Print out our choice
-                print("\n" + str(options_list.index("Sell A Property") + 1))
+                self.output.emit("choice", "\n{choice}", choice = options_list.index("Sell A Property") + 1)
                 
                 # Get a copy of the properties owned by the player and add "Nevermind" to the list of options
-                sell_property_options = player_obj.get_properties_owned().copy()
+                sell_property_options = list(player_obj.get_properties_owned())
                 sell_property_options.append("Nevermind.")
 
                 # Set up a variable that will contain our user prompt
                 user_prompt = ""
 
                 # Print out
-                print("\nChoose a property to sell:")
+                self.output.emit("message", "\nChoose a property to sell:")
 
                 # This will start concatenating our options to user_prompt
                 for index in range(len(sell_property_options)):
@@ -739,11 +858,11 @@ class PyPoly:
                 time.sleep(2)
 
                 # Print out what option it has chosen, and as how the AI has been built, it will only sell the property that it is on currently
-                print(sell_property_options.index(property_at_location) + 1)
+                self.output.emit("choice", "{choice}", choice = sell_property_options.index(property_at_location) + 1)
                 options_list.remove("Sell A Property")
 
                 # Also check whether the player owns any more properties or not, if not, remove the option of displaying their own properties
-                if len(player_obj.get_properties_owned()) == 0:
+                if player_obj.get_number_of_properties_owned() == 0:
                     options_list.remove("Display Owned Properties")
                     
                     # Check if the option of building hotels still exists, if it does, remove it
@@ -751,7 +870,8 @@ class PyPoly:
                         options_list.remove("Build a Hotel")
 
             # Given that an option has been chosen have it buy, build, sell or skip a turn.
-            player_obj.buy_or_build(move, self.property_locations)
+            with self.profiler.phase("buy_build_sell"):
+                player_obj.buy_or_build(move, self.property_locations)
             
             # Reset the user_prompt
             user_prompt = ""
@@ -769,15 +889,17 @@ class PyPoly:
                         user_prompt += ": "
 
                 # Have it select next player
-                print(user_prompt + str(options_list.index("Next Player") + 1))
+                self.output.emit("choice", user_prompt + str(options_list.index("Next Player") + 1))
             
             # In the event that the AI did win, set self.ongoing to False
             else:
                 self.ongoing = False
+                if self.event_log is not None:
+                    self.event_log.record(WinEvent(self.event_log.seat_of(player_obj)))
         
         # In the event that the target is not equal to our current location, have it select "Next Player"
         else:
-            print("\n"+ str(options_list.index("Next Player") + 1))
+            self.output.emit("choice", "\n{choice}", choice = options_list.index("Next Player") + 1)
 
 
 ########################################## Game ##########################################
@@ -805,36 +927,82 @@ class PyPoly:
 
                  # Check if the number of players is 1, as the number of players may reduce if they decide to quit the game, in the event it is one, the remaining player will be the winner of the game.
                 if len(self.list_of_players) == 1:
-                    print("Game Over! {player_name} WINS!".format(player_name = self.list_of_players[0]))
+                    self.output.emit("win", "Game Over! {player} WINS!", player = self.list_of_players[0].get_name())
                     self.ongoing = False
+                    if self.event_log is not None:
+                        self.event_log.record(WinEvent(self.event_log.seat_of(self.list_of_players[0])))
 
                     # Break out of the for loop
                     break
 
                 # Also check if the number of players is 0
                 elif len(self.list_of_players) == 0:
-                    print("Everyone has quit the game.")
+                    self.output.emit("game_over", "Everyone has quit the game.")
                     self.ongoing = False
 
                     # Break out of the for loop
                     break
                 
+                # Count the turn and record whose turn it is
+                self.turn_count += 1
+                if self.event_log is not None:
+                    self.event_log.start_turn(self.turn_count, player)
+
                 # Check the instance of the player, whether it is an AI player or not
                 if isinstance(player, AIPlayer):
-                    self.ai_player_turn(player)
-                    print("\n\n")
+                    with self.profiler.phase("ai_player_turn"):
+                        self.ai_player_turn(player)
+                    self.output.emit("message", "\n\n")
                 else:
                     # If it is not an AI player, then it is a regular player, so run the regular player turn method.
-                    self.regular_player_turn(player)
+                    with self.profiler.phase("regular_player_turn"):
+                        self.regular_player_turn(player)
+
+                # Write out everything said during the turn
+                self.output.flush()
 
                 # Check whether self.ongoing has turned to False, if so break out of the for loop
                 if self.ongoing == False:
                     break
 
+        # Write out the end of the game, then give the terminal back its full height if the board was pinned to the top
+        self.output.flush()
+        self.board_renderer.reset()
+
+        # Print out the profile and save it if the profiler is enabled
+        self.profiler.finish()
+
+        # Write out what is left of the event log
+        if self.event_log is not None:
+            self.event_log.close()
+
+        # Shut the workers of the AIPlayers down
+        if self.ai_pool is not None:
+            self.ai_pool.close()
+
 ####################################################################################
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play PyPoly in the terminal.")
+
+    # --profile prints how long every phase of a turn took at the end of the game, a path after it also saves it as JSON
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="JSON_PATH", help="print how long every phase of a turn took at the end of the game, and save it as JSON if a path is given")
+    # --diff-board pins the board to the top of the terminal and only redraws the cells that changed, which is much faster over slow connections
+    parser.add_argument("--diff-board", action="store_true", help="pin the board to the top of the terminal and only redraw the cells that changed")
+    # --event-log appends every turn, move and transaction of the game to a newline-delimited JSON log
+    parser.add_argument("--event-log", default=None, metavar="PATH", help="append every turn, move and transaction of the game to a newline-delimited JSON log")
+    # --buffered-output holds everything the game says back and writes it out once per turn and before every prompt, instead of printing every line
+    parser.add_argument("--buffered-output", action="store_true", help="write what the game says once per turn and before every prompt instead of line by line")
+    # --ai-deadline works out the moves of the AIPlayers in a worker thread, taking a quick move instead whenever they take longer
+    parser.add_argument("--ai-deadline", type=float, default=None, metavar="SECONDS", help="work out AI moves in a worker thread and take a quick move when a decision takes longer than this")
+    arguments = parser.parse_args()
+
+    game_profiler = TurnProfiler(True, arguments.profile or None) if arguments.profile is not None else None
+    game_board_renderer = BoardRenderer(arguments.diff_board)
+    game_event_log = EventLog(arguments.event_log) if arguments.event_log is not None else None
+    game_output = BufferedSink() if arguments.buffered_output else None
+    game_ai_pool = AIDecisionPool(arguments.ai_deadline) if arguments.ai_deadline is not None else None
+
     # Test your function here
-    game = PyPoly()
+    game = PyPoly(game_profiler, game_board_renderer, game_event_log, game_output, game_ai_pool)
     # game.<add method name here>()
     pass
-
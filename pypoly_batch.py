@@ -0,0 +1,229 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import argparse
+import copy
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from pypoly_simulator import PyPolySimulator, SimulationConfig, SimulationResult
+from catalog_generator import CatalogGenerator
+
+
+def run_seeded_games(config: SimulationConfig, seeds: list) -> list[SimulationResult]:
+    """
+    Plays one headless game per seed with the given config, this is the function each worker process runs.
+
+    Arguments:
+    - config: A SimulationConfig instance, its seed is replaced by each of the seeds
+    - seeds: A list of integer seeds
+
+    Returns:
+    - A list of SimulationResult instances, one per seed
+    """
+    results = []
+    for seed in seeds:
+        # Give every game its own copy of the config so the seed does not leak between games
+        seeded_config = copy.copy(config)
+        seeded_config.seed = seed
+        results.append(PyPolySimulator(seeded_config).run())
+    return results
+
+
+class BatchSummary:
+    """
+    A class that aggregates the results of many headless games into win rates per move trait and per seat.
+
+    Attributes:
+    - games_played: An integer of the number of results added
+    - games_without_winner: An integer of the number of games that hit max_turns
+    - total_turns: An integer of the sum of turn counts over every game
+    - seats_by_trait: A dictionary whose key is a move trait and whose value is the number of seats that trait has had
+    - wins_by_trait: A dictionary whose key is a move trait and whose value is the number of wins by that trait
+    - wins_by_seat: A dictionary whose key is a seat index and whose value is the number of wins from that seat
+
+    Behaviours:
+    - add_result: Adds one SimulationResult to the totals.
+    - trait_win_rates: Returns the win rate per seat of each move trait.
+    - seat_win_rates: Returns the win rate of each seat.
+    - summary_table: Returns the totals as a printable table.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method for BatchSummary class.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        self.games_played = 0
+        self.games_without_winner = 0
+        self.total_turns = 0
+        self.seats_by_trait = dict()
+        self.wins_by_trait = dict()
+        self.wins_by_seat = dict()
+
+    def add_result(self, result: SimulationResult) -> None:
+        """
+        Adds one SimulationResult to the totals.
+
+        Arguments:
+        - result: A SimulationResult instance
+
+        Returns:
+        - none
+        """
+        self.games_played += 1
+        self.total_turns += result.turn_count
+
+        # Count every seat of the roster so that traits with more seats are not favoured in the win rate
+        for seat, move_trait in enumerate(result.roster):
+            self.seats_by_trait[move_trait] = self.seats_by_trait.get(move_trait, 0) + 1
+            self.wins_by_seat.setdefault(seat, 0)
+            self.wins_by_trait.setdefault(move_trait, 0)
+
+        if result.winner_seat is None:
+            self.games_without_winner += 1
+        else:
+            self.wins_by_trait[result.winner_trait] += 1
+            self.wins_by_seat[result.winner_seat] += 1
+
+    def trait_win_rates(self) -> dict:
+        """
+        Returns the win rate of each move trait, the number of wins divided by the number of seats the trait has had.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A dictionary whose key is a move trait and whose value is a float between 0 and 1
+        """
+        return {move_trait: self.wins_by_trait[move_trait] / seats for move_trait, seats in self.seats_by_trait.items()}
+
+    def seat_win_rates(self) -> dict:
+        """
+        Returns the win rate of each seat, the number of wins from that seat divided by the number of games.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A dictionary whose key is a seat index and whose value is a float between 0 and 1
+        """
+        if self.games_played == 0:
+            return dict()
+        return {seat: wins / self.games_played for seat, wins in sorted(self.wins_by_seat.items())}
+
+    def summary_table(self) -> str:
+        """
+        Returns the totals as a printable table.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A string of the table
+        """
+        lines = ["Games played: {}".format(self.games_played)]
+        lines.append("Games without winner: {}".format(self.games_without_winner))
+        if self.games_played:
+            lines.append("Average turns: {:.1f}".format(self.total_turns / self.games_played))
+
+        lines.append("")
+        lines.append("{:<15}{:>8}{:>8}{:>10}".format("Trait", "Seats", "Wins", "Win rate"))
+        for move_trait, win_rate in self.trait_win_rates().items():
+            lines.append("{:<15}{:>8}{:>8}{:>10.3f}".format(move_trait, self.seats_by_trait[move_trait], self.wins_by_trait[move_trait], win_rate))
+
+        lines.append("")
+        lines.append("{:<15}{:>8}{:>10}".format("Seat", "Wins", "Win rate"))
+        for seat, win_rate in self.seat_win_rates().items():
+            lines.append("{:<15}{:>8}{:>10.3f}".format(seat + 1, self.wins_by_seat[seat], win_rate))
+
+        return "\n".join(lines)
+
+
+# The number of chunks every worker has in flight, one running and one waiting so the worker never idles between chunks
+WINDOW_PER_WORKER = 2
+
+
+def iter_batch(config: SimulationConfig, seeds: list, max_workers: int = None, chunk_size: int = None):
+    """
+    Fans the seeded games out across a process pool and yields every result as soon as its chunk finishes.
+    Games are sent to the workers in chunks so that the cost of starting a task is shared by several games.
+    Only WINDOW_PER_WORKER chunks per worker are in flight at a time and a new one is sent as each finishes, so however big the batch, only a bounded number of chunks and their results are held at once.
+
+    Arguments:
+    - config: A SimulationConfig instance shared by every game, only the seed changes
+    - seeds: A list or range of integer seeds, one game is played per seed
+    - max_workers: An integer of the number of worker processes, all cores when None
+    - chunk_size: An integer of the number of games per task, picked from the number of games and workers when None
+
+    Returns:
+    - A generator of SimulationResult instances, in the order they finish
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # Aim for a few chunks per worker so that a slow chunk does not leave the other cores idle at the end
+    if chunk_size is None:
+        chunk_size = max(1, len(seeds) // (max_workers * 4))
+
+    # Cut the seeds into chunks as they are needed instead of all up front
+    remaining_seeds = iter(seeds)
+    chunks = iter(lambda: list(itertools.islice(remaining_seeds, chunk_size)), [])
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Keep a bounded window of chunks in flight, enough that no worker waits for its next chunk
+        pending = {executor.submit(run_seeded_games, config, chunk) for chunk in itertools.islice(chunks, max_workers * WINDOW_PER_WORKER)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.update(executor.submit(run_seeded_games, config, chunk) for chunk in itertools.islice(chunks, 1))
+                for result in future.result():
+                    yield result
+
+
+def run_batch(config: SimulationConfig, number_of_games: int, base_seed: int = 0, max_workers: int = None) -> BatchSummary:
+    """
+    Plays number_of_games seeded games across all cores and aggregates them, game i is played with seed base_seed + i.
+
+    Arguments:
+    - config: A SimulationConfig instance shared by every game
+    - number_of_games: An integer of the number of games to play
+    - base_seed: An integer of the seed of the first game
+    - max_workers: An integer of the number of worker processes, all cores when None
+
+    Returns:
+    - A BatchSummary instance
+    """
+    summary = BatchSummary()
+    for result in iter_batch(config, range(base_seed, base_seed + number_of_games), max_workers):
+        summary.add_result(result)
+    return summary
+
+
+####################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play many seeded headless PyPoly games across all cores.")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--data", type=int, default=3, choices=(1, 2, 3), help="1 is csv_data_a, 2 is csv_data_b and 3 is both")
+    parser.add_argument("--win", type=int, default=3, help="number of properties needed to win")
+    parser.add_argument("--roster", nargs="+", default=["AI", "Perpendicular", "Diagonal", "L"], help="move trait of every seat")
+    parser.add_argument("--max-turns", type=int, default=5000, help="player turns before a game is called off")
+    parser.add_argument("--tiles", type=int, default=None, help="play on a synthetic catalog with this many tiles instead of --data, like 10000 for a 100x100 board")
+    parser.add_argument("--colours", type=int, default=4, help="number of colour groups of the synthetic catalog")
+    parser.add_argument("--cost-distribution", default="uniform", choices=CatalogGenerator.COST_DISTRIBUTIONS, help="distribution of the property costs of the synthetic catalog")
+    parser.add_argument("--chance-ratio", type=float, default=0.08, help="share of the tiles of the synthetic catalog that are chance tiles")
+    arguments = parser.parse_args()
+
+    catalog_generator = None
+    if arguments.tiles is not None:
+        catalog_generator = CatalogGenerator(arguments.tiles, arguments.colours, cost_distribution=arguments.cost_distribution, chance_ratio=arguments.chance_ratio)
+    batch_config = SimulationConfig(arguments.data, arguments.win, arguments.roster, arguments.max_turns, catalog_generator=catalog_generator)
+    print(run_batch(batch_config, arguments.games, arguments.seed, arguments.workers).summary_table())
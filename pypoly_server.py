@@ -0,0 +1,999 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import argparse
+import asyncio
+import random
+from output_sink import OutputSink
+from pypoly_simulator import PyPolySimulator, SimulationConfig
+from ai_decision_pool import AIDecisionPool
+
+
+class TableSink(OutputSink):
+    """
+    An output sink that holds back everything the players of a table say and sends it to everyone at the table as SAY lines when it is flushed, once per turn and before every question.
+
+    Attributes:
+    - table: The GameTable whose connections the messages are sent to
+    - pending: A list of the strings of the messages that have not been sent yet
+
+    Behaviours:
+    - emit: Holds on to the message.
+    - flush: Sends every message held, one SAY line per line of text.
+    """
+
+    def __init__(self, table) -> None:
+        """
+        Constructor method for TableSink class.
+
+        Arguments:
+        - table: The GameTable the messages are sent to
+
+        Returns:
+        - none
+        """
+        self.table = table
+        self.pending = []
+
+    def emit(self, kind: str, template: str, end: str = "\n", **fields) -> None:
+        """
+        Holds on to the message until the next flush, only tables with somebody to read them format their messages.
+
+        Arguments:
+        - kind: A string naming what the message is about
+        - template: A string of the message, with the fields in braces
+        - end: A string written after the message, lines are split on it anyway
+        - fields: The values of the fields of the template
+
+        Returns:
+        - none
+        """
+        if self.table.has_connections():
+            self.pending.append(OutputSink.format(template, fields))
+
+    def flush(self) -> None:
+        """
+        Sends every message held, one SAY line per line of text with the blank lines the console uses for spacing left out.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        if len(self.pending) == 0:
+            return
+        for message in self.pending:
+            for line in message.split("\n"):
+                if line.strip() != "":
+                    self.table.broadcast("SAY " + line.strip())
+        self.pending.clear()
+
+
+class ClientConnection:
+    """
+    A class that wraps the streams of one client, it remembers the table the client sits at or watches.
+
+    Attributes:
+    - reader: The asyncio.StreamReader lines are read from
+    - writer: The asyncio.StreamWriter lines are written to
+    - table: The GameTable the client has joined or watches, None before JOIN or WATCH
+    - seat: The Seat of the client at its table, None for a client that only watches
+
+    Behaviours:
+    - send: Queues one line to be written to the client.
+    - drain: Waits until the lines queued have been handed to the socket.
+    - is_closed: Returns whether the client has gone away.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Constructor method for ClientConnection class.
+
+        Arguments:
+        - reader: The asyncio.StreamReader of the client
+        - writer: The asyncio.StreamWriter of the client
+
+        Returns:
+        - none
+        """
+        self.reader = reader
+        self.writer = writer
+        self.table = None
+        self.seat = None
+
+    def send(self, line: str) -> None:
+        """
+        Queues one line to be written to the client, it does not wait so that a table never waits on a slow client.
+
+        Arguments:
+        - line: A string without its newline
+
+        Returns:
+        - none
+        """
+        if not self.writer.is_closing():
+            self.writer.write((line + "\n").encode("utf-8"))
+
+    async def drain(self) -> None:
+        """
+        Waits until the lines queued have been handed to the socket, a client that has gone away is ignored.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            pass
+
+    def is_closed(self) -> bool:
+        """
+        Returns whether the client has gone away.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A boolean that is True once the connection is closing
+        """
+        return self.writer.is_closing()
+
+
+class Seat:
+    """
+    A class that holds one seat of a table that a human has joined, the answers of the human arrive in its queue.
+    When the human quits or goes away, the seat is played by the same random bot the simulator uses for seats that are not AI players.
+
+    Attributes:
+    - name: A string of the name of the human
+    - move_trait: A string of the move trait of the human
+    - connection: The ClientConnection of the human, None once they have gone
+    - player: The player instance of the seat, set when the game starts
+    - answers: An asyncio.Queue of the answer lines of the human, None is put in it when they go
+    - waiting: A boolean of whether the table is waiting for an answer from the human
+
+    Behaviours:
+    - is_human: Returns whether a human still plays the seat.
+    """
+
+    def __init__(self, name: str, move_trait: str, connection: ClientConnection) -> None:
+        """
+        Constructor method for Seat class.
+
+        Arguments:
+        - name: A string of the name of the human
+        - move_trait: A string of the move trait of the human
+        - connection: The ClientConnection of the human
+
+        Returns:
+        - none
+        """
+        self.name = name
+        self.move_trait = move_trait
+        self.connection = connection
+        self.player = None
+        self.answers = asyncio.Queue()
+        self.waiting = False
+
+    def is_human(self) -> bool:
+        """
+        Returns whether a human still plays the seat.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A boolean that is False once the human has quit or gone away
+        """
+        return self.connection is not None
+
+
+class GameTable:
+    """
+    A class that runs one game of PyPoly as an asyncio task, the humans at the table answer its questions over their connections and every other seat is an AIPlayer.
+
+    The game itself is a PyPolySimulator, so a turn of an AIPlayer is exactly a headless turn and a turn of a human asks the same questions as PyPoly.regular_player_turn.
+    After every turn the table gives the event loop back, so that no table, however many AIPlayers it has, keeps the other tables or the connections waiting.
+
+    Attributes:
+    - WAITING, PLAYING, FINISHED: Strings of the states of a table
+    - table_id: A string that names the table
+    - win_requirement: An integer of the number of properties needed to win
+    - ai_players: An integer of the number of AIPlayer seats, which come after the human seats
+    - seed: The seed of the game, None for an unseeded game
+    - data_set: An integer that picks the data, 1 is csv_data_a, 2 is csv_data_b and 3 is both
+    - max_turns: An integer of the number of player turns after which the game is called off
+    - turn_timeout: A float of the number of seconds a human has to answer, after which a random move is made or the turn is passed
+    - ai_pool: The AIDecisionPool the moves of the AIPlayers are worked out in, None to work them out in place
+    - seats: A list of the Seat of every human, in seat order
+    - watchers: A list of the ClientConnection of every client that only watches
+    - state: A string of the state of the table
+    - sink: The TableSink the players write to
+    - simulator: The PyPolySimulator of the game, None until it starts
+    - task: The asyncio.Task playing the game, None until it starts
+    - winner: A string of the name of the winner, None if there is none yet
+
+    Behaviours:
+    - has_connections: Returns whether anybody is connected to the table.
+    - broadcast: Sends a line to everybody at the table.
+    - add_human: Gives a human a seat.
+    - add_watcher: Lets a client watch the table.
+    - start: Sets the game up and starts playing it in a task.
+    - leave: Hands the seat of a human that has quit or gone away to the bot.
+    - play: Plays the game to the end.
+    - human_turn: Plays the turn of a human.
+    - ask: Asks a human a question and waits for a valid answer.
+    - sell_choice: Asks a human which property to sell.
+    """
+
+    WAITING = "waiting"
+    PLAYING = "playing"
+    FINISHED = "finished"
+
+    def __init__(self, table_id: str, win_requirement: int = 3, ai_players: int = 1, seed: int = None, data_set: int = 3, max_turns: int = 5000, turn_timeout: float = 60.0, ai_pool: AIDecisionPool = None) -> None:
+        """
+        Constructor method for GameTable class.
+
+        Arguments:
+        - table_id: A string that names the table
+        - win_requirement: An integer of the number of properties needed to win
+        - ai_players: An integer of the number of AIPlayer seats
+        - seed: An integer seed for the game, None for an unseeded game
+        - data_set: An integer that picks the data, 1 is csv_data_a, 2 is csv_data_b and 3 is both
+        - max_turns: An integer of the number of player turns after which the game is called off
+        - turn_timeout: A float of the number of seconds a human has to answer
+        - ai_pool: An AIDecisionPool shared by the tables, None to work the moves of the AIPlayers out in place
+
+        Returns:
+        - none
+        """
+        self.table_id = table_id
+        self.win_requirement = win_requirement
+        self.ai_players = ai_players
+        self.seed = seed
+        self.data_set = data_set
+        self.max_turns = max_turns
+        self.turn_timeout = turn_timeout
+        self.ai_pool = ai_pool
+        self.seats = []
+        self.watchers = []
+        self.state = GameTable.WAITING
+        self.sink = TableSink(self)
+        self.simulator = None
+        self.task = None
+        self.winner = None
+
+    def has_connections(self) -> bool:
+        """
+        Returns whether anybody is connected to the table, a table of AIPlayers alone does not format what they say.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A boolean that is True if a human or a watcher is connected
+        """
+        return len(self.watchers) > 0 or any(seat.is_human() for seat in self.seats)
+
+    def broadcast(self, line: str) -> None:
+        """
+        Sends a line to everybody at the table.
+
+        Arguments:
+        - line: A string without its newline
+
+        Returns:
+        - none
+        """
+        for seat in self.seats:
+            if seat.is_human():
+                seat.connection.send(line)
+        for watcher in self.watchers:
+            watcher.send(line)
+
+    def add_human(self, connection: ClientConnection, name: str, move_trait: str) -> Seat:
+        """
+        Gives a human a seat at a table that has not started yet.
+
+        Arguments:
+        - connection: The ClientConnection of the human
+        - name: A string of the name of the human, it must not be taken at the table
+        - move_trait: A string of the move trait, "Perpendicular", "Diagonal" or "L"
+
+        Returns:
+        - The Seat of the human
+        """
+        if self.state != GameTable.WAITING:
+            raise ValueError("Table {} has already started.".format(self.table_id))
+        if move_trait not in PyPolySimulator.MOVE_TRAIT_CLASSES or move_trait in (SimulationConfig.AI_TRAIT, SimulationConfig.MC_TRAIT):
+            raise ValueError("{} is not a move trait.".format(move_trait))
+        if any(seat.name == name for seat in self.seats):
+            raise ValueError("The name {} is taken at table {}.".format(name, self.table_id))
+
+        seat = Seat(name, move_trait, connection)
+        self.seats.append(seat)
+        return seat
+
+    def add_watcher(self, connection: ClientConnection) -> None:
+        """
+        Lets a client watch the table, it is sent everything the players say.
+
+        Arguments:
+        - connection: The ClientConnection of the client
+
+        Returns:
+        - none
+        """
+        self.watchers.append(connection)
+
+    def start(self) -> asyncio.Task:
+        """
+        Sets the game up, with the human seats first and the AIPlayer seats after them, and starts playing it in a task.
+
+        Arguments:
+        - none
+
+        Returns:
+        - The asyncio.Task playing the game
+        """
+        if self.state != GameTable.WAITING:
+            raise ValueError("Table {} has already started.".format(self.table_id))
+        roster = [seat.move_trait for seat in self.seats] + [SimulationConfig.AI_TRAIT] * self.ai_players
+        if len(roster) < 2:
+            raise ValueError("Table {} needs at least two seats.".format(self.table_id))
+
+        config = SimulationConfig(self.data_set, self.win_requirement, roster, self.max_turns, self.seed)
+        self.simulator = PyPolySimulator(config, output=self.sink, ai_pool=self.ai_pool)
+        self.simulator.setup_game()
+
+        # The humans play under their own names
+        for seat, player in zip(self.seats, self.simulator.list_of_players):
+            seat.player = player
+            player.set_name(seat.name)
+
+        self.state = GameTable.PLAYING
+        self.broadcast("START {} {} {}".format(self.table_id, self.simulator.row_size, len(roster)))
+        self.task = asyncio.ensure_future(self.play())
+        return self.task
+
+    def leave(self, seat: Seat) -> None:
+        """
+        Hands the seat of a human that has quit or gone away to the bot, a question they were being asked is answered with None.
+
+        Arguments:
+        - seat: The Seat of the human
+
+        Returns:
+        - none
+        """
+        if seat.connection is None:
+            return
+        seat.connection = None
+        seat.answers.put_nowait(None)
+        self.broadcast("SAY {} has left the table, a bot plays their seat.".format(seat.name))
+
+    async def play(self) -> None:
+        """
+        Plays the game to the end: until somebody wins, max_turns turns have been played or every human has left.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        simulator = self.simulator
+        human_seats = {index: seat for index, seat in enumerate(self.seats)}
+        winner_seat = None
+
+        while winner_seat is None and simulator.turn_count < self.max_turns:
+
+            # A table that had humans is over once they have all left
+            if len(human_seats) > 0 and not any(seat.is_human() for seat in human_seats.values()):
+                break
+
+            seat_index = simulator.turn_count % len(simulator.list_of_players)
+            simulator.turn_count += 1
+            player = simulator.list_of_players[seat_index]
+            if self.has_connections():
+                self.broadcast("TURN {} {} {}".format(simulator.turn_count, seat_index + 1, player.get_name()))
+
+            seat = human_seats.get(seat_index)
+            if seat is not None and seat.is_human():
+                won = await self.human_turn(seat)
+            else:
+                won = await simulator.play_turn_async(player)
+            if won:
+                winner_seat = seat_index
+
+            # Send out everything said during the turn and let the other tables and the connections run
+            self.sink.flush()
+            await asyncio.sleep(0)
+
+        self.state = GameTable.FINISHED
+        if winner_seat is not None:
+            self.winner = simulator.list_of_players[winner_seat].get_name()
+        self.broadcast("END {} {} {}".format(self.table_id, simulator.turn_count, self.winner if self.winner is not None else "NONE"))
+
+    async def human_turn(self, seat: Seat) -> bool:
+        """
+        Plays the turn of a human, who picks a move and then buys, builds, sells, passes or quits until they pass, the same options as PyPoly.regular_player_turn.
+
+        Arguments:
+        - seat: The Seat of the human whose turn it is
+
+        Returns:
+        - A boolean that is True if the human has won the game with this turn
+        """
+        simulator = self.simulator
+        player = seat.player
+
+        valid_moves_list = player.determine_valid_moves(simulator.row_size)
+        if len(valid_moves_list) == 0:
+            return False
+
+        # Ask for the move, a human who does not answer in time makes a random one
+        question = "MOVE " + " ".join("{},{}".format(x, y) for x, y in valid_moves_list)
+        answer = await self.ask(seat, question, lambda words: len(words) == 2 and words[0] == "MOVE" and words[1].isdigit() and 1 <= int(words[1]) <= len(valid_moves_list))
+        if answer is None:
+            move = simulator.rng.choice(valid_moves_list)
+        else:
+            move = valid_moves_list[int(answer[1]) - 1]
+
+        player.set_position(move)
+        purchasable_or_own_property = player.determine_action(simulator.property_locations)
+        property = simulator.property_locations[move]
+
+        # Set up the options, like the options list of regular_player_turn
+        options_list = []
+        if purchasable_or_own_property:
+            if property.get_owner() == "Bank":
+                options_list.append("BUY")
+            elif property.get_hotels_built() != 2:
+                options_list.append("BUILD")
+        options_list.extend(("SELL", "PASS", "QUIT"))
+
+        while True:
+            if player.check_win(self.win_requirement):
+                return True
+
+            # Only offer to sell when there is something to sell
+            offered = [option for option in options_list if option != "SELL" or player.get_number_of_properties_owned() > 0]
+            answer = await self.ask(seat, "ACTION {} {}".format(player.get_fund(), " ".join(offered)), lambda words: len(words) == 1 and words[0] in offered)
+            choice = "PASS" if answer is None else answer[0]
+
+            if choice == "BUY":
+                player.purchase_property(property)
+                options_list.remove("BUY")
+            elif choice == "BUILD":
+                player.purchase_hotel(property)
+                options_list.remove("BUILD")
+            elif choice == "SELL":
+                property_to_sell = await self.sell_choice(seat)
+                if property_to_sell is not None:
+                    player.sell_property(property_to_sell)
+
+                    # Selling the property the player stands on takes the option of building on it away
+                    if property_to_sell is property and "BUILD" in options_list:
+                        options_list.remove("BUILD")
+            elif choice == "QUIT":
+                self.leave(seat)
+                return False
+            else:
+                return False
+
+    async def ask(self, seat: Seat, question: str, is_valid):
+        """
+        Asks a human a question with an ASK line and waits for a valid answer, an invalid answer is told off with an ERROR line and the question is asked again.
+
+        Arguments:
+        - seat: The Seat of the human
+        - question: A string of the question, without ASK
+        - is_valid: A function that takes the list of words of an answer and returns whether it is valid
+
+        Returns:
+        - A list of the words of the answer, None if the human did not answer in time or has gone
+        """
+        self.sink.flush()
+        while True:
+            if not seat.is_human():
+                return None
+
+            # Throw away anything that was answered to an earlier question
+            while not seat.answers.empty():
+                if seat.answers.get_nowait() is None:
+                    return None
+
+            seat.connection.send("ASK " + question)
+            await seat.connection.drain()
+
+            seat.waiting = True
+            try:
+                line = await asyncio.wait_for(seat.answers.get(), self.turn_timeout)
+            except asyncio.TimeoutError:
+                seat.connection.send("SAY Time is up.")
+                return None
+            finally:
+                seat.waiting = False
+
+            if line is None:
+                return None
+            words = line.split()
+            if is_valid(words):
+                return words
+            seat.connection.send("ERROR That is not one of the answers.")
+
+    async def sell_choice(self, seat: Seat):
+        """
+        Asks a human which property to sell, with the locations of their properties in the order they were acquired.
+
+        Arguments:
+        - seat: The Seat of the human
+
+        Returns:
+        - The Property to sell, None if the human changed their mind
+        """
+        owned_properties = list(seat.player.get_properties_owned())
+        question = "SELL " + " ".join("{},{}".format(*property.get_location()) for property in owned_properties)
+        answer = await self.ask(seat, question, lambda words: words == ["PASS"] or (len(words) == 2 and words[0] == "SELL" and words[1].isdigit() and 1 <= int(words[1]) <= len(owned_properties)))
+        if answer is None or answer[0] == "PASS":
+            return None
+        return owned_properties[int(answer[1]) - 1]
+
+
+class PyPolyServer:
+    """
+    A class that hosts many tables of PyPoly in one process, clients talk to it over a local TCP or Unix socket with one command per line.
+
+    Commands from a client, every reply ends with OK or ERROR:
+    - TABLES: Lists the tables, one "TABLE <id> <state> <humans> <ai players>" line each
+    - CREATE <id> [win requirement] [ai players] [seed]: Creates a table
+    - JOIN <id> <move trait> <name>: Takes a seat at a table that has not started, the name may have spaces
+    - WATCH <id>: Watches a table
+    - START <id>: Starts a table
+    - BYE: Closes the connection
+
+    Lines sent while a game is played:
+    - START <id> <row size> <seats>, TURN <turn> <seat> <name>, SAY <text>, END <id> <turns> <winner or NONE>
+    - ASK MOVE <x,y> ...: Answered with MOVE <n>, counting from 1
+    - ASK ACTION <fund> <options> ...: Answered with one of BUY, BUILD, SELL, PASS or QUIT as offered
+    - ASK SELL <x,y> ...: Answered with SELL <n>, counting from 1, or PASS
+
+    Attributes:
+    - ANSWERS: A set of the first words of the lines that answer a question
+    - turn_timeout: A float of the number of seconds a human has to answer
+    - max_turns: An integer of the number of player turns after which a game is called off
+    - data_set: An integer that picks the data of every table
+    - ai_pool: The AIDecisionPool shared by every table, None to work the moves of the AIPlayers out in place, with a pool the tables wait for their AI moves without holding up each other
+    - tables: A dictionary whose key is the id of a table and whose value is its GameTable
+    - server: The asyncio.Server listening for clients, None until start or start_unix
+
+    Behaviours:
+    - create_table: Creates a table.
+    - start: Listens on a TCP port.
+    - start_unix: Listens on a Unix socket.
+    - handle_client: Reads the commands of one client until it goes away.
+    - handle_command: Carries out one command.
+    - find_table: Returns the table with an id.
+    - close: Stops listening and stops every table.
+    """
+
+    ANSWERS = {"MOVE", "BUY", "BUILD", "SELL", "PASS", "QUIT"}
+
+    def __init__(self, turn_timeout: float = 60.0, max_turns: int = 5000, data_set: int = 3, ai_pool: AIDecisionPool = None) -> None:
+        """
+        Constructor method for PyPolyServer class.
+
+        Arguments:
+        - turn_timeout: A float of the number of seconds a human has to answer
+        - max_turns: An integer of the number of player turns after which a game is called off
+        - data_set: An integer that picks the data of every table, 1 is csv_data_a, 2 is csv_data_b and 3 is both
+        - ai_pool: An AIDecisionPool shared by every table, None to work the moves of the AIPlayers out in place
+
+        Returns:
+        - none
+        """
+        self.turn_timeout = turn_timeout
+        self.max_turns = max_turns
+        self.data_set = data_set
+        self.ai_pool = ai_pool
+        self.tables = dict()
+        self.server = None
+
+    def create_table(self, table_id: str, win_requirement: int = 3, ai_players: int = 1, seed: int = None) -> GameTable:
+        """
+        Creates a table, tables of AIPlayers alone can be created and started straight from Python to load the server.
+
+        Arguments:
+        - table_id: A string that names the table, it must not be taken
+        - win_requirement: An integer of the number of properties needed to win
+        - ai_players: An integer of the number of AIPlayer seats
+        - seed: An integer seed for the game, None for an unseeded game
+
+        Returns:
+        - The GameTable
+        """
+        if table_id in self.tables:
+            raise ValueError("Table {} already exists.".format(table_id))
+        if not 1 <= win_requirement <= 5:
+            raise ValueError("The win requirement must be between 1 and 5.")
+        if ai_players < 0:
+            raise ValueError("The number of AI players cannot be negative.")
+        table = GameTable(table_id, win_requirement, ai_players, seed, self.data_set, self.max_turns, self.turn_timeout, self.ai_pool)
+        self.tables[table_id] = table
+        return table
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """
+        Listens for clients on a TCP port.
+
+        Arguments:
+        - host: A string of the address to listen on, the local machine by default
+        - port: An integer of the port, 0 for any free port
+
+        Returns:
+        - The asyncio.Server, its sockets tell the port picked
+        """
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """
+        Listens for clients on a Unix socket.
+
+        Arguments:
+        - path: A string of the path of the socket
+
+        Returns:
+        - The asyncio.Server
+        """
+        self.server = await asyncio.start_unix_server(self.handle_client, path)
+        return self.server
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Reads the commands of one client until it says BYE or goes away, a client that goes away in the middle of a game leaves its seat to the bot.
+
+        Arguments:
+        - reader: The asyncio.StreamReader of the client
+        - writer: The asyncio.StreamWriter of the client
+
+        Returns:
+        - none
+        """
+        connection = ClientConnection(reader, writer)
+        connection.send("WELCOME PyPoly")
+        try:
+            while True:
+                line = await reader.readline()
+                if line == b"":
+                    break
+                line = line.decode("utf-8", "replace").strip()
+                if line == "":
+                    continue
+                if line.upper() == "BYE":
+                    connection.send("OK Bye.")
+                    break
+                self.handle_command(connection, line)
+                await connection.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if connection.seat is not None:
+                connection.table.leave(connection.seat)
+            elif connection.table is not None and connection in connection.table.watchers:
+                connection.table.watchers.remove(connection)
+            writer.close()
+
+    def handle_command(self, connection: ClientConnection, line: str) -> None:
+        """
+        Carries out one command, answers to questions are handed to the seat of the client.
+
+        Arguments:
+        - connection: The ClientConnection the command came from
+        - line: A string of the command
+
+        Returns:
+        - none
+        """
+        words = line.split()
+        command = words[0].upper()
+
+        # An answer goes to the table, which checks it against its question
+        if command in PyPolyServer.ANSWERS:
+            if connection.seat is None or not connection.seat.waiting:
+                connection.send("ERROR Nobody asked you anything.")
+            else:
+                connection.seat.answers.put_nowait(" ".join([command] + words[1:]))
+            return
+
+        try:
+            if command == "TABLES":
+                for table in self.tables.values():
+                    connection.send("TABLE {} {} {} {}".format(table.table_id, table.state, len(table.seats), table.ai_players))
+                connection.send("OK")
+
+            elif command == "CREATE" and 2 <= len(words) <= 5:
+                numbers = [int(word) for word in words[2:]]
+                self.create_table(words[1], *numbers)
+                connection.send("OK Table {} created.".format(words[1]))
+
+            elif command == "JOIN" and len(words) >= 4:
+                if connection.table is not None:
+                    raise ValueError("You are already at table {}.".format(connection.table.table_id))
+                table = self.find_table(words[1])
+                connection.seat = table.add_human(connection, " ".join(words[3:]), words[2])
+                connection.table = table
+                connection.send("OK Seat {} at table {}.".format(len(table.seats), table.table_id))
+
+            elif command == "WATCH" and len(words) == 2:
+                if connection.table is not None:
+                    raise ValueError("You are already at table {}.".format(connection.table.table_id))
+                table = self.find_table(words[1])
+                table.add_watcher(connection)
+                connection.table = table
+                connection.send("OK Watching table {}.".format(table.table_id))
+
+            elif command == "START" and len(words) == 2:
+                table = self.find_table(words[1])
+                table.start()
+                connection.send("OK Table {} started.".format(table.table_id))
+
+            else:
+                connection.send("ERROR Unknown command: {}".format(line))
+
+        except ValueError as error:
+            connection.send("ERROR {}".format(error))
+
+    def find_table(self, table_id: str) -> GameTable:
+        """
+        Returns the table with an id.
+
+        Arguments:
+        - table_id: A string of the id of the table
+
+        Returns:
+        - The GameTable
+        """
+        if table_id not in self.tables:
+            raise ValueError("There is no table {}.".format(table_id))
+        return self.tables[table_id]
+
+    async def close(self) -> None:
+        """
+        Stops listening and stops every table that is still playing.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for table in self.tables.values():
+            if table.task is not None and not table.task.done():
+                table.task.cancel()
+
+
+class LocalClient:
+    """
+    A client of the PyPolyServer for tests and bots, it sends commands and reads lines, and can play a seat by answering every question at random.
+
+    Attributes:
+    - reader: The asyncio.StreamReader of the connection
+    - writer: The asyncio.StreamWriter of the connection
+
+    Behaviours:
+    - connect: Connects over TCP.
+    - connect_unix: Connects over a Unix socket.
+    - send: Sends one line.
+    - receive: Reads one line.
+    - receive_until: Reads lines until one starts with a prefix.
+    - play_randomly: Answers every question at random until the game ends.
+    - close: Closes the connection.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Constructor method for LocalClient class, use connect or connect_unix.
+
+        Arguments:
+        - reader: The asyncio.StreamReader of the connection
+        - writer: The asyncio.StreamWriter of the connection
+
+        Returns:
+        - none
+        """
+        self.reader = reader
+        self.writer = writer
+
+    @staticmethod
+    async def connect(host: str, port: int):
+        """
+        Connects to a server over TCP and reads its WELCOME line.
+
+        Arguments:
+        - host: A string of the address of the server
+        - port: An integer of the port of the server
+
+        Returns:
+        - A LocalClient
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        client = LocalClient(reader, writer)
+        await client.receive()
+        return client
+
+    @staticmethod
+    async def connect_unix(path: str):
+        """
+        Connects to a server over a Unix socket and reads its WELCOME line.
+
+        Arguments:
+        - path: A string of the path of the socket
+
+        Returns:
+        - A LocalClient
+        """
+        reader, writer = await asyncio.open_unix_connection(path)
+        client = LocalClient(reader, writer)
+        await client.receive()
+        return client
+
+    async def send(self, line: str) -> None:
+        """
+        Sends one line.
+
+        Arguments:
+        - line: A string without its newline
+
+        Returns:
+        - none
+        """
+        self.writer.write((line + "\n").encode("utf-8"))
+        await self.writer.drain()
+
+    async def receive(self) -> str:
+        """
+        Reads one line.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A string of the line without its newline, None once the server has closed the connection
+        """
+        line = await self.reader.readline()
+        if line == b"":
+            return None
+        return line.decode("utf-8").rstrip("\n")
+
+    async def receive_until(self, prefix: str) -> list[str]:
+        """
+        Reads lines until one starts with a prefix.
+
+        Arguments:
+        - prefix: A string like "OK" or "END"
+
+        Returns:
+        - A list of every line read, the last one starts with the prefix unless the connection was closed first
+        """
+        lines = []
+        while True:
+            line = await self.receive()
+            if line is None:
+                return lines
+            lines.append(line)
+            if line.startswith(prefix):
+                return lines
+
+    async def play_randomly(self, rng: random.Random = None) -> list[str]:
+        """
+        Answers every question at random until the game ends, buying whenever it is offered and otherwise mostly passing.
+
+        Arguments:
+        - rng: The random.Random to pick with, None for a new unseeded one
+
+        Returns:
+        - A list of every line read, the last one is the END line unless the connection was closed first
+        """
+        if rng is None:
+            rng = random.Random()
+        lines = []
+        while True:
+            line = await self.receive()
+            if line is None:
+                return lines
+            lines.append(line)
+            words = line.split()
+            if words[0] == "END":
+                return lines
+            if words[0] != "ASK":
+                continue
+
+            if words[1] == "MOVE":
+                await self.send("MOVE {}".format(rng.randint(1, len(words) - 2)))
+            elif words[1] == "ACTION":
+                options = words[3:]
+                for option in ("BUY", "BUILD"):
+                    if option in options:
+                        await self.send(option)
+                        break
+                else:
+                    await self.send("PASS")
+            elif words[1] == "SELL":
+                await self.send("PASS")
+
+    async def close(self) -> None:
+        """
+        Says BYE and closes the connection.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        try:
+            await self.send("BYE")
+        except ConnectionError:
+            pass
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def serve(host: str, port: int, unix_path: str, turn_timeout: float, max_turns: int, ai_deadline: float = None) -> None:
+    """
+    Runs a PyPolyServer until it is interrupted.
+
+    Arguments:
+    - host: A string of the address to listen on
+    - port: An integer of the TCP port to listen on
+    - unix_path: A string of the path of a Unix socket to listen on instead of TCP, None to use TCP
+    - turn_timeout: A float of the number of seconds a human has to answer
+    - max_turns: An integer of the number of player turns after which a game is called off
+    - ai_deadline: A float of the number of seconds a move of an AIPlayer may take, None to work the moves out in place
+
+    Returns:
+    - none
+    """
+    ai_pool = AIDecisionPool(ai_deadline) if ai_deadline is not None else None
+    game_server = PyPolyServer(turn_timeout, max_turns, ai_pool=ai_pool)
+    if unix_path is not None:
+        server = await game_server.start_unix(unix_path)
+    else:
+        server = await game_server.start(host, port)
+    print("PyPoly server listening on {}".format(", ".join(str(sock.getsockname()) for sock in server.sockets)))
+    try:
+        await server.serve_forever()
+    finally:
+        await game_server.close()
+        if ai_pool is not None:
+            ai_pool.close()
+
+
+####################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Host many PyPoly tables for humans and bots over a local socket.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=7070, help="TCP port to listen on")
+    parser.add_argument("--unix", default=None, help="path of a Unix socket to listen on instead of TCP")
+    parser.add_argument("--turn-timeout", type=float, default=60.0, help="seconds a human has to answer before a random move is made or the turn is passed")
+    parser.add_argument("--max-turns", type=int, default=5000, help="player turns before a game is called off")
+    parser.add_argument("--ai-deadline", type=float, default=None, help="seconds an AI move may take before a quick move is made instead")
+    arguments = parser.parse_args()
+
+    try:
+        asyncio.run(serve(arguments.host, arguments.port, arguments.unix, arguments.turn_timeout, arguments.max_turns, arguments.ai_deadline))
+    except KeyboardInterrupt:
+        pass
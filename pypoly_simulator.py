@@ -0,0 +1,442 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import math
+import random
+from property_generator import PropertyGenerator
+from player_move import PerpendicularPlayer, DiagonalPlayer, LPlayer
+from ai_player import AIPlayer
+from market_index import MarketIndex
+from board_version import BoardVersion
+from turn_profiler import TurnProfiler
+from game_snapshot import GameSnapshot
+from event_log import EventLog, MoveEvent, WinEvent
+from output_sink import OutputSink, NullSink
+from ai_decision_pool import AIDecisionPool
+from monte_carlo_player import MonteCarloAIPlayer
+from catalog_generator import CatalogGenerator
+
+import property_csv_data_a
+import property_csv_data_b
+
+
+class SimulationConfig:
+    """
+    A class that holds everything a headless game needs to know before it starts, replacing the questions asked in PyPoly.pre_start_game.
+
+    Attributes:
+    - AI_TRAIT: A string used in the roster for a seat that is played by an AIPlayer
+    - MC_TRAIT: A string used in the roster for a seat that is played by a MonteCarloAIPlayer
+    - data_set: An integer that picks the data like the menu in pre_start_game, 1 is csv_data_a, 2 is csv_data_b and 3 is both
+    - win_requirement: An integer of the number of properties needed to win
+    - roster: A list of move traits, one per seat, which can be "Perpendicular", "Diagonal", "L", AI_TRAIT or MC_TRAIT
+    - max_turns: An integer of the number of player turns after which the game is called off without a winner
+    - seed: The seed of the game's random.Random, None for an unseeded game, the same seed always replays the same game
+    - catalog_path: A string of the path to a CSV file of properties to use instead of data_set, None to use data_set
+    - catalog_delimiter: A string of the delimiter used in the file at catalog_path
+    - catalog_generator: A CatalogGenerator whose synthetic catalog is used instead of data_set, None to use data_set or catalog_path
+    """
+
+    # The roster entry that gives a seat to an AIPlayer
+    AI_TRAIT = "AI"
+
+    # The roster entry that gives a seat to a MonteCarloAIPlayer
+    MC_TRAIT = "MC"
+
+    def __init__(self, data_set: int = 1, win_requirement: int = 3, roster: list = None, max_turns: int = 5000, seed: int = None, catalog_path: str = None, catalog_delimiter: str = ",", catalog_generator: CatalogGenerator = None) -> None:
+        """
+        Constructor method for SimulationConfig class.
+
+        Arguments:
+        - data_set: An integer that picks the data, 1 is csv_data_a, 2 is csv_data_b and 3 is both
+        - win_requirement: An integer of the number of properties needed to win
+        - roster: A list of move traits, one per seat, by default two AI players
+        - max_turns: An integer of the number of player turns after which the game is called off
+        - seed: An integer seed for the game, None for an unseeded game
+        - catalog_path: A string of the path to a CSV file of properties to use instead of data_set
+        - catalog_delimiter: A string of the delimiter used in the file at catalog_path
+        - catalog_generator: A CatalogGenerator to make up the properties with instead of data_set, it has a seed of its own so every game gets the same catalog
+
+        Returns:
+        - none
+        """
+        self.data_set = data_set
+        self.win_requirement = win_requirement
+
+        # Default to a two seat AI game when no roster is given
+        if roster is None:
+            roster = [SimulationConfig.AI_TRAIT, SimulationConfig.AI_TRAIT]
+        self.roster = list(roster)
+
+        self.max_turns = max_turns
+        self.seed = seed
+        self.catalog_path = catalog_path
+        self.catalog_delimiter = catalog_delimiter
+        self.catalog_generator = catalog_generator
+
+
+class SimulationResult:
+    """
+    A class that holds the outcome of a headless game.
+
+    Attributes:
+    - winner: A string of the name of the winner, None if the game hit max_turns
+    - winner_seat: An integer of the index of the winner in the roster, None if there is no winner
+    - winner_trait: A string of the roster entry of the winner, None if there is no winner
+    - turn_count: An integer of the number of player turns that were played
+    - final_funds: A dictionary whose key is the player's name and whose value is the fund they finished with
+    - roster: A list of the roster entries the game was played with
+    - seed: The seed the game was played with
+    """
+
+    def __init__(self, winner: str, winner_seat: int, winner_trait: str, turn_count: int, final_funds: dict, roster: list, seed: int = None) -> None:
+        """
+        Constructor method for SimulationResult class.
+
+        Arguments:
+        - winner: A string of the name of the winner or None
+        - winner_seat: An integer of the index of the winner in the roster or None
+        - winner_trait: A string of the roster entry of the winner or None
+        - turn_count: An integer of the number of player turns that were played
+        - final_funds: A dictionary of player name to final fund
+        - roster: A list of the roster entries the game was played with
+        - seed: The seed the game was played with
+
+        Returns:
+        - none
+        """
+        self.winner = winner
+        self.winner_seat = winner_seat
+        self.winner_trait = winner_trait
+        self.turn_count = turn_count
+        self.final_funds = final_funds
+        self.roster = roster
+        self.seed = seed
+
+    def __repr__(self) -> str:
+        """
+        A special method used to represent the result as a string.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A string summarising the result
+        """
+        return "SimulationResult(winner={}, turns={}, funds={})".format(self.winner, self.turn_count, self.final_funds)
+
+
+class PyPolySimulator:
+    """
+    A class that plays a full game of PyPoly with no prompts, no delays and no printing, using the same PropertyGenerator, AIPlayer and Player.determine_action logic as PyPoly.
+
+    Seats that are not AI players are played by a simple bot that moves randomly, buys what it lands on and builds a hotel when it lands on its own property, as long as it can afford it.
+
+    Attributes:
+    - MOVE_TRAIT_CLASSES: A dictionary whose key is a move trait and whose value is the class of player for that trait
+    - config: A SimulationConfig instance
+    - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+    - list_of_players: A list that contains our player instances, in roster order
+    - row_size: An integer of the number of horizontal and vertical grids
+    - market_index: The MarketIndex of the properties the bank still owns, shared by every AIPlayer
+    - board_version: The BoardVersion that counts the changes to the board, shared by every AIPlayer
+    - turn_count: An integer of the number of player turns played so far
+    - rng: The game's own random.Random, every random choice of the game goes through it so that a seed replays the game exactly
+    - profiler: A TurnProfiler that times the phases of every turn, it records nothing unless it has been enabled
+    - event_log: The EventLog every turn, move and transaction of the game is recorded in, None to record nothing
+    - output: The OutputSink every player writes to, a NullSink unless the simulator was handed another
+    - ai_pool: The AIDecisionPool the moves of the AIPlayers are worked out in, None to work them out in place
+
+    Behaviours:
+    - setup_game: Generates the board and the players.
+    - play_turn: Plays one turn for a player and returns whether they won.
+    - play_turn_async: Plays one turn like play_turn, giving the event loop back while the AI pool works out the move.
+    - uses_ai_pool: Returns whether the move of a player is worked out in the AI pool.
+    - play_move: Moves a player and resolves the tile they landed on.
+    - run: Plays the game to the end and returns a SimulationResult.
+    - play_to_end: Plays a game that has been set up or restored from the seat whose turn it is to the end.
+    - snapshot: Saves the state of the game into bytes.
+    - restore: Restores the state of the game from bytes.
+    """
+
+    # Map each move trait to the class that implements it
+    MOVE_TRAIT_CLASSES = {
+        PerpendicularPlayer.BASE_MOVE_TRAIT: PerpendicularPlayer,
+        DiagonalPlayer.BASE_MOVE_TRAIT: DiagonalPlayer,
+        LPlayer.BASE_MOVE_TRAIT: LPlayer,
+        SimulationConfig.AI_TRAIT: AIPlayer,
+        SimulationConfig.MC_TRAIT: MonteCarloAIPlayer,
+    }
+
+    def __init__(self, config: SimulationConfig, profiler: TurnProfiler = None, event_log: EventLog = None, output: OutputSink = None, ai_pool: AIDecisionPool = None) -> None:
+        """
+        Constructor method for PyPolySimulator class.
+
+        Arguments:
+        - config: A SimulationConfig instance
+        - profiler: A TurnProfiler to time the phases of every turn with, None for a disabled one
+        - event_log: An EventLog to record the game in, None to record nothing
+        - output: An OutputSink for the players to write to, None to throw everything away without formatting it
+        - ai_pool: An AIDecisionPool to work out the moves of the AIPlayers in with a time budget, None to work them out in place
+
+        Returns:
+        - none
+        """
+        self.config = config
+        self.property_locations = dict()
+        self.list_of_players = []
+        self.row_size = 0
+        self.market_index = None
+        self.board_version = None
+        self.turn_count = 0
+        self.rng = random.Random(config.seed)
+
+        # Use a disabled profiler unless we were handed one, the caller reads the totals off it after run
+        if profiler is None:
+            profiler = TurnProfiler()
+        self.profiler = profiler
+        self.event_log = event_log
+
+        # Say nothing unless we were handed a sink, a NullSink does not even format the messages
+        if output is None:
+            output = NullSink()
+        self.output = output
+        self.ai_pool = ai_pool
+
+    def setup_game(self) -> None:
+        """
+        Generates the board and the players, the headless version of PyPoly.pre_start_game.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        # Load the data from the synthetic catalog or the catalog file if there is one, else the same way the menu in pre_start_game does
+        property_gen = PropertyGenerator()
+        property_gen.set_rng(self.rng)
+        if self.config.catalog_generator is not None:
+            property_gen.catalog_to_properties(self.config.catalog_generator.catalog())
+        elif self.config.catalog_path is not None:
+            property_gen.csv_file_to_properties(self.config.catalog_path, self.config.catalog_delimiter)
+        else:
+            if self.config.data_set in (1, 3):
+                property_gen.csv_to_properties(property_csv_data_a.csv_data, property_csv_data_a.delimiter)
+            if self.config.data_set in (2, 3):
+                property_gen.csv_to_properties(property_csv_data_b.csv_data, property_csv_data_b.delimiter)
+
+        # Generate and save the property locations, a synthetic catalog says how many of its tiles are chance tiles
+        chance_tiles = 4 if self.config.catalog_generator is None else self.config.catalog_generator.number_of_chance_tiles()
+        property_gen.property_location_generator(shuffle_layout=True, chance_tiles=chance_tiles)
+        self.property_locations = property_gen.property_locations
+        self.row_size = int(math.sqrt(len(self.property_locations)))
+        self.market_index = MarketIndex(self.property_locations, property_gen.get_colours())
+        self.board_version = BoardVersion(self.property_locations)
+
+        # Pick a distinct starting location for every seat
+        starting_locations = self.rng.sample(list(self.property_locations.keys()), len(self.config.roster))
+
+        # Create a player for every seat in the roster
+        for seat, move_trait in enumerate(self.config.roster):
+            player_instance = PyPolySimulator.MOVE_TRAIT_CLASSES[move_trait]()
+            player_instance.set_name("Seat {} ({})".format(seat + 1, move_trait))
+            player_instance.set_symbol(str(seat + 1))
+            player_instance.set_position(starting_locations[seat])
+            player_instance.set_rng(self.rng)
+            player_instance.set_output(self.output)
+            if isinstance(player_instance, AIPlayer):
+                player_instance.set_market_index(self.market_index)
+                player_instance.set_board_version(self.board_version)
+
+                # Every AIPlayer is handed the winning condition of its own game, many games can run side by side in one process
+                player_instance.set_winning_condition(self.config.win_requirement)
+            self.list_of_players.append(player_instance)
+
+        # A MonteCarloAIPlayer plays the whole table out, so it needs every player
+        for player_instance in self.list_of_players:
+            if isinstance(player_instance, MonteCarloAIPlayer):
+                player_instance.set_players(self.list_of_players)
+
+        # Record the board and the players as the game starts
+        if self.event_log is not None:
+            self.event_log.start_game(self.property_locations, self.list_of_players)
+
+    def play_turn(self, player_obj) -> bool:
+        """
+        Plays one turn for a player, the headless version of PyPoly.ai_player_turn and PyPoly.regular_player_turn.
+
+        Arguments:
+        - player_obj: An instance of PerpendicularPlayer, DiagonalPlayer, LPlayer or AIPlayer
+
+        Returns:
+        - A boolean that is True if the player has won the game with this turn
+        """
+        # Fetch the valid moves, a player that cannot move simply passes
+        with self.profiler.phase("move_generation"):
+            valid_moves_list = player_obj.determine_valid_moves(self.row_size)
+        if len(valid_moves_list) == 0:
+            return False
+
+        # The AIPlayer decides on its own, the other seats pick a random move
+        if isinstance(player_obj, AIPlayer):
+            with self.profiler.phase("ai_move"):
+                if self.uses_ai_pool(player_obj):
+                    move = self.ai_pool.decide(player_obj, valid_moves_list, self.property_locations, self.list_of_players)
+                else:
+                    move = player_obj.ai_move(valid_moves_list, self.property_locations)
+        else:
+            move = self.rng.choice(valid_moves_list)
+
+        return self.play_move(player_obj, move)
+
+    async def play_turn_async(self, player_obj) -> bool:
+        """
+        Plays one turn for a player like play_turn, but gives the event loop back while the AI pool works out the move of an AIPlayer, so a server keeps serving its other tables.
+        Turns that do not go through the AI pool are played straight away by play_turn.
+
+        Arguments:
+        - player_obj: An instance of PerpendicularPlayer, DiagonalPlayer, LPlayer or AIPlayer
+
+        Returns:
+        - A boolean that is True if the player has won the game with this turn
+        """
+        if not self.uses_ai_pool(player_obj):
+            return self.play_turn(player_obj)
+
+        with self.profiler.phase("move_generation"):
+            valid_moves_list = player_obj.determine_valid_moves(self.row_size)
+        if len(valid_moves_list) == 0:
+            return False
+
+        # The phase also counts the time other tasks of the loop ran while the move was worked out
+        with self.profiler.phase("ai_move"):
+            move = await self.ai_pool.decide_async(player_obj, valid_moves_list, self.property_locations, self.list_of_players)
+
+        return self.play_move(player_obj, move)
+
+    def uses_ai_pool(self, player_obj) -> bool:
+        """
+        Returns whether the move of a player is worked out in the AI pool.
+
+        Arguments:
+        - player_obj: An instance of PerpendicularPlayer, DiagonalPlayer, LPlayer or AIPlayer
+
+        Returns:
+        - A boolean that is True for an AIPlayer when there is an AI pool
+        """
+        # A MonteCarloAIPlayer plays its rollouts out itself, the workers of the pool only know the rules of AIPlayer
+        return self.ai_pool is not None and isinstance(player_obj, AIPlayer) and not isinstance(player_obj, MonteCarloAIPlayer)
+
+    def play_move(self, player_obj, move: tuple) -> bool:
+        """
+        Moves a player and resolves the tile they landed on, the second half of a turn once the move is known.
+
+        Arguments:
+        - player_obj: An instance of PerpendicularPlayer, DiagonalPlayer, LPlayer or AIPlayer
+        - move: A tuple of the location the player moves to
+
+        Returns:
+        - A boolean that is True if the player has won the game with this turn
+        """
+        # Move the player and resolve the tile they landed on
+        player_obj.set_position(move)
+        if self.event_log is not None:
+            self.event_log.record(MoveEvent(self.event_log.seat_of(player_obj), move))
+        owner = self.property_locations[move].get_owner()
+        with self.profiler.phase("rent_payment" if owner != "Bank" and owner != player_obj and owner is not None else "determine_action"):
+            purchasable_or_own_property = player_obj.determine_action(self.property_locations)
+
+        # The AIPlayer only acts when it has reached its target, as in ai_player_turn
+        if isinstance(player_obj, AIPlayer):
+            if player_obj.target[1] == move:
+                with self.profiler.phase("buy_build_sell"):
+                    player_obj.buy_or_build(move, self.property_locations)
+
+        # The other seats buy or build whenever they can afford it
+        elif purchasable_or_own_property:
+            property = self.property_locations[move]
+            with self.profiler.phase("buy_build_sell"):
+                if property.get_owner() == "Bank":
+                    if player_obj.get_fund() >= property.get_property_cost():
+                        player_obj.purchase_property(property)
+                elif property.get_hotels_built() != 2 and player_obj.get_fund() >= property.get_hotel_cost():
+                    player_obj.purchase_hotel(property)
+
+        return player_obj.check_win(self.config.win_requirement)
+
+    def run(self) -> SimulationResult:
+        """
+        Plays the game to the end and returns the outcome.
+        The game ends when a player wins or when config.max_turns player turns have been played.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A SimulationResult instance
+        """
+        self.setup_game()
+
+        return self.play_to_end()
+
+    def play_to_end(self) -> SimulationResult:
+        """
+        Plays a game that has been set up, or restored from a snapshot, from the seat whose turn it is to the end and returns the outcome.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A SimulationResult instance
+        """
+        winner_seat = None
+
+        # Keep going round the table until somebody wins or we run out of turns, the turn count tells whose turn it is
+        while winner_seat is None and self.turn_count < self.config.max_turns:
+            seat = self.turn_count % len(self.list_of_players)
+            self.turn_count += 1
+            if self.event_log is not None:
+                self.event_log.start_turn(self.turn_count, self.list_of_players[seat])
+            if self.play_turn(self.list_of_players[seat]):
+                winner_seat = seat
+
+        # Write out whatever the sink held back
+        self.output.flush()
+
+        # Record the winner and write out what is left of the log
+        if self.event_log is not None:
+            if winner_seat is not None:
+                self.event_log.record(WinEvent(winner_seat))
+            self.event_log.flush()
+
+        # Pack up the outcome
+        final_funds = {player.get_name(): player.get_fund() for player in self.list_of_players}
+        if winner_seat is None:
+            return SimulationResult(None, None, None, self.turn_count, final_funds, self.config.roster, self.config.seed)
+        return SimulationResult(self.list_of_players[winner_seat].get_name(), winner_seat, self.config.roster[winner_seat], self.turn_count, final_funds, self.config.roster, self.config.seed)
+
+    def snapshot(self) -> bytes:
+        """
+        Saves the state of the game, including the turn count and the state of its random number generator, into a GameSnapshot.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A bytes object of the snapshot
+        """
+        return GameSnapshot.save(self.property_locations, self.list_of_players, self.turn_count, self.rng)
+
+    def restore(self, data: bytes) -> None:
+        """
+        Restores the state of the game from a GameSnapshot, the game must have been set up with the same config, so a game can be forked by setting up a new simulator with the same seed and restoring the snapshot into it.
+
+        Arguments:
+        - data: A bytes object made by snapshot
+
+        Returns:
+        - none
+        """
+        self.turn_count = GameSnapshot.restore(data, self.property_locations, self.list_of_players, self.rng)
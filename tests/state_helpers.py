@@ -0,0 +1,71 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import os
+import sys
+
+# The game modules live in the folder above this one
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_player import AIPlayer
+from property import Property
+
+
+def counted(counts: dict) -> dict:
+    """
+    Returns the counts of a player that are not zero, a colour group the player no longer owns may be left at zero or taken out.
+
+    Arguments:
+    - counts: A dictionary whose key is a colour group and whose value is a count
+
+    Returns:
+    - A dictionary of the counts that are not zero
+    """
+    return {colour: count for colour, count in counts.items() if count != 0}
+
+
+def grouped(player) -> dict:
+    """
+    Returns the locations of the properties a player owns per colour group, leaving out colour groups the player no longer owns.
+
+    Arguments:
+    - player: The player
+
+    Returns:
+    - A dictionary whose key is a colour group and whose value is a list of locations in the order they were acquired
+    """
+    return {colour: [property.get_location() for property in properties] for colour, properties in player.colour_properties.items() if len(properties) != 0}
+
+
+def board_state(property_locations: dict, players: list) -> tuple:
+    """
+    Returns the state of a game as plain values that can be compared between two boards, with owners named by their seat.
+
+    Arguments:
+    - property_locations: A dictionary whose key is a tuple that contains the location of our Property which is our value
+    - players: A list of the players in seat order
+
+    Returns:
+    - A tuple of (tiles, players), tiles is a list of (location, owner seat, hotels, rent) and players a list of (fund, position, owned locations, colour counts, colour hotel counts, owned locations per colour)
+    """
+    seats = {player: seat for seat, player in enumerate(players)}
+    tiles = []
+    for location, property in sorted(property_locations.items()):
+        owner = property.get_owner()
+        tiles.append((location, None if owner == Property.ORIGINAL_OWNER or owner is None else seats[owner], property.get_hotels_built(), property.get_rent_price()))
+    player_rows = [(player.get_fund(), player.get_position(), [property.get_location() for property in player.get_properties_owned()], counted(player.colour_counts), counted(player.colour_hotel_counts), grouped(player)) for player in players]
+    return (tiles, player_rows)
+
+
+def ai_plans(players: list) -> list:
+    """
+    Returns the plan of every AIPlayer of a game, None for the other seats.
+
+    Arguments:
+    - players: A list of the players in seat order
+
+    Returns:
+    - A list of (first_run, target, previous_moves) or None per seat
+    """
+    return [(player.first_run, player.target, list(player.previous_moves)) if isinstance(player, AIPlayer) else None for player in players]
@@ -0,0 +1,85 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import io
+import os
+import sys
+import unittest
+
+# The game modules live in the folder above this one
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_log import EventLog, EventReplayer, read_events
+from pypoly_simulator import PyPolySimulator, SimulationConfig
+from state_helpers import board_state
+
+
+class EventReplayTest(unittest.TestCase):
+    """
+    Records headless games in an event log, writes it out as JSON, replays it and checks the replayed state is the state the live game ended in.
+    """
+
+    def play_recorded(self, seed: int, roster: list, same_names: bool = False) -> tuple:
+        """
+        Plays a seeded headless game into an event log written to a string.
+
+        Arguments:
+        - seed: An integer seed of the game
+        - roster: A list of the move trait of every seat
+        - same_names: A boolean, if true every player is given the same name before the game starts
+
+        Returns:
+        - A tuple of (simulator, result, log text)
+        """
+        simulator = PyPolySimulator(SimulationConfig(data_set=3, win_requirement=3, roster=roster, max_turns=300, seed=seed))
+        simulator.setup_game()
+        if same_names:
+            for player in simulator.list_of_players:
+                player.set_name("Twin")
+
+        stream = io.StringIO()
+        simulator.event_log = EventLog(stream, buffer_size=16)
+        simulator.event_log.start_game(simulator.property_locations, simulator.list_of_players)
+        result = simulator.play_to_end()
+        return (simulator, result, stream.getvalue())
+
+    def assert_replay_matches(self, simulator: PyPolySimulator, result, log_text: str) -> None:
+        """
+        Replays a log and checks the replayed state against the live game.
+
+        Arguments:
+        - simulator: The PyPolySimulator the log was recorded from
+        - result: The SimulationResult of the game
+        - log_text: A string of the log
+
+        Returns:
+        - None
+        """
+        replayer = EventReplayer().replay(read_events(io.StringIO(log_text)))
+
+        self.assertEqual(board_state(replayer.property_locations, replayer.players), board_state(simulator.property_locations, simulator.list_of_players))
+        self.assertEqual(replayer.winner, result.winner_seat)
+        self.assertEqual(replayer.turn, simulator.turn_count)
+
+    def test_replay_matches_live_game(self):
+        for seed in range(6):
+            with self.subTest(seed=seed):
+                simulator, result, log_text = self.play_recorded(seed, ["AI", "Perpendicular", "Diagonal", "L"])
+                self.assert_replay_matches(simulator, result, log_text)
+
+    def test_players_with_the_same_name_are_kept_apart(self):
+        for seed in range(6):
+            with self.subTest(seed=seed):
+                simulator, result, log_text = self.play_recorded(seed, ["AI", "L", "AI"], same_names=True)
+                self.assert_replay_matches(simulator, result, log_text)
+
+    def test_replay_stops_at_a_turn(self):
+        simulator, result, log_text = self.play_recorded(1, ["AI", "Perpendicular"])
+        replayer = EventReplayer().replay(read_events(io.StringIO(log_text)), until_turn=5)
+        self.assertEqual(replayer.turn, 5)
+        self.assertIsNone(replayer.winner)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import os
+import sys
+import unittest
+
+# The game modules live in the folder above this one
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_snapshot import GameSnapshot
+from market_index import MarketIndex
+from pypoly_simulator import PyPolySimulator, SimulationConfig
+from state_helpers import ai_plans, board_state, grouped
+
+
+def played_game(seed: int, turns: int) -> PyPolySimulator:
+    """
+    Returns a seeded headless game stopped after a number of turns.
+
+    Arguments:
+    - seed: An integer seed of the game
+    - turns: An integer of the number of player turns to play
+
+    Returns:
+    - A PyPolySimulator of the game
+    """
+    simulator = PyPolySimulator(SimulationConfig(data_set=3, win_requirement=5, roster=["AI", "AI", "Perpendicular", "L"], max_turns=turns, seed=seed))
+    simulator.run()
+    return simulator
+
+
+def fresh_game(seed: int) -> PyPolySimulator:
+    """
+    Returns a seeded headless game that has been set up but not played, the same board and roster as played_game.
+
+    Arguments:
+    - seed: An integer seed of the game
+
+    Returns:
+    - A PyPolySimulator of the game
+    """
+    simulator = PyPolySimulator(SimulationConfig(data_set=3, win_requirement=5, roster=["AI", "AI", "Perpendicular", "L"], max_turns=0, seed=seed))
+    simulator.setup_game()
+    return simulator
+
+
+class GameSnapshotTest(unittest.TestCase):
+    """
+    Saves games in the middle of play and restores them into freshly set up games with the same board and roster.
+    """
+
+    def setUp(self):
+        # Play far enough for properties to change hands, hotels to be built and the AIPlayers to be on their way to a target
+        self.seed = 4
+        self.game = played_game(self.seed, 60)
+
+        # Rents never change during a game, so change one to check it is saved too
+        owned = [property for property in GameSnapshot.board_properties(self.game.property_locations) if property.get_owner() != "Bank"]
+        owned[0].set_rent_price(owned[0].get_rent_price() + 7)
+
+    def test_game_is_mid_play(self):
+        tiles, players = board_state(self.game.property_locations, self.game.list_of_players)
+        self.assertTrue(any(owner is not None for _, owner, _, _ in tiles))
+        self.assertTrue(any(hotels > 0 for _, _, hotels, _ in tiles))
+        self.assertTrue(any(plan is not None and plan[1] != (-1, -1) and not plan[0] for plan in ai_plans(self.game.list_of_players)))
+        self.assertEqual(self.game.turn_count, 60)
+
+    def test_colour_groups_follow_the_properties_owned(self):
+        for player in self.game.list_of_players:
+            expected = dict()
+            for property in player.get_properties_owned():
+                expected.setdefault(property.get_colour_group(), []).append(property.get_location())
+            self.assertEqual(grouped(player), expected)
+
+    def test_round_trip(self):
+        data = GameSnapshot.save(self.game.property_locations, self.game.list_of_players, self.game.turn_count, self.game.rng)
+
+        copy = fresh_game(self.seed)
+        turn_count = GameSnapshot.restore(data, copy.property_locations, copy.list_of_players, copy.rng)
+
+        self.assertEqual(turn_count, self.game.turn_count)
+        self.assertEqual(board_state(copy.property_locations, copy.list_of_players), board_state(self.game.property_locations, self.game.list_of_players))
+        self.assertEqual(ai_plans(copy.list_of_players), ai_plans(self.game.list_of_players))
+        self.assertEqual(copy.rng.getstate(), self.game.rng.getstate())
+
+        # Saving the restored game gives the very same bytes
+        self.assertEqual(GameSnapshot.save(copy.property_locations, copy.list_of_players, turn_count, copy.rng), data)
+
+    def test_restore_keeps_the_market_index_in_sync(self):
+        copy = fresh_game(self.seed)
+        copy.restore(self.game.snapshot())
+
+        rebuilt = MarketIndex(copy.property_locations, copy.market_index.get_colours())
+        for colour in copy.market_index.get_colours():
+            self.assertIs(copy.market_index.cheapest_buyable(colour), rebuilt.cheapest_buyable(colour))
+            for owned_count in range(3):
+                self.assertEqual(copy.market_index.cost_to_complete(colour, owned_count, 5), rebuilt.cost_to_complete(colour, owned_count, 5))
+
+    def test_restored_game_plays_on_the_same(self):
+        copy = fresh_game(self.seed)
+        copy.restore(self.game.snapshot())
+
+        for simulator in (self.game, copy):
+            simulator.config.max_turns = 400
+        original_result = self.game.play_to_end()
+        copy_result = copy.play_to_end()
+
+        self.assertEqual((copy_result.winner_seat, copy_result.turn_count, copy_result.final_funds), (original_result.winner_seat, original_result.turn_count, original_result.final_funds))
+        self.assertEqual(board_state(copy.property_locations, copy.list_of_players), board_state(self.game.property_locations, self.game.list_of_players))
+
+    def test_restore_into_a_different_game_is_refused(self):
+        data = self.game.snapshot()
+        other = PyPolySimulator(SimulationConfig(data_set=1, win_requirement=5, roster=["AI", "L"], max_turns=0, seed=self.seed))
+        other.setup_game()
+        with self.assertRaises(ValueError):
+            other.restore(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
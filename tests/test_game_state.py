@@ -0,0 +1,127 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import os
+import sys
+import unittest
+
+# The game modules live in the folder above this one
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_state import BoardTracker, GameState
+from game_snapshot import GameSnapshot
+from market_index import MarketIndex
+from pypoly_simulator import PyPolySimulator, SimulationConfig
+from state_helpers import ai_plans, board_state
+
+
+def state_values(state: GameState) -> tuple:
+    """
+    Returns the tiles and players of a GameState as plain values, whichever tiles are kept in its base or its own copy.
+
+    Arguments:
+    - state: A GameState
+
+    Returns:
+    - A tuple of (tiles, players), tiles is a list of (owner, hotels, rent) per property id
+    """
+    return ([state.get_tile(property_id) for property_id in range(len(state.base[0]))], state.players)
+
+
+class GameStateTest(unittest.TestCase):
+    """
+    Checks that GameStates are copy-on-write and that applying one brings a board, its players and its observers back to it.
+    """
+
+    def setUp(self):
+        self.simulator = PyPolySimulator(SimulationConfig(data_set=3, win_requirement=5, roster=["AI", "AI", "Perpendicular", "L"], max_turns=40, seed=7))
+        self.simulator.run()
+        self.players = self.simulator.list_of_players
+        self.tracker = BoardTracker(self.simulator.property_locations)
+        self.state = GameState.capture(self.tracker, self.players)
+
+    def play_on(self, turns: int) -> None:
+        """
+        Plays more turns of the game, changing the board away from the captured state.
+
+        Arguments:
+        - turns: An integer of the number of turns to play
+
+        Returns:
+        - None
+        """
+        self.simulator.config.max_turns = self.simulator.turn_count + turns
+        self.simulator.play_to_end()
+
+    def test_clone_is_copy_on_write(self):
+        clone = self.state.clone()
+        self.assertIs(clone.base, self.state.base)
+        self.assertEqual(state_values(clone), state_values(self.state))
+
+        # Changing a tile of the clone keeps its own copy of the tile and leaves the state it was cloned from alone
+        before = state_values(self.state)
+        owner, hotels, rent = clone.get_tile(0)
+        clone.set_tile(0, owner, hotels + 1, rent + 5)
+        self.assertEqual(clone.get_tile(0), (owner, hotels + 1, rent + 5))
+        self.assertEqual(list(clone.tiles), [0])
+        self.assertEqual(state_values(self.state), before)
+
+        # Setting it back to the base forgets the copy
+        clone.set_tile(0, owner, hotels, rent)
+        self.assertEqual(clone.tiles, dict())
+
+    def test_apply_brings_the_board_back(self):
+        expected_board = board_state(self.simulator.property_locations, self.players)
+        expected_plans = ai_plans(self.players)
+        clone = self.state.clone()
+
+        self.play_on(40)
+        self.assertNotEqual(board_state(self.simulator.property_locations, self.players), expected_board)
+        version = self.simulator.board_version.get_version()
+
+        clone.apply(self.tracker, self.players)
+
+        self.assertEqual(board_state(self.simulator.property_locations, self.players), expected_board)
+        self.assertEqual(ai_plans(self.players), expected_plans)
+        self.assertEqual(state_values(GameState.capture(BoardTracker(self.simulator.property_locations), self.players)), state_values(self.state))
+
+        # The observers heard about every tile put back: the board version moved on and the market index agrees with one built from scratch
+        self.assertGreater(self.simulator.board_version.get_version(), version)
+        market_index = self.simulator.market_index
+        rebuilt = MarketIndex(self.simulator.property_locations, market_index.get_colours())
+        for colour in market_index.get_colours():
+            self.assertIs(market_index.cheapest_buyable(colour), rebuilt.cheapest_buyable(colour))
+            for owned_count in range(3):
+                self.assertEqual(market_index.cost_to_complete(colour, owned_count, 5), rebuilt.cost_to_complete(colour, owned_count, 5))
+
+        # Every AIPlayer forgot the evaluations it made on the later board
+        for player, plan in zip(self.players, expected_plans):
+            if plan is not None:
+                self.assertEqual(len(player.evaluation_cache), 0)
+
+    def test_apply_matches_a_snapshot_restore(self):
+        snapshot = GameSnapshot.save(self.simulator.property_locations, self.players)
+        self.play_on(40)
+        later = GameSnapshot.save(self.simulator.property_locations, self.players)
+
+        self.state.apply(self.tracker, self.players)
+        self.assertEqual(GameSnapshot.save(self.simulator.property_locations, self.players), snapshot)
+
+        # Going the other way only looks at the tiles that differ, and still gets every one of them
+        GameSnapshot.restore(later, self.simulator.property_locations, self.players)
+        self.state.apply(self.tracker, self.players)
+        self.assertEqual(GameSnapshot.save(self.simulator.property_locations, self.players), snapshot)
+
+    def test_update_reads_only_what_changed(self):
+        self.play_on(40)
+        updated = self.state.update(self.tracker, self.players)
+
+        self.assertIs(updated.base, self.state.base)
+        self.assertIs(self.tracker.state, updated)
+        self.assertEqual(len(self.tracker.dirty), 0)
+        self.assertEqual(state_values(updated), state_values(GameState.capture(BoardTracker(self.simulator.property_locations), self.players)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+# Authors:
+# Team:
+# Date Edited:
+
+import json
+import time
+
+
+class NullPhase:
+    """
+    A do-nothing stand-in for PhaseTimer that a disabled TurnProfiler hands out, so timing a phase costs one method call and nothing else.
+
+    Behaviours:
+    - __enter__: Does nothing.
+    - __exit__: Does nothing.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        """
+        Does nothing.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Does nothing.
+
+        Arguments:
+        - exc_type, exc_value, traceback: The exception raised inside the phase, if any
+
+        Returns:
+        - none
+        """
+        pass
+
+
+# The one NullPhase every disabled profiler shares
+NULL_PHASE = NullPhase()
+
+
+class PhaseTimer:
+    """
+    A context manager that times one run of a phase with time.perf_counter_ns and hands the result back to its TurnProfiler.
+
+    Attributes:
+    - profiler: The TurnProfiler the time is recorded in
+    - name: A string of the name of the phase
+    - started: An integer of the perf_counter_ns reading when the phase started
+    """
+
+    __slots__ = ("profiler", "name", "started")
+
+    def __init__(self, profiler, name: str) -> None:
+        """
+        Constructor method for PhaseTimer class.
+
+        Arguments:
+        - profiler: The TurnProfiler the time is recorded in
+        - name: A string of the name of the phase
+
+        Returns:
+        - none
+        """
+        self.profiler = profiler
+        self.name = name
+        self.started = 0
+
+    def __enter__(self) -> None:
+        """
+        Starts the clock.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        self.started = time.perf_counter_ns()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Stops the clock and records the time, even if the phase raised.
+
+        Arguments:
+        - exc_type, exc_value, traceback: The exception raised inside the phase, if any
+
+        Returns:
+        - none
+        """
+        self.profiler.record(self.name, time.perf_counter_ns() - self.started)
+
+
+class TurnProfiler:
+    """
+    A class that records the wall time and number of calls of every phase of a turn, and exports them as a table or a JSON file at the end of a game.
+    A disabled profiler records nothing, every phase it is asked to time gets the shared NULL_PHASE.
+
+    Attributes:
+    - enabled: A boolean of whether phases are timed
+    - json_path: A string of the path finish writes the JSON file to, None to skip the file
+    - phase_totals: A dictionary whose key is the name of a phase and whose value is a list of [calls, total nanoseconds]
+
+    Behaviours:
+    - phase: Returns a context manager that times one run of a phase.
+    - record: Adds one run of a phase to the totals.
+    - summary_table: Returns the totals as a printable table.
+    - to_dict: Returns the totals as a dictionary that can be turned into JSON.
+    - export_json: Writes the totals to a JSON file.
+    - finish: Prints the table and writes the JSON file, if the profiler is enabled.
+    """
+
+    def __init__(self, enabled: bool = False, json_path: str = None) -> None:
+        """
+        Constructor method for TurnProfiler class.
+
+        Arguments:
+        - enabled: A boolean of whether phases are timed, off by default
+        - json_path: A string of the path finish writes the JSON file to, None to skip the file
+
+        Returns:
+        - none
+        """
+        self.enabled = enabled
+        self.json_path = json_path
+        self.phase_totals = dict()
+
+    def phase(self, name: str):
+        """
+        Returns a context manager that times one run of a phase.
+
+        Arguments:
+        - name: A string of the name of the phase
+
+        Returns:
+        - A PhaseTimer if the profiler is enabled, else NULL_PHASE
+        """
+        if self.enabled:
+            return PhaseTimer(self, name)
+        return NULL_PHASE
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """
+        Adds one run of a phase to the totals.
+
+        Arguments:
+        - name: A string of the name of the phase
+        - elapsed_ns: An integer of the nanoseconds the run took
+
+        Returns:
+        - none
+        """
+        totals = self.phase_totals.get(name)
+        if totals is None:
+            self.phase_totals[name] = [1, elapsed_ns]
+        else:
+            totals[0] += 1
+            totals[1] += elapsed_ns
+
+    def summary_table(self) -> str:
+        """
+        Returns the totals as a printable table, slowest phase first.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A string of the table
+        """
+        lines = ["{:<20}{:>10}{:>14}{:>14}".format("Phase", "Calls", "Total ms", "Mean us")]
+        for name, (calls, total_ns) in sorted(self.phase_totals.items(), key=lambda item: -item[1][1]):
+            lines.append("{:<20}{:>10}{:>14.3f}{:>14.3f}".format(name, calls, total_ns / 1e6, total_ns / calls / 1e3))
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the totals as a dictionary that can be turned into JSON.
+
+        Arguments:
+        - none
+
+        Returns:
+        - A dictionary whose key is the name of a phase and whose value is a dictionary of calls and total_ns
+        """
+        return {name: {"calls": calls, "total_ns": total_ns} for name, (calls, total_ns) in self.phase_totals.items()}
+
+    def export_json(self, json_path: str) -> None:
+        """
+        Writes the totals to a JSON file.
+
+        Arguments:
+        - json_path: A string of the path of the file
+
+        Returns:
+        - none
+        """
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump(self.to_dict(), json_file, indent=2)
+
+    def finish(self) -> None:
+        """
+        Prints the table and writes the JSON file when there is a json_path, if the profiler is enabled.
+
+        Arguments:
+        - none
+
+        Returns:
+        - none
+        """
+        if not self.enabled:
+            return
+        print(self.summary_table())
+        if self.json_path is not None:
+            self.export_json(self.json_path)